@@ -0,0 +1,150 @@
+"""
+Generate realistic multi-month ~/waid_logs histories for benchmarks.
+
+Titles and dwell times are drawn from sample/sample_output.txt, mixed with
+synthetic Jira, editor and browser titles so that months of history have a
+realistic number of distinct titles. Days follow a working schedule with a
+lunch break marked idle, and short A→B→A switches happen as often as in the sample.
+
+Run from the repository root to write a history into a directory:
+    python -m benchmarks.activity_generator <log_dir> [days] [events_per_day] [text|compact]
+"""
+import json
+import os
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+from services.logger.compact.compact_log import CompactLog
+from services.logger.reader.log_reader import LogReader
+from services.logger.writer.log_writer import LogWriter
+
+SAMPLE_OUTPUT = os.path.join(os.path.dirname(__file__), "..", "sample", "sample_output.txt")
+
+SYNTHETIC_TITLES = [
+    "QWDI-{n} {topic} - Jira - Google Chrome",
+    "{file}.py - waid - Visual Studio Code",
+    "{topic} | Drupal.org - Google Chrome",
+    "{topic} (Channel) - QED42 - Slack",
+    "Terminal - {file}",
+]
+TOPICS = ["Content types", "Taxonomy terms", "Theming", "Migration", "Search API", "Caching", "Views", "Media", "Release notes"]
+FILES = ["main", "logger", "config_manager", "jira_client", "sessionizer", "summarizer", "settings", "rollup"]
+
+
+class ActivityGenerator:
+    """
+    Deterministic (seeded) source of window events shaped like real WAID logs.
+
+    :param seed: Random seed; the same seed produces the same history.
+    :param synthetic_ratio: Share of switches to a synthetic rather than a sample title.
+    :param return_ratio: Share of switches back to the previous window.
+    """
+
+    def __init__(self, seed: int = 0, synthetic_ratio: float = 0.25, return_ratio: float = 0.3) -> None:
+        self.random = random.Random(seed)
+        self.synthetic_ratio = synthetic_ratio
+        self.return_ratio = return_ratio
+        self.titles, self.weights, self.dwell_times = self._load_sample()
+
+    def iter_day(self, day: datetime, events: int):
+        """
+        Yield (epoch, title, is_marker) for one working day, in time order.
+        Weekends get a tenth of the events.
+        """
+        if day.weekday() >= 5:
+            events //= 10
+        if not events:
+            return
+
+        moment = day.replace(hour=9, minute=0, second=0) + timedelta(minutes=self.random.randint(-30, 30))
+        lunch = day.replace(hour=13, minute=0, second=0) + timedelta(minutes=self.random.randint(-20, 20))
+        # Scale the sampled dwell times so the day's events span roughly eight hours.
+        scale = 8 * 3600 / (events * (sum(self.dwell_times) / len(self.dwell_times)))
+
+        yield moment.timestamp(), "start", True
+        previous = current = None
+        for _ in range(events):
+            if lunch and moment >= lunch:
+                yield moment.timestamp(), "idle", True
+                moment += timedelta(minutes=self.random.randint(30, 60))
+                yield moment.timestamp(), "active", True
+                lunch = None
+                current = None
+
+            if previous and self.random.random() < self.return_ratio:
+                title = previous
+            elif self.random.random() < self.synthetic_ratio:
+                title = self._synthetic_title()
+            else:
+                title = self.random.choices(self.titles, self.weights)[0]
+            if title == current:
+                title = self.random.choices(self.titles, self.weights)[0]
+
+            yield moment.timestamp(), title, False
+            previous, current = current, title
+            moment += timedelta(seconds=max(1, int(self.random.choice(self.dwell_times) * scale * self.random.uniform(0.5, 1.5))))
+        yield moment.timestamp(), "stop", True
+
+    def write_history(self, log_dir: str, first_day: datetime, days: int, events_per_day: int, compact: bool = False) -> dict:
+        """
+        Write `days` daily log files starting at `first_day` into `log_dir`.
+        :return: Counts of files, events and bytes written.
+        """
+        files = events = 0
+        for offset in range(days):
+            day = first_day + timedelta(days=offset)
+            records = list(self.iter_day(day, events_per_day))
+            if not records:
+                continue
+            files += 1
+            events += len(records)
+            if compact:
+                path = os.path.join(log_dir, f"{day:%Y-%m-%d}{CompactLog.EXTENSION}")
+                for epoch, value, is_marker in records:
+                    CompactLog.append(path, value, int(epoch), marker=is_marker)
+            else:
+                with open(os.path.join(log_dir, f"{day:%Y-%m-%d}.log"), "w", encoding="utf-8") as f:
+                    for epoch, value, is_marker in records:
+                        stamp = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(epoch))
+                        payload = {"timestamp": stamp, "event" if is_marker else "window_title": value}
+                        f.write(f"{stamp} - {json.dumps(payload)}\n")
+        LogWriter.flush(sync=True)
+        size = sum(entry.stat().st_size for entry in os.scandir(log_dir) if entry.is_file())
+        return {"files": files, "events": events, "bytes": size}
+
+    def _synthetic_title(self) -> str:
+        template = self.random.choice(SYNTHETIC_TITLES)
+        return template.format(n=self.random.randint(1, 400), topic=self.random.choice(TOPICS), file=self.random.choice(FILES))
+
+    @staticmethod
+    def _load_sample() -> tuple:
+        """Title frequencies and dwell times (seconds until the next event) from the sample log."""
+        with open(SAMPLE_OUTPUT, "rb") as f:
+            events = [event for event in map(LogReader.parse_line, f) if event and event.window_title]
+
+        counts = {}
+        for event in events:
+            counts[event.window_title] = counts.get(event.window_title, 0) + 1
+        dwell_times = [
+            (after.timestamp - before.timestamp).total_seconds()
+            for before, after in zip(events, events[1:])
+        ]
+        dwell_times = [seconds for seconds in dwell_times if 0 < seconds < 3600] or [30.0]
+        return list(counts), list(counts.values()), dwell_times
+
+
+def main() -> None:
+    log_dir = sys.argv[1]
+    days = int(sys.argv[2]) if len(sys.argv) > 2 else 90
+    events = int(sys.argv[3]) if len(sys.argv) > 3 else 1500
+    compact = len(sys.argv) > 4 and sys.argv[4] == "compact"
+
+    os.makedirs(log_dir, exist_ok=True)
+    start = time.perf_counter()
+    stats = ActivityGenerator().write_history(log_dir, datetime(2025, 1, 1), days, events, compact)
+    print(f"{stats['events']:,} events in {stats['files']} files, {stats['bytes']:,} bytes, {time.perf_counter() - start:.2f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""
+Benchmark AIManager's blocking, batched and streaming paths offline with FakeAI.
+
+Run from the repository root:
+    python -m benchmarks.ai_batch_bench [prompts] [concurrency]
+"""
+import os
+import sys
+import tempfile
+import time
+from services.ai.ai_manager import AIManager
+from services.ai.cache.response_cache import ResponseCache
+from services.ai.fake.fake_ai import FakeAI
+from services.config.config_manager import ConfigManager
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 32
+    concurrency = int(sys.argv[2]) if len(sys.argv) > 2 else 8
+    prompts = [f"Summarize block {i}: editing waid.service in Visual Studio Code" for i in range(count)]
+
+    with tempfile.TemporaryDirectory() as state_dir:
+        ConfigManager.CONFIG_PATH = os.path.join(state_dir, "config.json")
+        ResponseCache.CACHE_DIR = os.path.join(state_dir, "ai_cache")
+        AIManager.register_provider("fake", FakeAI())
+        AIManager.set_provider("fake")
+
+        start = time.perf_counter()
+        for prompt in prompts:
+            AIManager.send_prompt(prompt, use_cache=False)
+        sequential = time.perf_counter() - start
+        print(f"sequential send_prompt: {count} prompts in {sequential:.2f} s ({count / sequential:.1f}/s)")
+
+        start = time.perf_counter()
+        responses = AIManager.send_batch(prompts, concurrency=concurrency)
+        batched = time.perf_counter() - start
+        assert [r.split()[-1] for r in responses] == [p.split()[-1] for p in prompts]
+        print(f"send_batch x{concurrency}:{' ' * (11 - len(str(concurrency)))}{count} prompts in {batched:.2f} s ({count / batched:.1f}/s)")
+
+        start = time.perf_counter()
+        AIManager.send_batch(prompts, concurrency=concurrency)
+        print(f"send_batch, cached:     {count} prompts in {time.perf_counter() - start:.3f} s")
+
+        start = time.perf_counter()
+        first_chunk = None
+        for chunk in AIManager.stream_prompt("Stream this response please", use_cache=False):
+            if first_chunk is None:
+                first_chunk = time.perf_counter() - start
+        total = time.perf_counter() - start
+        print(f"stream_prompt:          first chunk after {first_chunk * 1000:.0f} ms, complete after {total * 1000:.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
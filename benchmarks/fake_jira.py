@@ -0,0 +1,206 @@
+"""
+A local stand-in for the Jira REST API, serving issues shaped like sample/sample_ticket.json.
+"""
+import copy
+import json
+import os
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+SAMPLE_TICKET = os.path.join(os.path.dirname(__file__), "..", "sample", "sample_ticket.json")
+
+
+class FakeJira:
+    """
+    In-process Jira server for offline benchmarks.
+
+    :param issue_count: Number of issues assigned to the current user.
+    :param latency: Seconds added to every response.
+    :param rate_limit_every: Answer every n-th request with 429 (0 disables).
+    """
+
+    def __init__(self, issue_count: int = 250, latency: float = 0.0, rate_limit_every: int = 0) -> None:
+        with open(SAMPLE_TICKET, encoding="utf-8") as f:
+            template = json.load(f)
+
+        self.issues = []
+        for i in range(issue_count):
+            issue = copy.deepcopy(template)
+            issue["id"] = str(20000 + i)
+            issue["key"] = f"QWDI-{100 + i}"
+            issue["fields"]["summary"] = f"{template['fields']['summary']} #{i}"
+            self.issues.append(issue)
+
+        self.worklogs = {}
+        self._last_worklog_id = 0
+        # The account requests are made as; worklogs record it as their author.
+        self.account_id = "fake-account"
+        self.latency = latency
+        self.rate_limit_every = rate_limit_every
+        self.requests = 0
+        self.connections = 0
+        self.rate_limited = 0
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self._thread = None
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self._server.server_address[1]}"
+
+    def start(self) -> "FakeJira":
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "FakeJira":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    def _handler(self):
+        jira = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def setup(self):
+                super().setup()
+                with jira._lock:
+                    jira.connections += 1
+
+            def log_message(self, format, *args):
+                pass
+
+            def do_GET(self):
+                self._dispatch("GET")
+
+            def do_POST(self):
+                self._dispatch("POST")
+
+            def do_PUT(self):
+                self._dispatch("PUT")
+
+            def do_DELETE(self):
+                self._dispatch("DELETE")
+
+            def _dispatch(self, method):
+                with jira._lock:
+                    jira.requests += 1
+                    limited = jira.rate_limit_every and jira.requests % jira.rate_limit_every == 0
+                    if limited:
+                        jira.rate_limited += 1
+                if jira.latency:
+                    time.sleep(jira.latency)
+
+                length = int(self.headers.get("Content-Length") or 0)
+                body = json.loads(self.rfile.read(length)) if length else None
+                if limited:
+                    return self._send(429, {"errorMessages": ["Rate limit exceeded"]}, {"Retry-After": "0"})
+
+                url = urlparse(self.path)
+                query = {k: v[0] for k, v in parse_qs(url.query).items()}
+                status, payload = jira.route(method, url.path, query, body)
+                self._send(status, payload)
+
+            def _send(self, status, payload, headers=None):
+                data = json.dumps(payload).encode("utf-8") if payload is not None else b""
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(data)
+
+        return Handler
+
+    def route(self, method: str, path: str, query: dict, body: dict | None) -> tuple:
+        """Answer the subset of the Jira API that WAID uses."""
+        if method == "GET" and path in ("/rest/api/3/search", "/rest/api/3/search/jql"):
+            issues = self.search(query.get("jql", ""))
+            start_at = int(query.get("startAt", 0))
+            max_results = int(query.get("maxResults", 50))
+            fields = query.get("fields")
+            page = [self._select_fields(i, fields) for i in issues[start_at:start_at + max_results]]
+            return 200, {"startAt": start_at, "maxResults": max_results, "total": len(issues), "issues": page}
+
+        if method == "GET" and path == "/rest/api/3/myself":
+            return 200, {"accountId": self.account_id, "displayName": "Fake User", "timeZone": "Asia/Kolkata"}
+
+        match = re.fullmatch(r"/rest/api/3/issue/([^/]+)(/worklog(?:/(\d+))?)?", path)
+        if not match:
+            return 404, {"errorMessages": [f"No route for {method} {path}"]}
+        key, worklog_path, worklog_id = match.groups()
+        issue = next((i for i in self.issues if i["key"] == key), None)
+        if issue is None:
+            return 404, {"errorMessages": ["Issue does not exist"]}
+
+        if not worklog_path and method == "GET":
+            return 200, self._select_fields(issue, query.get("fields"))
+        if worklog_path:
+            return self._route_worklog(method, issue, worklog_id, query, body)
+        return 405, {"errorMessages": ["Method not allowed"]}
+
+    def search(self, jql: str) -> list:
+        """Evaluate just enough JQL for the clients under test."""
+        issues = self.issues
+        match = re.search(r'updated >= "([^"]+)"', jql)
+        if match:
+            since = match.group(1).replace("/", "-")
+            issues = [i for i in issues if i["fields"].get("updated", "")[:16].replace("T", " ") >= since]
+        return issues
+
+    def _route_worklog(self, method: str, issue: dict, worklog_id: str | None, query: dict, body: dict | None) -> tuple:
+        with self._lock:
+            worklogs = self.worklogs.setdefault(issue["key"], [])
+            if method == "GET":
+                start_at = int(query.get("startAt", 0))
+                max_results = int(query.get("maxResults", 5000))
+                page = worklogs[start_at:start_at + max_results]
+                return 200, {"startAt": start_at, "maxResults": max_results, "total": len(worklogs), "worklogs": page}
+            if method == "POST":
+                self._last_worklog_id += 1
+                worklog = {
+                    **body, "id": str(self._last_worklog_id), "issueId": issue["id"],
+                    "author": {"accountId": self.account_id},
+                }
+                self._round_time_spent(worklog)
+                worklogs.append(worklog)
+                return 201, worklog
+            if method == "PUT":
+                worklog = next((w for w in worklogs if w["id"] == worklog_id), None)
+                if worklog is None:
+                    return 404, {"errorMessages": ["Worklog does not exist"]}
+                worklog.update(body)
+                self._round_time_spent(worklog)
+                return 200, worklog
+            if method == "DELETE":
+                worklog = next((w for w in worklogs if w["id"] == worklog_id), None)
+                if worklog is None:
+                    return 404, {"errorMessages": ["Worklog does not exist"]}
+                worklogs.remove(worklog)
+                return 204, None
+        return 405, {"errorMessages": ["Method not allowed"]}
+
+    @staticmethod
+    def _round_time_spent(worklog: dict) -> None:
+        """Jira keeps worklog durations in whole minutes."""
+        if "timeSpentSeconds" in worklog:
+            worklog["timeSpentSeconds"] = worklog["timeSpentSeconds"] // 60 * 60
+
+    @staticmethod
+    def _select_fields(issue: dict, fields: str | None) -> dict:
+        if not fields:
+            return issue
+        wanted = set(fields.split(","))
+        return {**issue, "fields": {k: v for k, v in issue["fields"].items() if k in wanted}}
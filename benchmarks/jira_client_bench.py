@@ -0,0 +1,123 @@
+"""
+Exercise JiraClient against the local fake Jira server: full pagination, field
+selection, 429 handling, connection reuse and bounded parallel requests.
+
+Run from the repository root:
+    python -m benchmarks.jira_client_bench [--check]
+
+With --check, only the correctness checks of JiraClient and WorklogSync run
+(fast, no latency); a failing check exits with an AssertionError.
+"""
+import sys
+import time
+from datetime import datetime
+import requests
+from benchmarks.fake_jira import FakeJira
+from services.jira.jira_client import JiraClient
+from services.jira.worklog_sync import WorklogEntry, WorklogSync
+
+ISSUES = 250
+LATENCY = 0.005
+FIELDS = ["summary", "status", "parent", "labels", "updated"]
+
+
+def bare_requests(jira: FakeJira) -> tuple:
+    """The previous approach: one unpooled request per page, default fields."""
+    start, issues, start_at = time.perf_counter(), [], 0
+    while True:
+        response = requests.get(f"{jira.base_url}/rest/api/3/search", params={"jql": "", "startAt": start_at})
+        page = response.json()
+        issues += page["issues"]
+        start_at += len(page["issues"])
+        if start_at >= page["total"]:
+            break
+    return issues, time.perf_counter() - start, len(response.content)
+
+
+def check() -> None:
+    """Assert JiraClient's behaviour against the fake server."""
+    with FakeJira(ISSUES, rate_limit_every=7) as jira:
+        client = JiraClient(jira.base_url, {}, max_concurrency=4)
+        try:
+            issues = list(client.search("assignee = currentUser()", fields=FIELDS, page_size=40))
+            assert len(issues) == ISSUES, f"pagination returned {len(issues)} of {ISSUES} issues"
+            assert len({issue["key"] for issue in issues}) == ISSUES, "pagination returned duplicates"
+            assert all(set(issue["fields"]) <= set(FIELDS) for issue in issues), "field selection ignored"
+            assert jira.rate_limited > 0, "no 429 was exercised"
+
+            keys = [issue["key"] for issue in issues]
+            fetched = client.map(lambda key: client.get(f"/rest/api/3/issue/{key}", params={"fields": "summary"}), keys)
+            assert [issue["key"] for issue in fetched] == keys, "map did not keep input order"
+            assert jira.connections <= client.max_concurrency, f"{jira.connections} connections opened, pool is {client.max_concurrency}"
+        finally:
+            client.close()
+    print(f"JiraClient checks passed: {jira.requests} requests, {jira.rate_limited} x 429 retried, {jira.connections} connections")
+    check_worklog_sync()
+
+
+def check_worklog_sync() -> None:
+    """Assert that WorklogSync is idempotent with minute-rounded durations and leaves other users' worklogs alone."""
+    day = datetime(2025, 1, 6)
+    entries = [
+        WorklogEntry("QWDI-100", day.replace(hour=9, second=5), 630),
+        WorklogEntry("QWDI-100", day.replace(hour=9, second=40), 95),
+        WorklogEntry("QWDI-101", day.replace(hour=11), 1799),
+    ]
+    with FakeJira(issue_count=3) as jira:
+        client = JiraClient(jira.base_url, {})
+        try:
+            result = WorklogSync.sync(entries, client)
+            assert len(result.created) == 3 and not result.failed, result
+            result = WorklogSync.sync(entries, client)
+            assert len(result.unchanged) == 3 and not result.updated, f"rounded durations were written again: {result}"
+
+            # Another WAID user logs the same minutes on the shared issue.
+            jira.account_id = "other-account"
+            result = WorklogSync.sync(entries[:1], client)
+            assert len(result.created) == 1 and not result.updated, f"another user's worklog was claimed: {result}"
+
+            jira.account_id = "fake-account"
+            result = WorklogSync.sync([], client, start=day, end=day.replace(hour=23))
+            assert len(result.deleted) == 3, f"expected our 3 worklogs deleted: {result}"
+            authors = [worklog["author"]["accountId"] for worklogs in jira.worklogs.values() for worklog in worklogs]
+            assert authors == ["other-account"], f"remaining worklogs belong to {authors}"
+        finally:
+            client.close()
+    print("WorklogSync checks passed")
+
+
+def main() -> None:
+    if "--check" in sys.argv[1:]:
+        check()
+        return
+
+    with FakeJira(ISSUES, latency=LATENCY, rate_limit_every=7) as jira:
+        issues, elapsed, page_bytes = bare_requests(jira)
+        print(f"bare requests:  {len(issues)} issues in {elapsed * 1000:.0f} ms, {jira.connections} connections, last page {page_bytes:,} bytes")
+
+    with FakeJira(ISSUES, latency=LATENCY, rate_limit_every=7) as jira:
+        client = JiraClient(jira.base_url, {}, max_concurrency=8)
+        start = time.perf_counter()
+        issues = list(client.search("assignee = currentUser()", fields=FIELDS))
+        elapsed = time.perf_counter() - start
+        client.close()
+        assert len(issues) == ISSUES, len(issues)
+        assert set(issues[0]["fields"]) <= set(FIELDS)
+        print(f"JiraClient:     {len(issues)} issues in {elapsed * 1000:.0f} ms, {jira.connections} connections")
+
+        keys = [issue["key"] for issue in issues]
+        for concurrency in (1, 8):
+            # A fresh client per setting, so each run gets its own pool of that size.
+            client = JiraClient(jira.base_url, {}, max_concurrency=concurrency)
+            try:
+                start = time.perf_counter()
+                fetched = client.map(lambda key: client.get(f"/rest/api/3/issue/{key}", params={"fields": "summary"}), keys)
+                assert [i["key"] for i in fetched] == keys
+                print(f"get x{len(keys)} at concurrency {concurrency}: {(time.perf_counter() - start) * 1000:.0f} ms")
+            finally:
+                client.close()
+        print(f"{jira.requests} requests over {jira.connections} connections, {jira.rate_limited} x 429 retried")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Measure Logger.log throughput with the buffered LogWriter against the previous
+open-append-close implementation, and check that SIGTERM loses no lines.
+
+Run from the repository root:
+    python -m benchmarks.log_writer_bench [lines]
+"""
+import os
+import signal
+import subprocess
+import sys
+import tempfile
+import time
+from services.logger.logger import Logger
+from services.logger.writer.log_writer import LogWriter
+
+MESSAGE = '{"timestamp": "2025-02-17 13:22:49", "window_title": "Chrome Tab Detection - Google Chrome"}'
+
+SIGTERM_CHILD = """
+import sys, time
+from services.logger.logger import Logger
+from services.signal.signal_handler import SignalHandler
+Logger.LOG_DIR = sys.argv[1]
+SignalHandler.register_signals()
+for i in range(int(sys.argv[2])):
+    Logger.log(f"line {i}")
+print("ready", flush=True)
+time.sleep(60)
+"""
+
+
+def legacy_log(message: str) -> None:
+    """The original Logger.log: one open/write/close per line."""
+    with open(Logger.get_log_filepath(), "a") as f:
+        f.write(f"{time.strftime('%Y-%m-%d %H:%M:%S')} - {message}\n")
+
+
+def throughput(log, lines: int) -> float:
+    """Lines per second until every line is on disk."""
+    start = time.perf_counter()
+    for _ in range(lines):
+        log(MESSAGE)
+    LogWriter.flush()
+    return lines / (time.perf_counter() - start)
+
+
+def check_sigterm(lines: int) -> int:
+    """Log `lines` lines in a child, SIGTERM it and count what reached the file."""
+    with tempfile.TemporaryDirectory() as log_dir:
+        child = subprocess.Popen(
+            [sys.executable, "-c", SIGTERM_CHILD, log_dir, str(lines)],
+            stdout=subprocess.PIPE, text=True
+        )
+        child.stdout.readline()
+        child.send_signal(signal.SIGTERM)
+        child.wait()
+        return sum(
+            sum(1 for _ in open(os.path.join(log_dir, name)))
+            for name in os.listdir(log_dir)
+        )
+
+
+def main() -> None:
+    lines = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+
+    with tempfile.TemporaryDirectory() as log_dir:
+        Logger.LOG_DIR = log_dir
+        before = throughput(legacy_log, lines)
+        after = throughput(Logger.log, lines)
+        LogWriter.close()
+
+    print(f"open-append-close: {before:,.0f} lines/sec")
+    print(f"LogWriter:         {after:,.0f} lines/sec ({after / before:.1f}x)")
+
+    written = check_sigterm(10_000)
+    print(f"SIGTERM: {written}/10000 lines on disk")
+
+
+if __name__ == "__main__":
+    main()
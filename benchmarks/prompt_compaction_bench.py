@@ -0,0 +1,56 @@
+"""
+Report how much PromptCompactor shrinks the activity in sample/sample_output.txt
+compared with pasting the raw log lines into a prompt.
+
+Run from the repository root:
+    python -m benchmarks.prompt_compaction_bench [usd_per_million_input_tokens] [prefill_tokens_per_second]
+
+Cost and latency are estimates from the given price and prefill rate.
+"""
+import os
+import sys
+import tempfile
+import time
+from services.logger.logger import Logger
+from services.logger.reader.log_reader import LogReader
+from services.sessionizer.sessionizer import Sessionizer
+from services.summarizer.prompt_compactor import PromptCompactor
+
+SAMPLE = os.path.join(os.path.dirname(__file__), "..", "sample", "sample_output.txt")
+
+
+def main() -> None:
+    price = float(sys.argv[1]) if len(sys.argv) > 1 else 0.075
+    prefill_rate = float(sys.argv[2]) if len(sys.argv) > 2 else 2000.0
+
+    with open(SAMPLE, "rb") as f:
+        raw_lines = [line for line in f if LogReader.parse_line(line) is not None]
+    raw = b"".join(raw_lines).decode("utf-8")
+
+    with tempfile.TemporaryDirectory() as log_dir:
+        Logger.LOG_DIR = log_dir
+        day = raw_lines[0][:10].decode("ascii")
+        with open(os.path.join(log_dir, f"{day}.log"), "wb") as f:
+            f.writelines(raw_lines)
+
+        start = time.perf_counter()
+        intervals = Sessionizer.get_intervals()
+        compact = PromptCompactor.compact(intervals)
+        elapsed = time.perf_counter() - start
+
+    raw_tokens = PromptCompactor.estimate_tokens(raw)
+    compact_tokens = PromptCompactor.estimate_tokens(compact)
+    budget_tokens = PromptCompactor.estimate_tokens(PromptCompactor.compact(intervals, token_budget=150))
+
+    print(compact)
+    print()
+    print(f"raw log lines:   {len(raw_lines)} lines, {len(raw):,} chars, ~{raw_tokens:,} tokens")
+    print(f"compacted:       {len(compact.splitlines())} lines, {len(compact):,} chars, ~{compact_tokens:,} tokens "
+          f"({raw_tokens / compact_tokens:.1f}x smaller, built in {elapsed * 1000:.1f} ms)")
+    print(f"with budget 150: ~{budget_tokens} tokens")
+    print(f"input cost per 1000 summaries at ${price}/1M tokens: ${raw_tokens * price / 1000:.4f} -> ${compact_tokens * price / 1000:.4f}")
+    print(f"prefill latency at {prefill_rate:.0f} tokens/s: {raw_tokens / prefill_rate * 1000:.0f} ms -> {compact_tokens / prefill_rate * 1000:.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
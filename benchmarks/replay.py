@@ -0,0 +1,182 @@
+"""
+Feed generated window events through WAID's logging path at an accelerated rate.
+
+Run from the repository root:
+    python -m benchmarks.replay [events] [speedup] [logger|window_logger|window_logger_metadata]
+"""
+import json
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime
+from benchmarks.activity_generator import ActivityGenerator
+from services.logger.logger import Logger
+from services.logger.writer.log_writer import LogWriter
+
+
+class FakeDisplay:
+    """
+    Just enough of an Xlib display for WindowMetadataCache, counting the requests
+    that would be X round trips. Every window belongs to one of a few applications.
+    """
+
+    APPS = ["google-chrome", "code", "slack", "gnome-terminal", "firefox"]
+
+    def __init__(self) -> None:
+        self.round_trips = 0
+        self.mask_changes = 0
+
+    def intern_atom(self, name: str) -> int:
+        return 1
+
+    def create_resource_object(self, kind: str, window_id: int) -> "FakeDisplay.Window":
+        return FakeDisplay.Window(self, window_id)
+
+    def flush(self) -> None:
+        pass
+
+    class Window:
+        def __init__(self, display: "FakeDisplay", window_id: int) -> None:
+            self.display = display
+            self.id = window_id
+
+        def get_wm_class(self) -> tuple:
+            self.display.round_trips += 1
+            app = FakeDisplay.APPS[self.id % len(FakeDisplay.APPS)]
+            return app, app
+
+        def get_full_property(self, atom: int, property_type: int):
+            self.display.round_trips += 1
+            return None
+
+        def change_attributes(self, onerror=None, **keys) -> None:
+            self.display.mask_changes += 1
+
+
+class ReplayDriver:
+    """
+    Replays (epoch, title, is_marker) events, preserving their relative timing
+    divided by `speedup` (0 replays as fast as possible).
+    """
+
+    def __init__(self, events: list, speedup: float = 0) -> None:
+        self.events = events
+        self.speedup = speedup
+
+    def replay_logger(self) -> dict:
+        """Write each event as a text log line through Logger.log."""
+        def emit(title: str, is_marker: bool) -> None:
+            payload = {"timestamp": time.strftime("%Y-%m-%d %H:%M:%S"), "event" if is_marker else "window_title": title}
+            Logger.log(json.dumps(payload))
+        return self._replay(emit)
+
+    def replay_window_logger(self, with_metadata: bool = False) -> dict:
+        """
+        Drive WindowLogger.log_window_change and log_marker as the X event loop would,
+        with the focused window title supplied by the replay instead of the X server.
+
+        :param with_metadata: Run as in native mode, so every change also looks up the
+            focused window's metadata through WindowMetadataCache, over a FakeDisplay
+            where each distinct title is its own window. The result then includes the
+            X round trips made and the cache's hit rate.
+        """
+        from services.logger.window.window_logger import WindowLogger
+        from services.logger.window.window_metadata import WindowMetadataCache
+
+        # Skip __init__, which connects to the X server; only the logging state is needed.
+        window_logger = WindowLogger.__new__(WindowLogger)
+        window_logger.active_window_title = None
+        window_logger.last_event_time = 0.0
+        window_logger.event_thread = None
+        window_logger.active_window_id = None
+        current = [None]
+        window_logger.get_active_window_title = lambda: current[0]
+
+        display = window_ids = None
+        if with_metadata:
+            display = FakeDisplay()
+            window_logger.metadata = WindowMetadataCache(display)
+            # Any thread will do: get_active_window_metadata only checks that the event loop "runs".
+            window_logger.event_thread = threading.current_thread()
+            window_ids = {}
+
+        def emit(title: str, is_marker: bool) -> None:
+            if is_marker:
+                window_logger.log_marker(title)
+                return
+            current[0] = title
+            if with_metadata:
+                window_logger.active_window_id = window_ids.setdefault(title, len(window_ids) + 1)
+            window_logger.log_window_change()
+
+        result = self._replay(emit)
+        if with_metadata:
+            lookups = display.round_trips // 2
+            titles = [title for _, title, is_marker in self.events if not is_marker]
+            # log_window_change only looks metadata up when the title changes.
+            changes = sum(1 for previous, title in zip([None] + titles, titles) if title != previous)
+            result.update({
+                "windows": len(window_ids),
+                "metadata_lookups": lookups,
+                "x_round_trips": display.round_trips,
+                "metadata_hit_rate": 1 - lookups / changes if changes else 0.0,
+                "mask_releases": display.mask_changes,
+            })
+        return result
+
+    def _replay(self, emit) -> dict:
+        first_epoch = self.events[0][0] if self.events else 0
+        lag = 0.0
+        start = time.perf_counter()
+        for epoch, title, is_marker in self.events:
+            if self.speedup:
+                due = start + (epoch - first_epoch) / self.speedup
+                delay = due - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+                else:
+                    lag = max(lag, -delay)
+            emit(title, is_marker)
+        emitted = time.perf_counter() - start
+        LogWriter.flush(sync=True)
+        elapsed = time.perf_counter() - start
+        return {
+            "events": len(self.events),
+            "emit_seconds": emitted,
+            "seconds": elapsed,
+            "events_per_second": len(self.events) / elapsed if elapsed else 0.0,
+            "max_lag_ms": lag * 1000,
+        }
+
+
+def generate_events(count: int, seed: int = 0) -> list:
+    """At least `count` generated events from consecutive working days."""
+    generator = ActivityGenerator(seed)
+    events = []
+    day = datetime(2025, 1, 6)
+    while len(events) < count:
+        events.extend(generator.iter_day(day, 1500))
+        day = day.replace(day=day.day % 28 + 1)
+    return events[:count]
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    speedup = float(sys.argv[2]) if len(sys.argv) > 2 else 0
+    target = sys.argv[3] if len(sys.argv) > 3 else "logger"
+
+    with tempfile.TemporaryDirectory() as log_dir:
+        Logger.LOG_DIR = log_dir
+        driver = ReplayDriver(generate_events(count), speedup)
+        if target == "window_logger_metadata":
+            result = driver.replay_window_logger(with_metadata=True)
+        elif target == "window_logger":
+            result = driver.replay_window_logger()
+        else:
+            result = driver.replay_logger()
+    print(json.dumps(result, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,243 @@
+"""
+Run WAID's hot-path benchmarks offline and emit machine-readable results.
+
+Every suite runs against temporary state: a generated multi-month log history,
+a temporary config file and response cache, the local FakeJira server and the
+FakeAI provider. Results are written as JSON so runs can be compared.
+
+Run from the repository root:
+    python -m benchmarks.run [--suites logging,read,config,jira,ai] [--quick]
+                             [--output results.json] [--compare baseline.json]
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from benchmarks.activity_generator import ActivityGenerator
+from benchmarks.fake_jira import FakeJira
+from benchmarks.replay import ReplayDriver, generate_events
+from services.ai.ai_manager import AIManager
+from services.ai.cache.response_cache import ResponseCache
+from services.ai.fake.fake_ai import FakeAI
+from services.config.config_manager import ConfigManager
+from services.jira.jira_client import JiraClient
+from services.logger.logger import Logger
+from services.logger.reader.log_reader import LogReader
+from services.rollup.rollup import Rollup
+from services.sessionizer.sessionizer import Sessionizer
+
+SUITES = ("logging", "read", "config", "jira", "ai")
+# Metrics where a larger value is better; everything else is a duration or a size.
+HIGHER_IS_BETTER = ("per_second", "hit_rate")
+
+
+def latency_stats(samples: list) -> dict:
+    """Summarize durations in seconds as milliseconds."""
+    samples = sorted(samples)
+    return {
+        "p50_ms": statistics.median(samples) * 1000,
+        "p95_ms": samples[min(len(samples) - 1, int(len(samples) * 0.95))] * 1000,
+        "max_ms": samples[-1] * 1000,
+    }
+
+
+def timed(fn, repeat: int) -> list:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def bench_logging(size: dict) -> dict:
+    events = generate_events(size["replay_events"])
+    return {
+        "logger": ReplayDriver(events).replay_logger(),
+        "window_logger": ReplayDriver(events).replay_window_logger(),
+        "window_logger_metadata": ReplayDriver(events).replay_window_logger(with_metadata=True),
+    }
+
+
+def bench_read(size: dict) -> dict:
+    results = {}
+    for fmt in ("text", "compact"):
+        with tempfile.TemporaryDirectory() as log_dir:
+            Logger.LOG_DIR = log_dir
+            Sessionizer.clear()
+            start = time.perf_counter()
+            history = ActivityGenerator().write_history(log_dir, datetime(2025, 1, 1), size["days"], size["events_per_day"], compact=fmt == "compact")
+            generate_seconds = time.perf_counter() - start
+
+            start = time.perf_counter()
+            parsed = sum(1 for _ in LogReader.iter_events())
+            parse_seconds = time.perf_counter() - start
+
+            middle = datetime(2025, 1, 1 + size["days"] // 2 % 28, 14)
+            seek_samples = timed(lambda: next(LogReader.iter_events(middle), None), 20)
+
+            start = time.perf_counter()
+            intervals = sum(len(day.table) for day in Sessionizer.iter_days())
+            sessionize_seconds = time.perf_counter() - start
+
+            start = time.perf_counter()
+            Rollup.get_totals()
+            rollup_cold_seconds = time.perf_counter() - start
+            start = time.perf_counter()
+            Rollup.get_totals()
+            rollup_warm_seconds = time.perf_counter() - start
+
+        results[fmt] = {
+            **history,
+            "generate_seconds": generate_seconds,
+            "parse_seconds": parse_seconds,
+            "parse_events_per_second": parsed / parse_seconds,
+            "seek": latency_stats(seek_samples),
+            "intervals": intervals,
+            "sessionize_seconds": sessionize_seconds,
+            "rollup_cold_seconds": rollup_cold_seconds,
+            "rollup_warm_seconds": rollup_warm_seconds,
+        }
+    return results
+
+
+def bench_config(size: dict) -> dict:
+    calls = size["config_calls"]
+    ConfigManager.set_many({"active_loggers": ["window_logger"], "window_logger_mode": "native"})
+    ConfigManager.flush()
+
+    get_seconds = sum(timed(lambda: ConfigManager.get("window_logger_mode"), calls))
+    set_seconds = sum(timed(lambda: ConfigManager.set("bench_counter", time.time()), calls))
+    flush_samples = timed(lambda: (ConfigManager.set("bench_counter", time.time()), ConfigManager.flush()), max(10, calls // 100))
+    return {
+        "get_us": get_seconds / calls * 1e6,
+        "set_us": set_seconds / calls * 1e6,
+        "flush": latency_stats(flush_samples),
+    }
+
+
+def bench_jira(size: dict) -> dict:
+    with FakeJira(size["issues"], latency=0.005, rate_limit_every=25) as jira:
+        client = JiraClient(jira.base_url, {}, max_concurrency=8)
+        get_samples = timed(lambda: client.get("/rest/api/3/issue/QWDI-100", params={"fields": "summary,status"}), 50)
+        search_samples = timed(lambda: list(client.search("assignee = currentUser()", fields=["summary", "status", "parent", "labels", "updated"])), 5)
+        keys = [issue["key"] for issue in jira.issues]
+        start = time.perf_counter()
+        client.map(lambda key: client.get(f"/rest/api/3/issue/{key}", params={"fields": "summary"}), keys)
+        parallel_seconds = time.perf_counter() - start
+        client.close()
+        return {
+            "get": latency_stats(get_samples),
+            "search": latency_stats(search_samples),
+            "parallel_gets_per_second": len(keys) / parallel_seconds,
+            "requests": jira.requests,
+            "connections": jira.connections,
+            "rate_limited": jira.rate_limited,
+        }
+
+
+def bench_ai(size: dict) -> dict:
+    FakeAI.set_configuration({"latency": 0.02, "token_latency": 0.0005})
+    AIManager.register_provider("fake", FakeAI())
+    AIManager.set_provider("fake")
+    prompts = [f"Summarize block {i}: QWDI-{i} Taxonomy terms in Google Chrome" for i in range(size["prompts"])]
+
+    uncached = timed(lambda: AIManager.send_prompt(prompts[0], use_cache=False), 10)
+    AIManager.send_prompt(prompts[0])
+    cached = timed(lambda: AIManager.send_prompt(prompts[0]), 100)
+    start = time.perf_counter()
+    AIManager.send_batch(prompts, concurrency=8)
+    batch_seconds = time.perf_counter() - start
+    return {
+        "send_prompt": latency_stats(uncached),
+        "send_prompt_cached": latency_stats(cached),
+        "batch_prompts_per_second": len(prompts) / batch_seconds,
+        "cache_hit_rate": AIManager.get_cache_metrics()["hit_rate"],
+    }
+
+
+BENCHMARKS = {"logging": bench_logging, "read": bench_read, "config": bench_config, "jira": bench_jira, "ai": bench_ai}
+
+
+def flatten(results: dict, prefix: str = "") -> dict:
+    flat = {}
+    for key, value in results.items():
+        if isinstance(value, dict):
+            flat.update(flatten(value, f"{prefix}{key}."))
+        elif isinstance(value, (int, float)):
+            flat[f"{prefix}{key}"] = value
+    return flat
+
+
+def compare(results: dict, baseline: dict) -> None:
+    """Print each metric next to the baseline, marking regressions above 10%."""
+    current, previous = flatten(results["results"]), flatten(baseline["results"])
+    for name in sorted(current.keys() & previous.keys()):
+        old, new = previous[name], current[name]
+        if not old:
+            continue
+        ratio = new / old
+        worse = ratio < 0.9 if name.endswith(HIGHER_IS_BETTER) else ratio > 1.1
+        print(f"{'!' if worse else ' '} {name:55} {old:14.3f} -> {new:14.3f} ({ratio:5.2f}x)")
+
+
+def git_revision() -> str:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--suites", default=",".join(SUITES), help="comma-separated suites to run")
+    parser.add_argument("--quick", action="store_true", help="smaller inputs for a fast smoke run")
+    parser.add_argument("--output", help="write the JSON results to this file instead of stdout")
+    parser.add_argument("--compare", help="baseline JSON results to compare against")
+    args = parser.parse_args()
+
+    size = {
+        "replay_events": 20000, "days": 90, "events_per_day": 1500, "config_calls": 20000,
+        "issues": 250, "prompts": 64,
+    }
+    if args.quick:
+        size = {**size, "replay_events": 2000, "days": 14, "events_per_day": 500, "config_calls": 2000, "issues": 50, "prompts": 16}
+
+    results = {}
+    with tempfile.TemporaryDirectory() as state_dir:
+        Logger.LOG_DIR = os.path.join(state_dir, "waid_logs")
+        os.makedirs(Logger.LOG_DIR)
+        ConfigManager.CONFIG_PATH = os.path.join(state_dir, "config.json")
+        ResponseCache.CACHE_DIR = os.path.join(state_dir, "ai_cache")
+        for suite in args.suites.split(","):
+            print(f"running {suite}...", file=sys.stderr)
+            results[suite] = BENCHMARKS[suite](size)
+
+    report = {
+        "revision": git_revision(),
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "quick": args.quick,
+        "size": size,
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+    else:
+        print(json.dumps(report, indent=2))
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            compare(report, json.load(f))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+Time the Sessionizer over a month of synthetic window events, cold and incrementally.
+
+Run from the repository root:
+    python -m benchmarks.sessionizer_bench [days] [events_per_day]
+"""
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from services.logger.logger import Logger
+from services.sessionizer.sessionizer import Sessionizer
+
+TITLES = [
+    "ChatGPT - Google Chrome",
+    "Chrome Tab Detection - Google Chrome",
+    "waid.service - waid - Visual Studio Code",
+    "Home - QED42 - Slack",
+    "QWDI-20 Content types and Taxonomy terms - Jira - Google Chrome",
+    "Terminal",
+]
+
+
+def write_day(day: datetime, events: int, start_hour: int = 9, mode: str = "w") -> None:
+    moment = day.replace(hour=start_hour)
+    with open(os.path.join(Logger.LOG_DIR, f"{day:%Y-%m-%d}.log"), mode) as f:
+        for _ in range(events):
+            moment += timedelta(seconds=random.randint(1, 20))
+            stamp = f"{moment:%Y-%m-%d %H:%M:%S}"
+            f.write(f"{stamp} - {json.dumps({'timestamp': stamp, 'window_title': random.choice(TITLES)})}\n")
+
+
+def main() -> None:
+    days = int(sys.argv[1]) if len(sys.argv) > 1 else 30
+    events = int(sys.argv[2]) if len(sys.argv) > 2 else 2000
+    first = datetime(2025, 1, 1)
+
+    with tempfile.TemporaryDirectory() as log_dir:
+        Logger.LOG_DIR = log_dir
+        for offset in range(days):
+            write_day(first + timedelta(days=offset), events)
+
+        start = time.perf_counter()
+        intervals = sum(len(day.table) for day in Sessionizer.iter_days())
+        print(f"cold:        {days * events:,} events -> {intervals:,} intervals in {time.perf_counter() - start:.3f} s")
+
+        start = time.perf_counter()
+        sum(len(day.table) for day in Sessionizer.iter_days())
+        print(f"unchanged:   {time.perf_counter() - start:.3f} s")
+
+        write_day(first + timedelta(days=days - 1), 100, start_hour=23, mode="a")
+        start = time.perf_counter()
+        sum(len(day.table) for day in Sessionizer.iter_days())
+        print(f"+100 events: {time.perf_counter() - start:.3f} s")
+
+
+if __name__ == "__main__":
+    main()
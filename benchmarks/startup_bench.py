@@ -0,0 +1,66 @@
+"""
+Measure the import cost of the path from `python main.py` to a visible tray icon.
+
+Runs `python -X importtime -c "import main"` in a fresh interpreter, prints the
+slowest top-level imports and fails when the total exceeds the threshold or when
+a module that should only load on demand (AI SDKs, Qt) is imported at startup.
+
+Run from the repository root:
+    python -m benchmarks.startup_bench [threshold_ms] [runs]
+"""
+import os
+import subprocess
+import sys
+
+DEFAULT_THRESHOLD_MS = 400
+# Modules that must only be imported once the feature using them is first used.
+DEFERRED_MODULES = ("google.generativeai", "PyQt6", "services.ai.gemini.gemini", "ui.views.settings")
+
+
+def measure() -> dict:
+    """Return {module: (self_us, cumulative_us, depth)} for one cold import of main."""
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import main"],
+        cwd=root, capture_output=True, text=True,
+    )
+    if result.returncode != 0:
+        raise SystemExit(f"importing main failed:\n{result.stderr.splitlines()[-1]}")
+
+    modules = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        depth = (len(name) - len(name.lstrip())) // 2
+        modules[name.strip()] = (int(self_us), int(cumulative_us), depth)
+    return modules
+
+
+def main() -> None:
+    threshold_ms = float(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_THRESHOLD_MS
+    runs = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+
+    # The best of several runs filters out disk cache and scheduler noise.
+    samples = [measure() for _ in range(runs)]
+    totals = [sum(cumulative for _, cumulative, depth in modules.values() if depth == 0) for modules in samples]
+    modules = samples[totals.index(min(totals))]
+    total_ms = min(totals) / 1000
+
+    top_level = sorted(((cumulative, name) for name, (_, cumulative, depth) in modules.items() if depth == 0), reverse=True)
+    for cumulative, name in top_level[:10]:
+        print(f"{cumulative / 1000:8.1f} ms  {name}")
+    print(f"total:    {total_ms:.1f} ms (best of {runs}, threshold {threshold_ms:.0f} ms)")
+
+    failures = []
+    deferred = [name for name in modules if name.startswith(DEFERRED_MODULES)]
+    if deferred:
+        failures.append(f"imported at startup: {', '.join(sorted(deferred)[:5])}")
+    if total_ms > threshold_ms:
+        failures.append(f"startup imports took {total_ms:.1f} ms > {threshold_ms:.0f} ms")
+    if failures:
+        raise SystemExit("\n".join(failures))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+Compare the xdotool and native (Xlib) window tracking modes of WindowLogger.
+
+Run from the repository root inside an X11 session:
+    python -m benchmarks.window_logger_bench [lookups]
+"""
+import resource
+import sys
+import threading
+import time
+import Xlib.X
+import Xlib.display
+from services.logger.window.window_logger import WindowLogger
+
+
+def cpu_seconds() -> float:
+    """CPU time of this process and its reaped children."""
+    own = resource.getrusage(resource.RUSAGE_SELF)
+    children = resource.getrusage(resource.RUSAGE_CHILDREN)
+    return own.ru_utime + own.ru_stime + children.ru_utime + children.ru_stime
+
+
+def bench_lookups(window_logger: WindowLogger, native: bool, lookups: int) -> dict:
+    """Measure CPU and wall time of repeated active-window lookups."""
+    window_logger.event_thread = threading.current_thread() if native else None
+    cpu_start, wall_start = cpu_seconds(), time.perf_counter()
+    for _ in range(lookups):
+        window_logger.get_active_window_title()
+    cpu, wall = cpu_seconds() - cpu_start, time.perf_counter() - wall_start
+    window_logger.event_thread = None
+    return {
+        "cpu_ms_per_lookup": cpu * 1000 / lookups,
+        "wall_ms_per_lookup": wall * 1000 / lookups,
+    }
+
+
+def bench_event_latency(samples: int) -> float:
+    """
+    Measure the delay between a title change and the native event loop seeing it.
+    A private window is renamed from a second connection while the logger watches it.
+    """
+    window_logger = WindowLogger()
+    received = threading.Event()
+    window_logger.log_window_change = received.set
+
+    producer = Xlib.display.Display()
+    window = producer.screen().root.create_window(0, 0, 1, 1, 0, Xlib.X.CopyFromParent)
+    producer.flush()
+
+    window_logger.get_active_window_id = lambda: window.id
+    thread = threading.Thread(target=window_logger.run_event_loop, daemon=True)
+    thread.start()
+    time.sleep(0.2)
+    received.clear()
+
+    delays = []
+    for i in range(samples):
+        start = time.perf_counter()
+        window.change_property(window_logger.NET_WM_NAME, producer.intern_atom("UTF8_STRING"), 8, f"bench {i}".encode())
+        producer.flush()
+        if received.wait(timeout=1):
+            delays.append(time.perf_counter() - start)
+        received.clear()
+
+    window_logger.stop_event.set()
+    thread.join()
+    window.destroy()
+    producer.close()
+    return sum(delays) * 1000 / len(delays) if delays else float("nan")
+
+
+def main() -> None:
+    lookups = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    window_logger = WindowLogger()
+
+    for mode, native in (("xdotool", False), ("native", True)):
+        result = bench_lookups(window_logger, native, lookups)
+        print(f"{mode:8} lookup: {result['cpu_ms_per_lookup']:.3f} ms CPU, {result['wall_ms_per_lookup']:.3f} ms wall")
+
+    print(f"native   event latency: {bench_event_latency(50):.3f} ms (title change -> log)")
+    print("xdotool  event latency: unbounded until the next mouse click, plus one lookup")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,10 @@
+import threading
 from services.cleanup.cleanup import Cleanup
 from services.notification.notification import Notification
 from services.signal.signal_handler import SignalHandler
 from services.logger.log_manager import LogManager
-from services.ai.ai_manager import AIManager
+from services.metrics.metrics import Metrics
+from services.rollup.rollup import Rollup
 from ui.system_tray import SystemTray
 
 def main() -> None:
@@ -10,8 +12,14 @@ def main() -> None:
     # Register signals 
     SignalHandler.register_signals()
 
-    # Clean old logs
-    Cleanup.cleanup_logs(days=7)
+    # Collect hot-path metrics if enabled in the config
+    Metrics.start()
+
+    # Archive or clean old logs
+    Cleanup.run()
+
+    # Roll up days that closed since the last run, off the startup path
+    threading.Thread(target=Rollup.build_all, daemon=True).start()
 
     # Start logging
     LogManager.start()
@@ -1,27 +1,64 @@
+import asyncio
+import threading
 from enum import Enum
-from services.ai.gemini.gemini import GeminiAI
+from services.ai.ai_provider import AIProvider
+from services.ai.cache.response_cache import ResponseCache
+from services.ai.rate_limiter import AsyncRateLimiter
 from services.config.config_manager import ConfigManager
+from services.metrics.metrics import Metrics
 
 
 class AIManagerConfig(Enum):
     SELECTED_PROVIDER = "selected_ai_provider"
+    RESPONSE_CACHE = "ai_response_cache"
+    BATCH_CONCURRENCY = "ai_batch_concurrency"
+    RATE_LIMIT = "ai_rate_limit"
+
+
+def _gemini() -> AIProvider:
+    from services.ai.gemini.gemini import GeminiAI
+    return GeminiAI()
 
 
 class AIManager:
+    DEFAULT_BATCH_CONCURRENCY = 4
+
+    # Provider factories, so that SDKs are only imported once a provider is used.
     _providers = {
-        "gemini": GeminiAI(),
-        # Add more AI providers here, e.g., "openai": OpenAI()
+        "gemini": _gemini,
+        # Add more AI providers here, e.g., "openai": _openai
     }
 
+    _instances = {}
+    _instances_lock = threading.Lock()
+    _async_in_flight = {}
+    _batch_loop = None
+    _batch_loop_lock = threading.Lock()
+
+    @classmethod
+    def register_provider(cls, name: str, provider):
+        """
+        Make an additional AI provider available under `name`.
+        :param provider: An AIProvider, or a factory returning one on first use.
+        """
+        with cls._instances_lock:
+            if isinstance(provider, AIProvider):
+                cls._instances[name] = provider
+                cls._providers[name] = lambda: provider
+            else:
+                cls._instances.pop(name, None)
+                cls._providers[name] = provider
+
     @classmethod
     def set_provider(cls, name: str):
         """
         Set the AI provider and persist it in the config.
+        :raises OSError: If the config file could not be written.
         """
-        if name in cls._providers:
-            ConfigManager.set(AIManagerConfig.SELECTED_PROVIDER.value, name)
-        else:
+        if name not in cls._providers:
             raise ValueError(f"AI provider '{name}' not available.")
+        if not ConfigManager.set(AIManagerConfig.SELECTED_PROVIDER.value, name):
+            raise OSError(f"Could not save the config to {ConfigManager.CONFIG_PATH}.")
 
     @classmethod
     def get_provider(cls) -> str:
@@ -31,44 +68,201 @@ class AIManager:
         return ConfigManager.get(AIManagerConfig.SELECTED_PROVIDER.value) or ""
 
     @classmethod
-    def send_prompt(cls, prompt: str) -> str:
+    @Metrics.timed("ai.send_prompt")
+    def send_prompt(cls, prompt: str, use_cache: bool = True) -> str:
         """
         Send a prompt to the selected AI provider and get the response.
+        Identical prompts are answered from the response cache, and concurrent
+        identical prompts share one provider call, unless caching is disabled.
         """
-        provider = cls._providers.get(cls.get_provider())
-        if not provider:
-            raise ValueError("No valid AI provider selected.")
-        return provider.generate_text(prompt)
+        name, provider = cls._get_selected_provider()
+        if not cls._use_cache(use_cache):
+            return provider.generate_text(prompt)
+
+        key = ResponseCache.make_key(name, provider.get_model_name(), prompt)
+        return ResponseCache.get_or_compute(key, lambda: provider.generate_text(prompt), should_cache=cls._is_cacheable)
 
     @classmethod
-    def set_configuration(cls, config_obj: dict):
+    async def asend_prompt(cls, prompt: str, use_cache: bool = True) -> str:
         """
-        Set configuration for the currently selected AI provider.
+        Async variant of `send_prompt`; safe to await from the UI or any event loop.
+        Identical prompts awaited concurrently share one provider call.
         """
-        provider = cls._providers.get(cls.get_provider())
-        if not provider:
-            raise ValueError("No valid AI provider selected.")
-        provider.set_configuration(config_obj)
+        name, provider = cls._get_selected_provider()
+        if not cls._use_cache(use_cache):
+            return await provider.agenerate_text(prompt)
+
+        key = ResponseCache.make_key(name, provider.get_model_name(), prompt)
+        response = ResponseCache.get(key)
+        if response is not None:
+            return response
+
+        task = cls._async_in_flight.get(key)
+        if task is None or task.get_loop() is not asyncio.get_running_loop():
+            task = cls._async_in_flight[key] = asyncio.ensure_future(provider.agenerate_text(prompt))
+            task.add_done_callback(lambda done: cls._forget_in_flight(key, done))
+            response = await asyncio.shield(task)
+            if cls._is_cacheable(response):
+                ResponseCache.put(key, response)
+            return response
+        return await asyncio.shield(task)
+
+    @classmethod
+    def _forget_in_flight(cls, key: str, task) -> None:
+        """
+        Drop a finished task from `_async_in_flight`, unless the key already belongs to a
+        newer task, e.g. one started on another event loop while this one was running.
+        """
+        if cls._async_in_flight.get(key) is task:
+            del cls._async_in_flight[key]
+
+    @classmethod
+    def stream_prompt(cls, prompt: str, use_cache: bool = True):
+        """
+        Yield the response in chunks as they arrive. A cached response is yielded at once,
+        and a completed stream is added to the cache.
+        """
+        name, provider = cls._get_selected_provider()
+        key = ResponseCache.make_key(name, provider.get_model_name(), prompt)
+        if cls._use_cache(use_cache):
+            response = ResponseCache.get(key)
+            if response is not None:
+                yield response
+                return
+
+        chunks = []
+        for chunk in provider.stream_text(prompt):
+            chunks.append(chunk)
+            yield chunk
+
+        response = "".join(chunks)
+        if cls._use_cache(use_cache) and cls._is_cacheable(response):
+            ResponseCache.put(key, response)
+
+    @classmethod
+    async def asend_batch(cls, prompts: list, concurrency: int = None, rate_limit: float = None, return_exceptions: bool = False) -> list:
+        """
+        Send many prompts concurrently and return the responses in input order.
+
+        :param concurrency: Maximum prompts in flight (config `ai_batch_concurrency`, default 4).
+        :param rate_limit: Maximum prompts started per second (config `ai_rate_limit`, default unlimited).
+        :param return_exceptions: Return failures in place of responses instead of raising.
+        """
+        concurrency = concurrency or ConfigManager.get(AIManagerConfig.BATCH_CONCURRENCY.value) or cls.DEFAULT_BATCH_CONCURRENCY
+        rate_limit = rate_limit or ConfigManager.get(AIManagerConfig.RATE_LIMIT.value)
+        semaphore = asyncio.Semaphore(concurrency)
+        limiter = AsyncRateLimiter(rate_limit)
+
+        async def send(prompt: str) -> str:
+            async with semaphore:
+                await limiter.acquire()
+                return await cls.asend_prompt(prompt)
+
+        return await asyncio.gather(*(send(prompt) for prompt in prompts), return_exceptions=return_exceptions)
+
+    @classmethod
+    def send_batch(cls, prompts: list, concurrency: int = None, rate_limit: float = None, return_exceptions: bool = False) -> list:
+        """
+        Blocking wrapper around `asend_batch` for callers without an event loop.
+        Batches run on one long-lived background loop: async provider clients (e.g. gRPC
+        channels) bind to the loop they were first used on, so a loop per call would
+        leave them bound to a closed one.
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            pass
+        else:
+            raise RuntimeError("send_batch cannot be called from a running event loop; await asend_batch instead")
+        coroutine = cls.asend_batch(prompts, concurrency, rate_limit, return_exceptions)
+        return asyncio.run_coroutine_threadsafe(coroutine, cls._get_batch_loop()).result()
+
+    @classmethod
+    def _get_batch_loop(cls) -> asyncio.AbstractEventLoop:
+        """Start the background event loop used by `send_batch` on first use."""
+        with cls._batch_loop_lock:
+            if cls._batch_loop is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(target=loop.run_forever, name="waid-ai-batch", daemon=True).start()
+                cls._batch_loop = loop
+            return cls._batch_loop
 
     @classmethod
-    def get_configuration(cls) -> dict:
+    def get_cache_metrics(cls) -> dict:
         """
-        Get the configuration of the currently selected AI provider.
+        Get response cache hit/miss counters and the estimated provider time saved.
         """
-        provider = cls._providers.get(cls.get_provider())
+        return ResponseCache.get_metrics()
+
+    @classmethod
+    def _get_instance(cls, name: str) -> AIProvider | None:
+        """Create a provider on first use and reuse it afterwards."""
+        provider = cls._instances.get(name)
+        if provider is None and name in cls._providers:
+            with cls._instances_lock:
+                provider = cls._instances.get(name)
+                if provider is None:
+                    provider = cls._instances[name] = cls._providers[name]()
+        return provider
+
+    @classmethod
+    def _get_selected_provider(cls) -> tuple:
+        name = cls.get_provider()
+        provider = cls._get_instance(name)
         if not provider:
             raise ValueError("No valid AI provider selected.")
-        return provider.get_configuration()
+        return name, provider
+
+    @staticmethod
+    def _use_cache(use_cache: bool) -> bool:
+        return use_cache and ConfigManager.get(AIManagerConfig.RESPONSE_CACHE.value) is not False
+
+    @staticmethod
+    def is_error_response(response) -> bool:
+        """Providers report failures as "[Error: ...]" text instead of raising."""
+        return isinstance(response, str) and response.startswith("[Error")
 
     @classmethod
-    def get_required_configuration(cls) -> list:
+    def _is_cacheable(cls, response: str) -> bool:
+        """Failures must not be cached."""
+        return bool(response) and not cls.is_error_response(response)
+
+    @classmethod
+    def set_configuration(cls, config_obj: dict, name: str = None):
+        """
+        Set configuration for an AI provider (the currently selected one by default).
+        """
+        cls._get_named_provider(name).set_configuration(config_obj)
+
+    @classmethod
+    def get_configuration(cls, name: str = None) -> dict:
+        """
+        Get the configuration of an AI provider (the currently selected one by default).
         """
-        Get the required configuration of the currently selected AI provider.
+        return cls._get_named_provider(name).get_configuration()
+
+    @classmethod
+    def get_required_configuration(cls, name: str = None) -> list:
         """
-        provider = cls._providers.get(cls.get_provider())
+        Get the required configuration of an AI provider (the currently selected one by default).
+        """
+        return cls._get_named_provider(name).get_required_configuration()
+
+    @classmethod
+    def reload_configuration(cls):
+        """
+        Make providers that were already created re-read their configuration,
+        e.g. after the settings process changed their secrets.
+        """
+        for provider in list(cls._instances.values()):
+            provider.reload_configuration()
+
+    @classmethod
+    def _get_named_provider(cls, name: str = None) -> AIProvider:
+        provider = cls._get_instance(name if name is not None else cls.get_provider())
         if not provider:
             raise ValueError("No valid AI provider selected.")
-        return provider.get_required_configuration()
+        return provider
 
     @classmethod
     def get_available_providers(cls) -> list:
@@ -1,3 +1,4 @@
+import asyncio
 from abc import ABC, abstractmethod
 
 class AIProvider(ABC):
@@ -28,6 +29,22 @@ class AIProvider(ABC):
         """
         pass
 
+    @classmethod
+    def reload_configuration(cls):
+        """
+        Re-read configuration that may have been changed by another process.
+        Providers that cache their configuration should override this.
+        """
+        pass
+
+    @classmethod
+    def get_model_name(cls) -> str:
+        """
+        Return the name of the configured model, used to key cached responses.
+        Providers with a selectable model should override this.
+        """
+        return ""
+
     @classmethod
     @abstractmethod
     def generate_text(cls, prompt: str) -> str:
@@ -36,3 +53,19 @@ class AIProvider(ABC):
         Must be implemented by subclasses.
         """
         pass
+
+    @classmethod
+    async def agenerate_text(cls, prompt: str) -> str:
+        """
+        Generate text without blocking the event loop.
+        Runs `generate_text` in a worker thread unless overridden with a native async call.
+        """
+        return await asyncio.to_thread(cls.generate_text, prompt)
+
+    @classmethod
+    def stream_text(cls, prompt: str):
+        """
+        Yield the response in chunks as the model produces them.
+        Providers without streaming support yield the full response once.
+        """
+        yield cls.generate_text(prompt)
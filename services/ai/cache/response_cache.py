@@ -0,0 +1,215 @@
+import contextlib
+import hashlib
+import json
+import os
+import re
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+
+
+class ResponseCache:
+    """
+    Content-addressed cache for AI responses: a bounded in-memory LRU in front of an
+    on-disk tier with TTL and size-based eviction. Concurrent requests for the same
+    key share a single provider call.
+    """
+
+    CACHE_DIR = os.path.expanduser("~/waid/ai_cache")
+    MEMORY_ENTRIES = 256
+    TTL = 7 * 24 * 3600
+    MAX_DISK_BYTES = 64 * 1024 * 1024
+
+    _lock = threading.Lock()
+    _memory = OrderedDict()
+    _in_flight = {}
+    _disk_bytes = None
+    _metrics = {
+        "memory_hits": 0,
+        "disk_hits": 0,
+        "misses": 0,
+        "coalesced": 0,
+        "provider_seconds": 0.0,
+        "saved_seconds": 0.0,
+    }
+
+    @staticmethod
+    def make_key(provider: str, model: str, prompt: str) -> str:
+        """Hash provider, model and the whitespace-normalized prompt into a cache key."""
+        lines = (re.sub(r"[ \t]+", " ", line).strip() for line in prompt.strip().splitlines())
+        normalized = re.sub(r"\n{3,}", "\n\n", "\n".join(lines))
+        payload = json.dumps([provider, model, normalized], ensure_ascii=False)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    @classmethod
+    def get_or_compute(cls, key: str, compute, should_cache=None) -> str:
+        """
+        Return the cached response for `key`, or call `compute()` once and cache its result.
+        Callers arriving while the same key is being computed wait for that call instead.
+
+        :param compute: Zero-argument callable producing the response.
+        :param should_cache: Optional predicate; responses for which it is False are not stored.
+        """
+        response = cls.get(key)
+        if response is not None:
+            return response
+
+        with cls._lock:
+            entry = cls._memory.get(key)
+            if entry is not None:
+                # Computed by another caller since our lookup.
+                cls._record_hit("memory_hits")
+                return entry[1]
+            future = cls._in_flight.get(key)
+            owner = future is None
+            if owner:
+                future = cls._in_flight[key] = Future()
+                cls._metrics["misses"] += 1
+            else:
+                cls._metrics["coalesced"] += 1
+
+        if not owner:
+            return future.result()
+
+        try:
+            started = time.perf_counter()
+            response = compute()
+            with cls._lock:
+                cls._metrics["provider_seconds"] += time.perf_counter() - started
+            if should_cache is None or should_cache(response):
+                cls.put(key, response)
+            future.set_result(response)
+            return response
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with cls._lock:
+                cls._in_flight.pop(key, None)
+
+    @classmethod
+    def get(cls, key: str) -> str | None:
+        """Look a key up in memory, then on disk."""
+        now = time.time()
+        with cls._lock:
+            entry = cls._memory.get(key)
+            if entry is not None and now - entry[0] < cls.TTL:
+                cls._memory.move_to_end(key)
+                cls._record_hit("memory_hits")
+                return entry[1]
+
+        entry = cls._read_disk(key, now)
+        if entry is None:
+            return None
+        with cls._lock:
+            cls._remember(key, entry)
+            cls._record_hit("disk_hits")
+        return entry[1]
+
+    @classmethod
+    def put(cls, key: str, response: str) -> None:
+        """Store a response in both tiers."""
+        entry = (time.time(), response)
+        with cls._lock:
+            cls._remember(key, entry)
+        try:
+            cls._write_disk(key, entry)
+        except OSError as e:
+            print(f"Error writing AI cache: {e}")
+
+    @classmethod
+    def get_metrics(cls) -> dict:
+        """Return hit/miss counters, the hit rate and the estimated provider time saved."""
+        with cls._lock:
+            metrics = dict(cls._metrics)
+        lookups = metrics["memory_hits"] + metrics["disk_hits"] + metrics["coalesced"] + metrics["misses"]
+        metrics["hit_rate"] = (lookups - metrics["misses"]) / lookups if lookups else 0.0
+        return metrics
+
+    @classmethod
+    def clear(cls) -> None:
+        """Empty the memory tier and delete the disk tier."""
+        with cls._lock:
+            cls._memory.clear()
+            cls._disk_bytes = None
+        for path in cls._iter_disk_files():
+            os.remove(path)
+
+    @classmethod
+    def _record_hit(cls, counter: str) -> None:
+        """Count a hit and credit it with the average provider latency. Caller holds the lock."""
+        cls._metrics[counter] += 1
+        if cls._metrics["misses"]:
+            cls._metrics["saved_seconds"] += cls._metrics["provider_seconds"] / cls._metrics["misses"]
+
+    @classmethod
+    def _remember(cls, key: str, entry: tuple) -> None:
+        """Insert into the LRU, evicting the least recently used entry. Caller holds the lock."""
+        cls._memory[key] = entry
+        cls._memory.move_to_end(key)
+        while len(cls._memory) > cls.MEMORY_ENTRIES:
+            cls._memory.popitem(last=False)
+
+    @classmethod
+    def _disk_path(cls, key: str) -> str:
+        return os.path.join(cls.CACHE_DIR, key[:2], f"{key}.json")
+
+    @classmethod
+    def _read_disk(cls, key: str, now: float) -> tuple | None:
+        path = cls._disk_path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            created, response = data["created"], data["response"]
+            expired = now - created >= cls.TTL
+        except (OSError, ValueError, KeyError, TypeError):
+            # Unreadable or malformed entries (e.g. written by another version) are misses.
+            return None
+        if expired:
+            # Another process may have evicted it first.
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(path)
+            return None
+        return created, response
+
+    @classmethod
+    def _write_disk(cls, key: str, entry: tuple) -> None:
+        path = cls._disk_path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump({"created": entry[0], "response": entry[1]}, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+        with cls._lock:
+            if cls._disk_bytes is None:
+                cls._disk_bytes = sum(os.path.getsize(p) for p in cls._iter_disk_files())
+            else:
+                cls._disk_bytes += os.path.getsize(path)
+            if cls._disk_bytes > cls.MAX_DISK_BYTES:
+                cls._evict_disk()
+
+    @classmethod
+    def _evict_disk(cls) -> None:
+        """Delete expired entries, then the oldest ones, down to 90% of MAX_DISK_BYTES. Caller holds the lock."""
+        now = time.time()
+        files = sorted((os.stat(p).st_mtime, os.path.getsize(p), p) for p in cls._iter_disk_files())
+        total = sum(size for _, size, _ in files)
+        for mtime, size, path in files:
+            if total <= cls.MAX_DISK_BYTES * 0.9 and now - mtime < cls.TTL:
+                break
+            os.remove(path)
+            total -= size
+        cls._disk_bytes = total
+
+    @classmethod
+    def _iter_disk_files(cls):
+        if not os.path.isdir(cls.CACHE_DIR):
+            return
+        for directory in os.scandir(cls.CACHE_DIR):
+            if directory.is_dir():
+                for entry in os.scandir(directory.path):
+                    if entry.name.endswith(".json"):
+                        yield entry.path
@@ -0,0 +1,79 @@
+import asyncio
+import hashlib
+import time
+from services.ai.ai_provider import AIProvider
+
+
+class FakeAI(AIProvider):
+    """
+    Deterministic offline provider for benchmarks.
+    The response depends only on the prompt, and latency is simulated per request and per token.
+    """
+
+    LATENCY = 0.2
+    TOKEN_LATENCY = 0.005
+    RESPONSE_WORDS = 40
+    calls = 0
+
+    @classmethod
+    def set_configuration(cls, config_obj: dict):
+        """
+        Set simulated latencies ("latency", "token_latency") in seconds.
+        """
+        cls.LATENCY = float(config_obj.get("latency", cls.LATENCY))
+        cls.TOKEN_LATENCY = float(config_obj.get("token_latency", cls.TOKEN_LATENCY))
+
+    @classmethod
+    def get_configuration(cls) -> dict:
+        """
+        Return the simulated latencies.
+        """
+        return {"latency": str(cls.LATENCY), "token_latency": str(cls.TOKEN_LATENCY)}
+
+    @classmethod
+    def get_required_configuration(cls) -> list:
+        """
+        The fake provider needs no configuration.
+        """
+        return []
+
+    @classmethod
+    def get_model_name(cls) -> str:
+        return "fake"
+
+    @classmethod
+    def generate_text(cls, prompt: str) -> str:
+        """
+        Return a deterministic response after the simulated latency.
+        """
+        cls.calls += 1
+        tokens = cls._tokens(prompt)
+        time.sleep(cls.LATENCY + cls.TOKEN_LATENCY * len(tokens))
+        return "".join(tokens)
+
+    @classmethod
+    async def agenerate_text(cls, prompt: str) -> str:
+        """
+        Async variant that sleeps on the event loop instead of a thread.
+        """
+        cls.calls += 1
+        tokens = cls._tokens(prompt)
+        await asyncio.sleep(cls.LATENCY + cls.TOKEN_LATENCY * len(tokens))
+        return "".join(tokens)
+
+    @classmethod
+    def stream_text(cls, prompt: str):
+        """
+        Yield one token at a time, paced by the simulated token latency.
+        """
+        cls.calls += 1
+        time.sleep(cls.LATENCY)
+        for token in cls._tokens(prompt):
+            time.sleep(cls.TOKEN_LATENCY)
+            yield token
+
+    @classmethod
+    def _tokens(cls, prompt: str) -> list:
+        digest = hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+        words = prompt.split()[:cls.RESPONSE_WORDS - 1]
+        return [f"[fake {digest[:8]}]"] + [f" {word}" for word in words]
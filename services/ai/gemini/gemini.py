@@ -1,3 +1,5 @@
+import asyncio
+import weakref
 import google.generativeai as genai
 from enum import Enum
 from services.ai.ai_provider import AIProvider
@@ -9,7 +11,10 @@ class GeminiSecret(Enum):
 
 class GeminiAI(AIProvider):
     _model = None
+    _model_name = ""
     _initialized = False
+    # The SDK's async client is bound to the event loop it was first used on.
+    _async_models = weakref.WeakKeyDictionary()
 
     def __new__(cls, *args, **kwargs):
         """
@@ -24,13 +29,16 @@ class GeminiAI(AIProvider):
         """
         Configure Gemini AI with stored API key and model name.
         """
-        api_key = SecretManager.get_secret(GeminiSecret.API_KEY.value)
-        model_name = SecretManager.get_secret(GeminiSecret.MODEL.value)
+        secrets = SecretManager.get_secrets([key.value for key in GeminiSecret])
+        api_key = secrets[GeminiSecret.API_KEY.value]
+        model_name = secrets[GeminiSecret.MODEL.value]
 
         if api_key:
             genai.configure(api_key=api_key)
         if model_name:
             cls._model = genai.GenerativeModel(model_name)
+        cls._model_name = model_name or ""
+        cls._async_models = weakref.WeakKeyDictionary()
 
         cls._initialized = True
 
@@ -44,12 +52,19 @@ class GeminiAI(AIProvider):
                 SecretManager.set_secret(key.value, config_obj[key.value])
         cls._configure_gemini()
 
+    @classmethod
+    def reload_configuration(cls):
+        """
+        Re-apply the stored configuration, e.g. after the settings window changed it.
+        """
+        cls._configure_gemini()
+
     @classmethod
     def get_configuration(cls) -> dict:
         """
         Retrieve stored Gemini AI configuration securely.
         """
-        return {key.value: SecretManager.get_secret(key.value) for key in GeminiSecret}
+        return SecretManager.get_secrets([key.value for key in GeminiSecret])
 
     @classmethod
     def get_required_configuration(cls) -> list:
@@ -58,6 +73,13 @@ class GeminiAI(AIProvider):
         """
         return [key.value for key in GeminiSecret]
 
+    @classmethod
+    def get_model_name(cls) -> str:
+        """
+        Return the configured Gemini model name.
+        """
+        return cls._model_name
+
     @classmethod
     def generate_text(cls, prompt: str) -> str:
         """
@@ -67,3 +89,29 @@ class GeminiAI(AIProvider):
             return "[Error: Model not configured]"
         response = cls._model.generate_content(prompt)
         return response.text if response and hasattr(response, 'text') else "[Error: No response from GeminiAI]"
+
+    @classmethod
+    async def agenerate_text(cls, prompt: str) -> str:
+        """
+        Generate text with Gemini's native async client, one per event loop.
+        """
+        if not cls._model:
+            return "[Error: Model not configured]"
+        loop = asyncio.get_running_loop()
+        model = cls._async_models.get(loop)
+        if model is None:
+            model = cls._async_models[loop] = genai.GenerativeModel(cls._model_name)
+        response = await model.generate_content_async(prompt)
+        return response.text if response and hasattr(response, 'text') else "[Error: No response from GeminiAI]"
+
+    @classmethod
+    def stream_text(cls, prompt: str):
+        """
+        Yield Gemini's response chunk by chunk as it is generated.
+        """
+        if not cls._model:
+            yield "[Error: Model not configured]"
+            return
+        for chunk in cls._model.generate_content(prompt, stream=True):
+            if hasattr(chunk, 'text') and chunk.text:
+                yield chunk.text
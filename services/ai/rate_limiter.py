@@ -0,0 +1,22 @@
+import asyncio
+import time
+
+
+class AsyncRateLimiter:
+    """Spaces out request starts so that at most `rate` begin per second."""
+
+    def __init__(self, rate: float | None) -> None:
+        self.interval = 1.0 / rate if rate else 0.0
+        self._next_start = 0.0
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Wait until the next request may start."""
+        if not self.interval:
+            return
+        async with self._lock:
+            now = time.monotonic()
+            wait = self._next_start - now
+            self._next_start = max(now, self._next_start) + self.interval
+        if wait > 0:
+            await asyncio.sleep(wait)
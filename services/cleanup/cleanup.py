@@ -1,9 +1,87 @@
 import os
+import time
 from datetime import datetime, timedelta
+from enum import Enum
+from services.config.config_manager import ConfigManager
 from services.logger.logger import Logger
+from services.logger.archive.log_archive import LogArchive
+
+
+class CleanupConfig(Enum):
+    MODE = "log_cleanup_mode"
+    RETENTION_DAYS = "log_retention_days"
+    ARCHIVE_MAX_BYTES = "log_archive_max_bytes"
+
+
+class CleanupMode(Enum):
+    ARCHIVE = "archive"
+    DELETE = "delete"
+
 
 class Cleanup:
-    """Handles cleanup tasks like removing old log files."""
+    """Handles cleanup tasks like archiving or removing old log files."""
+
+    DELETE_AFTER_DAYS = 7
+    DEFAULT_RETENTION_DAYS = 365
+    DEFAULT_ARCHIVE_MAX_BYTES = 256 * 1024 * 1024
+    LOG_EXTENSIONS = (".log", ".wlog")
+
+    @classmethod
+    def run(cls) -> None:
+        """Apply the configured cleanup mode (archive by default)."""
+        if ConfigManager.get(CleanupConfig.MODE.value) == CleanupMode.DELETE.value:
+            cls.cleanup_logs(days=cls.DELETE_AFTER_DAYS)
+            return
+
+        cls.archive_logs()
+        cls.apply_retention(
+            days=ConfigManager.get(CleanupConfig.RETENTION_DAYS.value) or cls.DEFAULT_RETENTION_DAYS,
+            max_bytes=ConfigManager.get(CleanupConfig.ARCHIVE_MAX_BYTES.value) or cls.DEFAULT_ARCHIVE_MAX_BYTES,
+        )
+
+    @classmethod
+    def archive_logs(cls) -> int:
+        """
+        Move every closed day log (anything before today) into the monthly archives.
+        Only unarchived files are touched, so the cost does not grow with history.
+        :return: Number of files archived.
+        """
+        if not os.path.exists(Logger.LOG_DIR):
+            return 0
+
+        today = time.strftime("%Y-%m-%d")
+        archived = 0
+        with os.scandir(Logger.LOG_DIR) as entries:
+            closed = [
+                entry.path for entry in entries
+                if entry.is_file() and entry.name.endswith(cls.LOG_EXTENSIONS) and entry.name[:10] < today
+            ]
+        for path in sorted(closed):
+            LogArchive.add(path)
+            archived += 1
+        return archived
+
+    @classmethod
+    def apply_retention(cls, days: int = None, max_bytes: int = None) -> None:
+        """
+        Drop whole archived months that are older than `days` or, oldest first,
+        until the archives fit in `max_bytes`.
+        """
+        months = LogArchive.list_months()
+        if days is not None:
+            cutoff_month = (datetime.now() - timedelta(days=days)).strftime("%Y-%m")
+            for month in [m for m in months if m < cutoff_month]:
+                LogArchive.remove_month(month)
+                months.remove(month)
+
+        if max_bytes is not None:
+            sizes = {month: LogArchive.get_month_size(month) for month in months}
+            total = sum(sizes.values())
+            for month in months[:-1]:
+                if total <= max_bytes:
+                    break
+                LogArchive.remove_month(month)
+                total -= sizes[month]
 
     @classmethod
     def cleanup_logs(cls, days: int = None) -> None:
@@ -14,11 +92,8 @@ class Cleanup:
         if not os.path.exists(Logger.LOG_DIR):
             return
 
-        if days is not None:
-            cutoff_date = datetime.now() - timedelta(days=days)
-        
-        for filename in os.listdir(Logger.LOG_DIR):
-            file_path = os.path.join(Logger.LOG_DIR, filename)
-            if os.path.isfile(file_path):
-                if days is None or datetime.fromtimestamp(os.path.getmtime(file_path)) < cutoff_date:
-                    os.remove(file_path)
+        cutoff = time.time() - days * 86400 if days is not None else None
+        with os.scandir(Logger.LOG_DIR) as entries:
+            for entry in entries:
+                if entry.is_file() and (cutoff is None or entry.stat().st_mtime < cutoff):
+                    os.remove(entry.path)
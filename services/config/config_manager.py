@@ -1,13 +1,25 @@
+import atexit
+import copy
 import json
 import os
+import tempfile
 import threading
+from services.metrics.metrics import Metrics
 
 class ConfigManager:
     """Manages reading, writing, and modifying config.json dynamically."""
 
-    CONFIG_PATH = os.path.expanduser("~/waid/config.json") 
-    _lock = threading.Lock()
+    CONFIG_PATH = os.path.expanduser("~/waid/config.json")
+    WRITE_DELAY = 0.05
+    _lock = threading.RLock()
     _default_config = {}
+    _cache = None
+    _cache_stat = None
+    _pending = {}
+    _save_timer = None
+    _flush_failed = False
+    _atexit_registered = False
+    _listeners = []
 
     @classmethod
     def _ensure_config_exists(cls):
@@ -17,32 +29,128 @@ class ConfigManager:
             cls._save_config(cls._default_config)
 
     @classmethod
+    def _stat_config(cls) -> tuple | None:
+        """Return (mtime_ns, size) of config.json, or None if it does not exist."""
+        try:
+            stat = os.stat(cls.CONFIG_PATH)
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    @classmethod
+    @Metrics.timed("config.load")
     def _load_config(cls) -> dict:
-        """Load the configuration from config.json."""
-        cls._ensure_config_exists()
-        with cls._lock, open(cls.CONFIG_PATH, "r", encoding="utf-8") as f:
-            return json.load(f)
+        """
+        Load the configuration from config.json.
+        The parsed file is cached and only re-read when its mtime or size changes.
+        """
+        with cls._lock:
+            stat = cls._stat_config()
+            if stat is None:
+                cls._ensure_config_exists()
+                stat = cls._stat_config()
+                cls._cache = None
+
+            if cls._cache is None or stat != cls._cache_stat:
+                if Metrics.enabled:
+                    Metrics.increment("config.file_reads")
+                with open(cls.CONFIG_PATH, "r", encoding="utf-8") as f:
+                    config = json.load(f)
+                # Unsaved local changes win over whatever is on disk.
+                config.update(copy.deepcopy(cls._pending))
+                cls._cache, cls._cache_stat = config, stat
+            return cls._cache
 
     @classmethod
+    @Metrics.timed("config.save")
     def _save_config(cls, new_config: dict) -> bool:
-        """Save the updated configuration to config.json."""
+        """Atomically replace config.json through a temp file and rename."""
+        tmp_path = None
         try:
-            with cls._lock, open(cls.CONFIG_PATH, "w", encoding="utf-8") as f:
-                json.dump(new_config, f, indent=4)
+            with cls._lock:
+                directory = os.path.dirname(cls.CONFIG_PATH)
+                fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".config.", suffix=".tmp")
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(new_config, f, indent=4)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_path, cls.CONFIG_PATH)
+                cls._cache, cls._cache_stat = copy.deepcopy(new_config), cls._stat_config()
             return True
         except Exception as e:
+            if tmp_path and os.path.exists(tmp_path):
+                os.remove(tmp_path)
             print(f"Error saving config: {e}")
             return False
 
     @classmethod
     def get(cls, key: str):
         """Get a value from config.json by key."""
-        config = cls._load_config()
-        return config.get(key, None)  
+        value = cls._load_config().get(key, None)
+        return copy.deepcopy(value) if isinstance(value, (dict, list)) else value
 
     @classmethod
     def set(cls, key: str, value) -> bool:
-        """Set a key-value pair in config.json."""
-        config = cls._load_config()
-        config[key] = value  
-        return cls._save_config(config)
+        """Set a key-value pair in config.json. Returns False as `set_many` does."""
+        return cls.set_many({key: value})
+
+    @classmethod
+    def set_many(cls, values: dict) -> bool:
+        """
+        Set several key-value pairs in config.json at once.
+        The change is visible to `get` immediately; the file write is deferred by
+        WRITE_DELAY so that a burst of calls results in a single write.
+
+        :return: False if config.json could not be written. A deferred write cannot
+            report back, so after one fails, the following calls write synchronously
+            until a write succeeds again. The values are kept in memory either way.
+        """
+        values = copy.deepcopy(values)
+        with cls._lock:
+            cls._load_config().update(values)
+            cls._pending.update(values)
+            flush_now = cls._flush_failed
+
+            if cls._save_timer is None and not flush_now:
+                cls._save_timer = threading.Timer(cls.WRITE_DELAY, cls.flush)
+                cls._save_timer.daemon = True
+                cls._save_timer.start()
+            if not cls._atexit_registered:
+                atexit.register(cls.flush)
+                cls._atexit_registered = True
+            listeners = list(cls._listeners)
+
+        saved = cls.flush() if flush_now else True
+        for listener in listeners:
+            listener(list(values))
+        return saved
+
+    @classmethod
+    def add_listener(cls, listener) -> None:
+        """Call `listener(keys)` after every `set`/`set_many` in this process."""
+        with cls._lock:
+            cls._listeners.append(listener)
+
+    @classmethod
+    def remove_listener(cls, listener) -> None:
+        with cls._lock:
+            if listener in cls._listeners:
+                cls._listeners.remove(listener)
+
+    @classmethod
+    def flush(cls) -> bool:
+        """Write pending changes to config.json now."""
+        with cls._lock:
+            if cls._save_timer is not None:
+                cls._save_timer.cancel()
+                cls._save_timer = None
+            if not cls._pending:
+                return True
+
+            # Reloading merges changes made by other processes with ours.
+            if cls._save_config(cls._load_config()):
+                cls._pending.clear()
+                cls._flush_failed = False
+                return True
+            cls._flush_failed = True
+            return False
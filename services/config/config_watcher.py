@@ -0,0 +1,151 @@
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import threading
+from services.config.config_manager import ConfigManager
+
+
+class ConfigWatcher:
+    """
+    Notifies subscribers when config values they care about change, whether the
+    change was made in this process or written to config.json by another one.
+    File changes are picked up with inotify on the config directory (config.json is
+    replaced atomically, so the file itself cannot be watched), falling back to
+    polling its mtime where inotify is unavailable.
+    """
+
+    POLL_INTERVAL = 1.0
+    # IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE | IN_DELETE
+    INOTIFY_MASK = 0x00000008 | 0x00000080 | 0x00000100 | 0x00000200
+    INOTIFY_EVENT = struct.Struct("iIII")
+
+    _subscribers = []
+    _values = {}
+    _lock = threading.RLock()
+    _thread = None
+    _stop_event = threading.Event()
+
+    @classmethod
+    def subscribe(cls, keys: list, callback) -> None:
+        """
+        Call `callback(changes)` whenever any of `keys` changes, with a dict of the
+        changed keys and their new values. Callbacks run on the watcher thread, or
+        on the thread that called ConfigManager.set for changes made in this process.
+        """
+        with cls._lock:
+            for key in keys:
+                if key not in cls._values:
+                    cls._values[key] = ConfigManager.get(key)
+            cls._subscribers.append((frozenset(keys), callback))
+        cls.start()
+
+    @classmethod
+    def unsubscribe(cls, callback) -> None:
+        """Stop calling `callback`."""
+        with cls._lock:
+            cls._subscribers = [(keys, fn) for keys, fn in cls._subscribers if fn != callback]
+
+    @classmethod
+    def check(cls, *args) -> None:
+        """Compare watched keys with the config and notify subscribers of what changed."""
+        with cls._lock:
+            changes = {}
+            for key, old in cls._values.items():
+                new = ConfigManager.get(key)
+                if new != old:
+                    changes[key] = cls._values[key] = new
+            if not changes:
+                return
+            subscribers = list(cls._subscribers)
+
+        for keys, callback in subscribers:
+            relevant = {key: value for key, value in changes.items() if key in keys}
+            if relevant:
+                try:
+                    callback(relevant)
+                except Exception as e:
+                    print(f"Error in config subscriber: {e}")
+
+    @classmethod
+    def start(cls) -> None:
+        """Start watching config.json (done automatically by `subscribe`)."""
+        with cls._lock:
+            if cls._thread is not None:
+                return
+            ConfigManager.add_listener(cls.check)
+            cls._stop_event.clear()
+            cls._thread = threading.Thread(target=cls._run, name="waid-config-watcher", daemon=True)
+            cls._thread.start()
+
+    @classmethod
+    def stop(cls) -> None:
+        """Stop watching config.json."""
+        with cls._lock:
+            thread, cls._thread = cls._thread, None
+        if thread is None:
+            return
+        ConfigManager.remove_listener(cls.check)
+        cls._stop_event.set()
+        thread.join()
+
+    @classmethod
+    def _run(cls) -> None:
+        fd = cls._init_inotify()
+        try:
+            if fd is None:
+                cls._poll()
+            else:
+                cls._watch(fd)
+        finally:
+            if fd is not None:
+                os.close(fd)
+
+    @classmethod
+    def _init_inotify(cls) -> int | None:
+        """Return an inotify descriptor watching the config directory, or None."""
+        try:
+            libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+            fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        except (OSError, AttributeError):
+            return None
+        if fd < 0:
+            return None
+
+        directory = os.path.dirname(ConfigManager.CONFIG_PATH)
+        os.makedirs(directory, exist_ok=True)
+        if libc.inotify_add_watch(fd, os.fsencode(directory), cls.INOTIFY_MASK) < 0:
+            os.close(fd)
+            return None
+        return fd
+
+    @classmethod
+    def _watch(cls, fd: int) -> None:
+        name = os.fsencode(os.path.basename(ConfigManager.CONFIG_PATH))
+        while not cls._stop_event.is_set():
+            readable, _, _ = select.select([fd], [], [], cls.POLL_INTERVAL)
+            if not readable:
+                continue
+            try:
+                data = os.read(fd, 4096)
+            except BlockingIOError:
+                continue
+
+            offset, changed = 0, False
+            while offset < len(data):
+                _, _, _, length = cls.INOTIFY_EVENT.unpack_from(data, offset)
+                offset += cls.INOTIFY_EVENT.size
+                changed = changed or data[offset:offset + length].rstrip(b"\0") == name
+                offset += length
+            if changed:
+                cls.check()
+
+    @classmethod
+    def _poll(cls) -> None:
+        stat = ConfigManager._stat_config()
+        while not cls._stop_event.wait(cls.POLL_INTERVAL):
+            current = ConfigManager._stat_config()
+            if current != stat:
+                stat = current
+                cls.check()
@@ -0,0 +1,130 @@
+from pynput import keyboard, mouse
+import Xlib.display
+import Xlib.error
+from Xlib.ext import screensaver
+import threading
+import time
+from enum import Enum
+from services.config.config_manager import ConfigManager
+
+
+class IdleDetectorConfig(Enum):
+    THRESHOLD = "idle_threshold_seconds"
+
+
+class IdleDetector:
+    """
+    Detects when the user goes away and comes back.
+    Idle time comes from the X11 MIT-SCREEN-SAVER extension, which the X server
+    tracks for free; without it, the time of the last mouse or keyboard event is
+    used instead. A running screensaver or lock screen counts as idle right away.
+    """
+
+    DEFAULT_THRESHOLD = 300
+    MAX_POLL_INTERVAL = 30.0
+    IDLE_POLL_INTERVAL = 1.0
+
+    def __init__(self, on_idle, on_active) -> None:
+        """
+        :param on_idle: Called with the epoch at which the user went idle.
+        :param on_active: Called when the user is back.
+        """
+        self.on_idle = on_idle
+        self.on_active = on_active
+        self.idle = False
+        self.thread = None
+        self.stop_event = threading.Event()
+        self.display = None
+        self.input_listeners = []
+        self.last_input = time.time()
+
+    def get_threshold(self) -> float:
+        """Seconds without input after which the user counts as idle (0 disables detection)."""
+        threshold = ConfigManager.get(IdleDetectorConfig.THRESHOLD.value)
+        return self.DEFAULT_THRESHOLD if threshold is None else float(threshold)
+
+    def get_idle_seconds(self) -> float:
+        """Seconds since the last user input."""
+        if self.display is not None:
+            try:
+                info = self.display.screen().root.screensaver_query_info()
+                if info.state == screensaver.StateOn:
+                    return float("inf")
+                return info.idle / 1000
+            except Xlib.error.XError:
+                pass
+        return time.time() - self.last_input
+
+    def on_input(self, *args) -> None:
+        """Record the time of a mouse or keyboard event (fallback only)."""
+        self.last_input = time.time()
+
+    def start(self) -> None:
+        """Start watching for idle time."""
+        if self.thread is not None and self.thread.is_alive():
+            return
+        self._connect()
+        self.idle = False
+        self.stop_event.clear()
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+
+    def stop(self) -> None:
+        """Stop watching for idle time."""
+        if self.thread is None:
+            return
+        self.stop_event.set()
+        self.thread.join()
+        self.thread = None
+
+        for listener in self.input_listeners:
+            listener.stop()
+        self.input_listeners = []
+        if self.display is not None:
+            self.display.close()
+            self.display = None
+
+    def run(self) -> None:
+        """
+        Poll the idle time, sleeping until the threshold could next be crossed
+        rather than on a fixed short tick.
+        """
+        while not self.stop_event.is_set():
+            threshold = self.get_threshold()
+            if threshold <= 0:
+                self.stop_event.wait(self.MAX_POLL_INTERVAL)
+                continue
+
+            idle_seconds = self.get_idle_seconds()
+            if not self.idle and idle_seconds >= threshold:
+                self.idle = True
+                since = time.time() - idle_seconds if idle_seconds != float("inf") else time.time()
+                self.on_idle(since)
+            elif self.idle and idle_seconds < threshold:
+                self.idle = False
+                self.on_active()
+
+            if self.idle:
+                delay = self.IDLE_POLL_INTERVAL
+            else:
+                delay = min(max(threshold - idle_seconds, self.IDLE_POLL_INTERVAL), self.MAX_POLL_INTERVAL)
+            self.stop_event.wait(delay)
+
+    def _connect(self) -> None:
+        """Use the screensaver extension if the X server has it, input listeners otherwise."""
+        try:
+            display = Xlib.display.Display()
+            if display.has_extension("MIT-SCREEN-SAVER"):
+                self.display = display
+                return
+            display.close()
+        except Xlib.error.DisplayError:
+            pass
+
+        self.last_input = time.time()
+        self.input_listeners = [
+            mouse.Listener(on_move=self.on_input, on_click=self.on_input, on_scroll=self.on_input),
+            keyboard.Listener(on_press=self.on_input),
+        ]
+        for listener in self.input_listeners:
+            listener.start()
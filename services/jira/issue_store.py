@@ -0,0 +1,185 @@
+import json
+import os
+import sqlite3
+import threading
+from datetime import datetime, timedelta
+from zoneinfo import ZoneInfo
+from services.jira.jira_client import JiraClient
+
+
+class IssueStore:
+    """SQLite copy of the user's Jira issues, refreshed incrementally and queried without the network."""
+
+    DB_PATH = os.path.expanduser("~/waid/issues.db")
+    SYNC_FIELDS = ["summary", "status", "parent", "labels", "updated", "issuetype", "project"]
+    SYNC_OVERLAP = timedelta(minutes=2)
+    FULL_SYNC_INTERVAL = timedelta(days=1)
+    UPDATED_FORMAT = "%Y-%m-%dT%H:%M:%S.%f%z"
+
+    _lock = threading.Lock()
+    _connection = None
+
+    @classmethod
+    def _connect(cls) -> sqlite3.Connection:
+        """Open the database on first use and create the schema if missing."""
+        if cls._connection is None:
+            os.makedirs(os.path.dirname(cls.DB_PATH), exist_ok=True)
+            connection = sqlite3.connect(cls.DB_PATH, check_same_thread=False)
+            connection.row_factory = sqlite3.Row
+            connection.executescript("""
+                PRAGMA journal_mode = WAL;
+                CREATE TABLE IF NOT EXISTS issues (
+                    key TEXT PRIMARY KEY,
+                    id TEXT,
+                    summary TEXT,
+                    status TEXT,
+                    parent_key TEXT,
+                    labels TEXT,
+                    updated TEXT,
+                    data TEXT NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS issues_status ON issues (status);
+                CREATE INDEX IF NOT EXISTS issues_parent_key ON issues (parent_key);
+                CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value TEXT);
+            """)
+            cls._connection = connection
+        return cls._connection
+
+    @classmethod
+    def sync(cls, client: JiraClient, jql: str, full: bool = False) -> int:
+        """
+        Pull issues changed since the last sync and upsert them.
+        A full sync also drops issues that no longer match `jql` (e.g. reassigned),
+        and happens automatically once FULL_SYNC_INTERVAL has passed or when the
+        client points at another site or user than the stored issues came from.
+
+        The incremental cursor is the newest `updated` time Jira returned, not the
+        local clock, and it is written in the user's Jira time zone, in which Jira
+        evaluates JQL dates.
+
+        :param client: Client for the Jira site.
+        :param jql: Query selecting the issues to keep; must not contain ORDER BY.
+        :param full: Re-download every matching issue.
+        :return: Number of issues fetched.
+        """
+        started = datetime.now()
+        user = client.get("/rest/api/3/myself")
+        site = f"{client.base_url}|{user.get('accountId')}"
+        if cls._get_meta("site") != site:
+            cls.clear()
+        cursor = cls._get_meta("cursor")
+        last_full_sync = cls._get_meta("last_full_sync")
+        if not cursor or not last_full_sync or started - datetime.fromisoformat(last_full_sync) > cls.FULL_SYNC_INTERVAL:
+            full = True
+
+        query = jql
+        if not full:
+            since = (datetime.fromisoformat(cursor) - cls.SYNC_OVERLAP).astimezone(cls._get_time_zone(user))
+            query = f'({jql}) AND updated >= "{since:%Y/%m/%d %H:%M}"'
+        rows = [cls._to_row(issue) for issue in client.search(f"{query} ORDER BY updated ASC", fields=cls.SYNC_FIELDS)]
+
+        updated = [moment for moment in map(cls._parse_updated, (row[6] for row in rows)) if moment is not None]
+        if updated:
+            cursor = max(updated).isoformat()
+        elif full:
+            cursor = None
+
+        with cls._lock, cls._connect() as connection:
+            if full:
+                connection.execute("DELETE FROM issues")
+            connection.executemany(
+                "INSERT OR REPLACE INTO issues (key, id, summary, status, parent_key, labels, updated, data) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                rows
+            )
+            cls._set_meta(connection, "site", site)
+            cls._set_meta(connection, "last_sync", started.isoformat())
+            if cursor:
+                cls._set_meta(connection, "cursor", cursor)
+            else:
+                connection.execute("DELETE FROM meta WHERE name = 'cursor'")
+            if full:
+                cls._set_meta(connection, "last_full_sync", started.isoformat())
+        return len(rows)
+
+    @classmethod
+    def get_issue(cls, key: str) -> dict | None:
+        """Return a cached issue by key."""
+        rows = cls._query("SELECT data FROM issues WHERE key = ?", (key,))
+        return rows[0] if rows else None
+
+    @classmethod
+    def get_issues(cls, status: str = None, parent_key: str = None) -> list:
+        """
+        Return cached issues, most recently updated first.
+
+        :param status: Only issues in this status (e.g. "In Progress").
+        :param parent_key: Only children of this issue.
+        """
+        conditions, params = [], []
+        if status is not None:
+            conditions.append("status = ?")
+            params.append(status)
+        if parent_key is not None:
+            conditions.append("parent_key = ?")
+            params.append(parent_key)
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        return cls._query(f"SELECT data FROM issues {where} ORDER BY updated DESC", params)
+
+    @classmethod
+    def get_last_sync(cls) -> datetime | None:
+        """Return when the store was last synced, or None if never."""
+        last_sync = cls._get_meta("last_sync")
+        return datetime.fromisoformat(last_sync) if last_sync else None
+
+    @classmethod
+    def clear(cls) -> None:
+        """Drop every cached issue and the sync state."""
+        with cls._lock, cls._connect() as connection:
+            connection.execute("DELETE FROM issues")
+            connection.execute("DELETE FROM meta")
+
+    @classmethod
+    def _query(cls, sql: str, params=()) -> list:
+        with cls._lock:
+            rows = cls._connect().execute(sql, params).fetchall()
+        return [json.loads(row["data"]) for row in rows]
+
+    @classmethod
+    def _get_meta(cls, name: str) -> str | None:
+        with cls._lock:
+            row = cls._connect().execute("SELECT value FROM meta WHERE name = ?", (name,)).fetchone()
+        return row["value"] if row else None
+
+    @staticmethod
+    def _get_time_zone(user: dict):
+        """Time zone of the user's Jira profile, falling back to the local one."""
+        try:
+            return ZoneInfo(user.get("timeZone"))
+        except (KeyError, TypeError, ValueError):
+            return None
+
+    @classmethod
+    def _parse_updated(cls, value: str | None) -> datetime | None:
+        try:
+            return datetime.strptime(value, cls.UPDATED_FORMAT)
+        except (TypeError, ValueError):
+            return None
+
+    @staticmethod
+    def _set_meta(connection: sqlite3.Connection, name: str, value: str) -> None:
+        connection.execute("INSERT OR REPLACE INTO meta (name, value) VALUES (?, ?)", (name, value))
+
+    @staticmethod
+    def _to_row(issue: dict) -> tuple:
+        fields = issue.get("fields", {})
+        return (
+            issue["key"],
+            issue.get("id"),
+            fields.get("summary"),
+            (fields.get("status") or {}).get("name"),
+            (fields.get("parent") or {}).get("key"),
+            json.dumps(fields.get("labels") or []),
+            fields.get("updated"),
+            json.dumps(issue),
+        )
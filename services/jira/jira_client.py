@@ -0,0 +1,138 @@
+import random
+import threading
+import time
+import requests
+from concurrent.futures import ThreadPoolExecutor
+from enum import Enum
+from requests.adapters import HTTPAdapter
+from services.metrics.metrics import Metrics
+
+
+class JiraClientConfig(Enum):
+    MAX_CONCURRENCY = "jira_max_concurrency"
+
+
+class JiraClient:
+    """Pooled HTTP client for the Jira REST API with pagination, retries and bounded parallelism."""
+
+    DEFAULT_MAX_CONCURRENCY = 4
+    PAGE_SIZE = 100
+    MAX_RETRIES = 5
+    BACKOFF_BASE = 1.0
+    BACKOFF_MAX = 30.0
+    TIMEOUT = 30
+    RETRY_STATUSES = {429, 502, 503, 504}
+    IDEMPOTENT_METHODS = {"GET", "HEAD", "PUT", "DELETE", "OPTIONS"}
+
+    def __init__(self, base_url: str, headers: dict, max_concurrency: int = DEFAULT_MAX_CONCURRENCY) -> None:
+        self.base_url = base_url.rstrip("/")
+        self.max_concurrency = max(1, int(max_concurrency))
+        self.session = requests.Session()
+        self.session.headers.update(headers)
+
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.max_concurrency)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        self._executor = None
+        self._executor_lock = threading.Lock()
+
+    def request(self, method: str, path: str, **kwargs) -> requests.Response:
+        """
+        Send a request over the pooled session.
+        Rate limiting (429) is always retried with backoff; gateway errors only for idempotent methods.
+        """
+        url = path if path.startswith("http") else f"{self.base_url}{path}"
+        kwargs.setdefault("timeout", self.TIMEOUT)
+
+        for attempt in range(self.MAX_RETRIES + 1):
+            if Metrics.enabled:
+                start = time.perf_counter()
+                response = self.session.request(method, url, **kwargs)
+                Metrics.record("jira.http", time.perf_counter() - start)
+            else:
+                response = self.session.request(method, url, **kwargs)
+            if not self._should_retry(method, response) or attempt == self.MAX_RETRIES:
+                break
+            if Metrics.enabled:
+                Metrics.increment("jira.retries")
+            time.sleep(self._retry_delay(response, attempt))
+
+        response.raise_for_status()
+        return response
+
+    def get(self, path: str, **kwargs) -> dict:
+        return self._json(self.request("GET", path, **kwargs))
+
+    def post(self, path: str, **kwargs) -> dict:
+        return self._json(self.request("POST", path, **kwargs))
+
+    def put(self, path: str, **kwargs) -> dict:
+        return self._json(self.request("PUT", path, **kwargs))
+
+    def delete(self, path: str, **kwargs) -> dict:
+        return self._json(self.request("DELETE", path, **kwargs))
+
+    def paginate(self, path: str, items_key: str, params: dict = None, page_size: int = PAGE_SIZE):
+        """
+        Yield every item of a startAt/maxResults paginated endpoint, one page at a time.
+
+        :param path: Endpoint path, e.g. "/rest/api/3/search".
+        :param items_key: Key of the item list in each page, e.g. "issues".
+        :param params: Extra query parameters.
+        :param page_size: Requested maxResults per page.
+        """
+        start_at = 0
+        while True:
+            page = self.get(path, params={**(params or {}), "startAt": start_at, "maxResults": page_size})
+            items = page.get(items_key, [])
+            yield from items
+
+            start_at += len(items)
+            if not items or start_at >= page.get("total", 0):
+                return
+
+    def search(self, jql: str, fields: list = None, page_size: int = PAGE_SIZE):
+        """
+        Yield all issues matching `jql`, across every result page.
+
+        :param fields: Issue fields to return; None returns Jira's default set.
+        """
+        params = {"jql": jql}
+        if fields:
+            params["fields"] = ",".join(fields)
+        yield from self.paginate("/rest/api/3/search", "issues", params, page_size)
+
+    def map(self, fn, items) -> list:
+        """Run `fn` over `items` with at most `max_concurrency` requests in flight; results keep input order."""
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_concurrency, thread_name_prefix="waid-jira")
+        return list(self._executor.map(fn, items))
+
+    def close(self) -> None:
+        """Release pooled connections and worker threads."""
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False)
+                self._executor = None
+        self.session.close()
+
+    def _should_retry(self, method: str, response: requests.Response) -> bool:
+        if response.status_code == 429:
+            return True
+        return response.status_code in self.RETRY_STATUSES and method.upper() in self.IDEMPOTENT_METHODS
+
+    def _retry_delay(self, response: requests.Response, attempt: int) -> float:
+        """Honour Retry-After when present, otherwise exponential backoff with jitter."""
+        retry_after = response.headers.get("Retry-After")
+        if retry_after is not None:
+            try:
+                return min(float(retry_after), self.BACKOFF_MAX)
+            except ValueError:
+                pass
+        return min(self.BACKOFF_BASE * 2 ** attempt, self.BACKOFF_MAX) * random.uniform(0.5, 1.0)
+
+    @staticmethod
+    def _json(response: requests.Response) -> dict:
+        return response.json() if response.content else {}
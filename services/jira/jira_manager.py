@@ -1,8 +1,10 @@
 from enum import Enum
 import base64
-import requests
+import threading
 from datetime import datetime
 from services.config.config_manager import ConfigManager
+from services.jira.jira_client import JiraClient, JiraClientConfig
+from services.jira.issue_store import IssueStore
 
 
 class JiraManagerConfig(Enum):
@@ -15,14 +17,24 @@ class JiraManagerConfig(Enum):
 class JiraManager:
     """Handles interactions with the Jira REST API."""
 
+    MY_ISSUES_FILTER = "assignee = currentUser()"
+    MY_ISSUES_JQL = f"{MY_ISSUES_FILTER} ORDER BY updated DESC"
+
+    _client = None
+    _client_key = None
+    _client_lock = threading.Lock()
+
     @classmethod
-    def set_configuration(cls, config_obj: dict):
+    def set_configuration(cls, config_obj: dict) -> bool:
         """
         Securely store the configuration parameters for Jira.
+        :return: False if the config file could not be written.
         """
-        for key in JiraManagerConfig:
-            if key.value in config_obj:
-                ConfigManager.set(key.value, config_obj[key.value])
+        return ConfigManager.set_many({
+            key.value: config_obj[key.value]
+            for key in JiraManagerConfig
+            if key.value in config_obj
+        })
 
     @classmethod
     def get_configuration(cls) -> dict:
@@ -73,14 +85,58 @@ class JiraManager:
         return key
 
     @classmethod
-    def get_my_issues(cls):
+    def get_client(cls) -> JiraClient:
+        """
+        Return the shared pooled client, rebuilding it when the Jira configuration changes.
+        """
+        base_url = cls._get_base_url()
+        headers = cls._get_auth_headers()
+        max_concurrency = ConfigManager.get(JiraClientConfig.MAX_CONCURRENCY.value) or JiraClient.DEFAULT_MAX_CONCURRENCY
+        client_key = (base_url, headers["Authorization"], max_concurrency)
+
+        with cls._client_lock:
+            if cls._client is None or cls._client_key != client_key:
+                if cls._client is not None:
+                    cls._client.close()
+                cls._client = JiraClient(base_url, headers, max_concurrency)
+                cls._client_key = client_key
+            return cls._client
+
+    @classmethod
+    def iter_my_issues(cls, fields: list = None):
+        """
+        Stream issues assigned to the current user across all result pages.
+        :param fields: Issue fields to fetch; None fetches Jira's default set.
+        """
+        yield from cls.get_client().search(cls.MY_ISSUES_JQL, fields=fields)
+
+    @classmethod
+    def get_my_issues(cls, fields: list = None):
         """Fetch issues assigned to the current user."""
-        url = f"{cls._get_base_url()}/rest/api/3/search"
-        jql = "assignee = currentUser() ORDER BY updated DESC"
+        return list(cls.iter_my_issues(fields=fields))
 
-        response = requests.get(url, headers=cls._get_auth_headers(), params={"jql": jql})
-        response.raise_for_status()
-        return response.json().get("issues", [])
+    @classmethod
+    def sync_issues(cls, full: bool = False) -> int:
+        """
+        Bring the local issue store up to date with Jira.
+        Only issues updated since the last sync are downloaded unless `full` is set.
+        :return: Number of issues fetched.
+        """
+        return IssueStore.sync(cls.get_client(), cls.MY_ISSUES_FILTER, full=full)
+
+    @classmethod
+    def get_cached_issues(cls, status: str = None, parent_key: str = None) -> list:
+        """
+        Return issues assigned to the current user from the local store, without network access.
+        :param status: Only issues in this status.
+        :param parent_key: Only children of this issue.
+        """
+        return IssueStore.get_issues(status=status, parent_key=parent_key)
+
+    @classmethod
+    def get_cached_issue(cls, issue_key: str) -> dict | None:
+        """Return a single issue from the local store."""
+        return IssueStore.get_issue(issue_key)
 
     @classmethod
     def create_issue(cls, summary: str, description: str, project_key: str = None, issue_type: str = "Task"):
@@ -88,8 +144,6 @@ class JiraManager:
         if not project_key:
             project_key = cls._get_default_project_key()
 
-        url = f"{cls._get_base_url()}/rest/api/3/issue"
-
         payload = {
             "fields": {
                 "project": {"key": project_key},
@@ -99,25 +153,17 @@ class JiraManager:
             }
         }
 
-        response = requests.post(url, headers=cls._get_auth_headers(), json=payload)
-        response.raise_for_status()
-        return response.json()
+        return cls.get_client().post("/rest/api/3/issue", json=payload)
 
     @classmethod
     def add_comment(cls, issue_key: str, comment: str):
         """Add a comment to a Jira issue."""
-        url = f"{cls._get_base_url()}/rest/api/3/issue/{issue_key}/comment"
         payload = {"body": comment}
-
-        response = requests.post(url, headers=cls._get_auth_headers(), json=payload)
-        response.raise_for_status()
-        return response.json()
+        return cls.get_client().post(f"/rest/api/3/issue/{issue_key}/comment", json=payload)
 
     @classmethod
     def log_work(cls, issue_key: str, time_spent: str, comment: str = "", started: datetime = None):
         """Log time spent on a Jira issue."""
-        url = f"{cls._get_base_url()}/rest/api/3/issue/{issue_key}/worklog"
-
         worklog = {
             "timeSpent": time_spent,
         }
@@ -127,6 +173,4 @@ class JiraManager:
         if started:
             worklog["started"] = started.strftime("%Y-%m-%dT%H:%M:%S.000+0000")
 
-        response = requests.post(url, headers=cls._get_auth_headers(), json=worklog)
-        response.raise_for_status()
-        return response.json()
+        return cls.get_client().post(f"/rest/api/3/issue/{issue_key}/worklog", json=worklog)
@@ -0,0 +1,256 @@
+import hashlib
+import re
+from datetime import datetime, timedelta
+from typing import NamedTuple
+from services.jira.jira_client import JiraClient
+from services.jira.jira_manager import JiraManager
+
+
+class WorklogEntry(NamedTuple):
+    """Time to be logged on an issue."""
+
+    issue_key: str
+    started: datetime
+    seconds: int
+    comment: str = ""
+
+    @property
+    def marker(self) -> str:
+        """Idempotency marker, stable for the same issue and start minute."""
+        return self.get_marker()
+
+    def get_marker(self, occurrence: int = 0) -> str:
+        """
+        Marker of the `occurrence`-th entry (in start order) of this issue that starts
+        in the same minute, so that such entries do not overwrite each other.
+        """
+        key = f"{self.issue_key}|{self.started:%Y-%m-%dT%H:%M}"
+        if occurrence:
+            key += f"|{occurrence}"
+        digest = hashlib.sha1(key.encode("utf-8")).hexdigest()
+        return f"[waid:{digest[:12]}]"
+
+
+class WorklogSyncResult(NamedTuple):
+    created: list
+    updated: list
+    deleted: list
+    unchanged: list
+    failed: list
+
+
+class WorklogSync:
+    """
+    Reconciles locally derived worklogs with Jira: existing worklogs are fetched per
+    issue, and only missing or changed entries are written, in parallel over the
+    pooled client. Every written worklog carries a marker in its comment, so reruns
+    and retries update entries instead of duplicating them, and marked worklogs in
+    the synced range that no longer match an entry are deleted. Only worklogs of the
+    client's own account are considered, so other WAID users' worklogs on shared
+    issues are never touched. Jira stores minutes, so durations are rounded to them.
+    """
+
+    MARKER_PATTERN = re.compile(r"\[waid:[0-9a-f]{12}\]")
+    MIN_SECONDS = 60
+    MERGE_GAP = timedelta(minutes=5)
+    STARTED_FORMAT = "%Y-%m-%dT%H:%M:%S.%f%z"
+
+    @classmethod
+    def sync(cls, entries: list, client: JiraClient = None, dry_run: bool = False,
+             start: datetime = None, end: datetime = None) -> WorklogSyncResult:
+        """
+        Make Jira hold `entries`, and only them, between `start` and `end`.
+
+        :param entries: WorklogEntry list; entries shorter than MIN_SECONDS are skipped.
+        :param client: Client to use (JiraManager's shared client by default).
+        :param dry_run: Compute the diff without writing anything.
+        :param start: Start of the synced range; WAID worklogs starting in it that match
+            no entry are deleted. Defaults to the first entry's start.
+        :param end: End of the synced range, exclusive. Defaults to the last entry's end.
+            When `start` and `end` are given, issues the user logged work on in that range
+            are checked too, so time reattributed to another issue is removed from the old one.
+        :return: Created, updated and unchanged entries, deleted worklogs, and
+            (entry or worklog, exception) pairs for failed writes.
+        """
+        client = client or JiraManager.get_client()
+        account_id = client.get("/rest/api/3/myself").get("accountId")
+        entries = sorted((entry for entry in entries if entry.seconds >= cls.MIN_SECONDS), key=lambda e: e.started)
+        marked = cls._assign_markers(entries)
+
+        issue_keys = {entry.issue_key for entry in entries}
+        if start is not None and end is not None:
+            issue_keys.update(cls.get_logged_issue_keys(client, start, end))
+        if start is None and entries:
+            start = entries[0].started
+        if end is None and entries:
+            end = max(entry.started + timedelta(seconds=entry.seconds) for entry in entries)
+        issue_keys = sorted(issue_keys)
+        existing = dict(zip(issue_keys, client.map(lambda key: cls.get_waid_worklogs(client, key, account_id), issue_keys)))
+
+        creates, updates, unchanged = [], [], []
+        for entry, marker in marked:
+            worklog = existing[entry.issue_key].pop(marker, None)
+            if worklog is None:
+                creates.append((entry, marker))
+            elif worklog.get("timeSpentSeconds") != cls.round_seconds(entry.seconds) or cls.get_comment_text(worklog) != cls._comment(entry, marker):
+                updates.append((entry, marker, worklog["id"]))
+            else:
+                unchanged.append(entry)
+
+        # Whatever was not claimed by an entry is stale if it starts inside the range.
+        deletes = []
+        if start is not None and end is not None:
+            range_start, range_end = cls._aware(start), cls._aware(end)
+            for issue_key in issue_keys:
+                for worklog in existing[issue_key].values():
+                    started = cls.parse_started(worklog)
+                    if started is not None and range_start <= started < range_end:
+                        deletes.append((issue_key, worklog))
+
+        if dry_run:
+            return WorklogSyncResult(
+                [entry for entry, _ in creates], [entry for entry, _, _ in updates],
+                [worklog for _, worklog in deletes], unchanged, [],
+            )
+
+        def submit(operation):
+            kind, item, issue_key, marker, worklog_id = operation
+            path = f"/rest/api/3/issue/{issue_key}/worklog"
+            try:
+                if kind == "create":
+                    client.post(path, json=cls._payload(item, marker))
+                elif kind == "update":
+                    client.put(f"{path}/{worklog_id}", json=cls._payload(item, marker))
+                else:
+                    client.delete(f"{path}/{worklog_id}")
+                return None
+            except Exception as e:
+                return item, e
+
+        operations = (
+            [("create", entry, entry.issue_key, marker, None) for entry, marker in creates]
+            + [("update", entry, entry.issue_key, marker, worklog_id) for entry, marker, worklog_id in updates]
+            + [("delete", worklog, issue_key, None, worklog["id"]) for issue_key, worklog in deletes]
+        )
+        errors = [error for error in client.map(submit, operations) if error is not None]
+        failed = {id(item) for item, _ in errors}
+        return WorklogSyncResult(
+            [entry for entry, _ in creates if id(entry) not in failed],
+            [entry for entry, _, _ in updates if id(entry) not in failed],
+            [worklog for _, worklog in deletes if id(worklog) not in failed],
+            unchanged,
+            errors,
+        )
+
+    @classmethod
+    def get_waid_worklogs(cls, client: JiraClient, issue_key: str, account_id: str = None) -> dict:
+        """
+        Return {marker: worklog} for the worklogs WAID previously wrote on an issue.
+        Further worklogs carrying an already seen marker are keyed by their id, so that
+        sync treats them as stale.
+
+        :param account_id: Only worklogs authored by this Jira account.
+        """
+        worklogs = {}
+        for worklog in client.paginate(f"/rest/api/3/issue/{issue_key}/worklog", "worklogs", page_size=5000):
+            if account_id is not None and (worklog.get("author") or {}).get("accountId") != account_id:
+                continue
+            match = cls.MARKER_PATTERN.search(cls.get_comment_text(worklog))
+            if match:
+                key = match.group(0) if match.group(0) not in worklogs else worklog["id"]
+                worklogs[key] = worklog
+        return worklogs
+
+    @classmethod
+    def get_logged_issue_keys(cls, client: JiraClient, start: datetime, end: datetime) -> list:
+        """Keys of the issues the current user logged work on between `start` and `end`."""
+        jql = (
+            f'worklogAuthor = currentUser() AND worklogDate >= "{start:%Y-%m-%d}" '
+            f'AND worklogDate <= "{end:%Y-%m-%d}"'
+        )
+        return [issue["key"] for issue in client.search(jql, fields=["key"])]
+
+    @classmethod
+    def parse_started(cls, worklog: dict) -> datetime | None:
+        """Start time of a Jira worklog, or None if it is missing or malformed."""
+        try:
+            return datetime.strptime(worklog["started"], cls.STARTED_FORMAT)
+        except (KeyError, TypeError, ValueError):
+            return None
+
+    @classmethod
+    def entries_from_intervals(cls, intervals: list, matcher) -> list:
+        """
+        Turn activity intervals into worklog entries: each interval is attributed with
+        `matcher` (an IssueMatcher), and consecutive intervals of the same issue less
+        than MERGE_GAP apart are merged.
+        """
+        matches = matcher.match_batch([interval.title for interval in intervals])
+        entries = []
+        current = None
+        for interval, match in zip(intervals, matches):
+            if match is None:
+                continue
+            if current and current[0] == match.key and interval.start - current[2] <= cls.MERGE_GAP:
+                current[2] = interval.end
+                current[3] += interval.duration
+                continue
+            if current:
+                entries.append(WorklogEntry(current[0], current[1], int(current[3])))
+            current = [match.key, interval.start, interval.end, interval.duration]
+        if current:
+            entries.append(WorklogEntry(current[0], current[1], int(current[3])))
+        return entries
+
+    @classmethod
+    def get_comment_text(cls, worklog: dict) -> str:
+        """Plain text of a worklog comment, which API v3 returns as an ADF document."""
+        comment = worklog.get("comment")
+        if isinstance(comment, str) or comment is None:
+            return comment or ""
+
+        parts = []
+        def collect(node):
+            if node.get("type") == "text":
+                parts.append(node.get("text", ""))
+            for child in node.get("content", []):
+                collect(child)
+        collect(comment)
+        return "".join(parts)
+
+    @staticmethod
+    def _assign_markers(entries: list) -> list:
+        """Pair each entry (sorted by start) with its marker, numbering entries that share one."""
+        occurrences = {}
+        marked = []
+        for entry in entries:
+            base = entry.marker
+            occurrence = occurrences[base] = occurrences.get(base, -1) + 1
+            marked.append((entry, entry.get_marker(occurrence)))
+        return marked
+
+    @staticmethod
+    def round_seconds(seconds: int) -> int:
+        """Duration as Jira stores it: whole minutes, at least one."""
+        return max(60, round(seconds / 60) * 60)
+
+    @staticmethod
+    def _aware(moment: datetime) -> datetime:
+        """Naive datetimes are local time, as everywhere else in WAID."""
+        return moment if moment.tzinfo else moment.astimezone()
+
+    @staticmethod
+    def _comment(entry: WorklogEntry, marker: str) -> str:
+        return f"{entry.comment} {marker}".strip()
+
+    @classmethod
+    def _payload(cls, entry: WorklogEntry, marker: str) -> dict:
+        return {
+            "timeSpentSeconds": cls.round_seconds(entry.seconds),
+            "started": entry.started.astimezone().strftime("%Y-%m-%dT%H:%M:%S.000%z"),
+            "comment": {
+                "type": "doc",
+                "version": 1,
+                "content": [{"type": "paragraph", "content": [{"type": "text", "text": cls._comment(entry, marker)}]}],
+            },
+        }
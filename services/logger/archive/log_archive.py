@@ -0,0 +1,154 @@
+import gzip
+import io
+import json
+import os
+import tempfile
+import threading
+from services.logger.logger import Logger
+
+
+class LogArchive:
+    """
+    Monthly archives of closed day logs.
+
+    `archive/YYYY-MM.arc` is a concatenation of gzip members, one per day file, and
+    `archive/YYYY-MM.idx` maps each original file name to its (offset, length, size)
+    inside the archive, so a single day can be read without touching the others.
+    """
+
+    ARCHIVE_EXTENSION = ".arc"
+    INDEX_EXTENSION = ".idx"
+
+    _lock = threading.Lock()
+    _indexes = {}
+
+    @classmethod
+    def get_archive_dir(cls) -> str:
+        return os.path.join(Logger.LOG_DIR, "archive")
+
+    @classmethod
+    def add(cls, path: str) -> None:
+        """
+        Compress a closed day file into its month's archive and remove the original.
+        The original is only deleted once the archive and its index are safely on disk.
+        """
+        name = os.path.basename(path)
+        month = name[:7]
+        archive_path = os.path.join(cls.get_archive_dir(), month + cls.ARCHIVE_EXTENSION)
+        os.makedirs(cls.get_archive_dir(), exist_ok=True)
+
+        with open(path, "rb") as f:
+            data = f.read()
+        member = gzip.compress(data)
+
+        with cls._lock:
+            index = dict(cls._load_index(month))
+            with open(archive_path, "ab") as f:
+                offset = f.tell()
+                f.write(member)
+                f.flush()
+                os.fsync(f.fileno())
+            index[name] = [offset, len(member), len(data)]
+            cls._save_index(month, index)
+        os.remove(path)
+
+    @classmethod
+    def list_files(cls) -> dict:
+        """Return {day file name: archive month} for every archived file."""
+        archive_dir = cls.get_archive_dir()
+        if not os.path.isdir(archive_dir):
+            return {}
+        files = {}
+        for name in os.listdir(archive_dir):
+            if name.endswith(cls.INDEX_EXTENSION):
+                month = name[:-len(cls.INDEX_EXTENSION)]
+                files.update(dict.fromkeys(cls._load_index(month), month))
+        return files
+
+    @classmethod
+    def list_months(cls) -> list:
+        """Return the archived months (YYYY-MM), oldest first."""
+        archive_dir = cls.get_archive_dir()
+        if not os.path.isdir(archive_dir):
+            return []
+        return sorted(
+            name[:-len(cls.ARCHIVE_EXTENSION)]
+            for name in os.listdir(archive_dir)
+            if name.endswith(cls.ARCHIVE_EXTENSION)
+        )
+
+    @classmethod
+    def get_month_size(cls, month: str) -> int:
+        """Size on disk of a month's archive."""
+        path = os.path.join(cls.get_archive_dir(), month + cls.ARCHIVE_EXTENSION)
+        return os.path.getsize(path) if os.path.exists(path) else 0
+
+    @classmethod
+    def remove_month(cls, month: str) -> None:
+        """Delete a month's archive and index."""
+        with cls._lock:
+            for extension in (cls.INDEX_EXTENSION, cls.ARCHIVE_EXTENSION):
+                path = os.path.join(cls.get_archive_dir(), month + extension)
+                if os.path.exists(path):
+                    os.remove(path)
+            cls._indexes.pop(month, None)
+
+    @classmethod
+    def open_log(cls, path: str):
+        """
+        Open a day log for binary reading, from the log directory or, if it was
+        archived, from its month's archive.
+        """
+        if os.path.exists(path):
+            return open(path, "rb")
+        entry = cls._find(path)
+        if entry is None:
+            raise FileNotFoundError(path)
+        archive_path, offset, length, _ = entry
+        with open(archive_path, "rb") as f:
+            f.seek(offset)
+            return io.BytesIO(gzip.decompress(f.read(length)))
+
+    @classmethod
+    def get_log_size(cls, path: str) -> int:
+        """Uncompressed size of a live or archived day log."""
+        if os.path.exists(path):
+            return os.path.getsize(path)
+        entry = cls._find(path)
+        if entry is None:
+            raise FileNotFoundError(path)
+        return entry[3]
+
+    @classmethod
+    def _find(cls, path: str) -> tuple | None:
+        name = os.path.basename(path)
+        month = name[:7]
+        entry = cls._load_index(month).get(name)
+        if entry is None:
+            return None
+        return (os.path.join(cls.get_archive_dir(), month + cls.ARCHIVE_EXTENSION), *entry)
+
+    @classmethod
+    def _load_index(cls, month: str) -> dict:
+        """Read a month's index, cached until the file changes."""
+        path = os.path.join(cls.get_archive_dir(), month + cls.INDEX_EXTENSION)
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except FileNotFoundError:
+            return {}
+        cached = cls._indexes.get(month)
+        if cached is None or cached[0] != mtime:
+            with open(path, "r", encoding="utf-8") as f:
+                cached = cls._indexes[month] = (mtime, json.load(f))
+        return cached[1]
+
+    @classmethod
+    def _save_index(cls, month: str, index: dict) -> None:
+        path = os.path.join(cls.get_archive_dir(), month + cls.INDEX_EXTENSION)
+        fd, tmp_path = tempfile.mkstemp(dir=cls.get_archive_dir(), suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(index, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+        cls._indexes.pop(month, None)
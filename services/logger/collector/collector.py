@@ -0,0 +1,153 @@
+import atexit
+import os
+import signal
+import subprocess
+import sys
+import threading
+import time
+from services.logger.collector.ring_buffer import RingBuffer
+from services.logger.compact.compact_log import CompactLog
+from services.logger.writer.log_writer import LogWriter
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+
+class Collector:
+    """
+    Runs loggers in a small dedicated process so that the tray, the settings UI or
+    a slow AI call in this process can never delay event capture.
+    The collector hands every log record to a shared-memory ring buffer; a single
+    consumer thread here drains it into LogWriter, which owns all file writes.
+    Compact logs are appended to by whichever process runs the window logger, so
+    their cached state is reset whenever the collector starts or stops.
+    """
+
+    RING_CAPACITY = 4 * 1024 * 1024
+    POLL_INTERVAL = 0.05
+    STOP_TIMEOUT = 5.0
+
+    _process = None
+    _logger_names = []
+    _ring = None
+    _consumer = None
+    _stop_event = threading.Event()
+    _lock = threading.Lock()
+    _atexit_registered = False
+
+    @classmethod
+    def is_running(cls) -> bool:
+        return cls._process is not None
+
+    @classmethod
+    def get_logger_names(cls) -> list:
+        """Loggers the running collector was started with."""
+        return list(cls._logger_names)
+
+    @classmethod
+    def start(cls, logger_names: list) -> None:
+        """Start the collector process running the given loggers."""
+        with cls._lock:
+            if cls._process is not None:
+                return
+            # The collector picks up compact log state from disk, so it must be complete.
+            LogWriter.flush()
+            CompactLog.reset_state()
+            cls._ring = RingBuffer.create(cls.RING_CAPACITY)
+            cls._logger_names = list(logger_names)
+            cls._process = subprocess.Popen(
+                [sys.executable, "-m", "services.logger.collector.collector", cls._ring.name, *logger_names],
+                stdin=subprocess.PIPE, cwd=ROOT_DIR,
+            )
+            cls._stop_event.clear()
+            cls._consumer = threading.Thread(target=cls._consume, name="waid-collector-consumer", daemon=True)
+            cls._consumer.start()
+            if not cls._atexit_registered:
+                atexit.register(cls.stop)
+                cls._atexit_registered = True
+
+    @classmethod
+    def stop(cls) -> None:
+        """Stop the collector, letting its loggers log their final events, and drain the ring."""
+        with cls._lock:
+            if cls._process is None:
+                return
+            # Closing stdin is the stop request.
+            cls._process.stdin.close()
+            try:
+                cls._process.wait(cls.STOP_TIMEOUT)
+            except subprocess.TimeoutExpired:
+                cls._process.kill()
+                cls._process.wait()
+
+            cls._stop_event.set()
+            cls._consumer.join()
+            cls._drain()
+            # Write the drained records even if LogWriter's atexit close has already run.
+            LogWriter.flush()
+            # The collector appended to the compact logs; reload their state from disk.
+            CompactLog.reset_state()
+            if cls._ring.full_count:
+                print(f"Collector waited {cls._ring.full_count} times on a full ring buffer")
+            cls._ring.close()
+            cls._process = cls._ring = cls._consumer = None
+            cls._logger_names = []
+
+    @classmethod
+    def _consume(cls) -> None:
+        while not cls._stop_event.is_set():
+            if not cls._drain():
+                cls._stop_event.wait(cls.POLL_INTERVAL)
+
+    @classmethod
+    def _drain(cls) -> int:
+        count = 0
+        while (record := cls._ring.get()) is not None:
+            path, _, data = record.partition(b"\0")
+            LogWriter.write(path.decode("utf-8"), data)
+            count += 1
+        return count
+
+
+def run(ring_name: str, logger_names: list) -> None:
+    """Collector process entry point: run the loggers until stdin closes or SIGTERM arrives."""
+    from services.logger.log_manager import LogManager
+
+    stop_event = threading.Event()
+    # The main process coordinates shutdown; Ctrl+C reaches the whole process group.
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    signal.signal(signal.SIGTERM, lambda signum, frame: stop_event.set())
+
+    ring = RingBuffer.attach(ring_name)
+    produce_lock = threading.Lock()
+    parent_pid = os.getppid()
+
+    def sink(path: str, data: bytes) -> None:
+        record = path.encode("utf-8") + b"\0" + data
+        # Loggers write from several threads; the ring has a single producer.
+        with produce_lock:
+            # Records are never dropped: a lost title definition would corrupt the rest of
+            # the compact log. Wait for the consumer instead, unless it has gone away.
+            while not ring.put(record):
+                if os.getppid() != parent_pid:
+                    return
+                time.sleep(Collector.POLL_INTERVAL)
+
+    LogWriter.set_sink(sink)
+
+    def wait_for_stdin_close() -> None:
+        sys.stdin.buffer.read()
+        stop_event.set()
+
+    threading.Thread(target=wait_for_stdin_close, daemon=True).start()
+
+    loggers = [logger for logger in map(LogManager.get_logger, logger_names) if logger]
+    for logger in loggers:
+        logger.start()
+    stop_event.wait()
+    for logger in loggers:
+        logger.stop()
+    ring.close()
+
+
+if __name__ == "__main__":
+    run(sys.argv[1], sys.argv[2:])
@@ -0,0 +1,125 @@
+import struct
+import zlib
+from multiprocessing import resource_tracker, shared_memory
+
+
+class RingBuffer:
+    """
+    Single-producer, single-consumer byte ring in shared memory.
+
+    Records are prefixed with their length and a checksum, and may wrap around
+    the end of the data area. The write and read positions only ever grow (the
+    offset is position modulo capacity) and live on separate cache lines; each
+    side only writes its own position, after the data it covers, so no lock is
+    needed.
+
+    Shared memory gives no ordering guarantee between processes on weakly ordered
+    CPUs such as ARM: the consumer may see the advanced write position before the
+    record bytes. The checksum, a CRC-32 over the record's position and bytes,
+    catches that; the record is then left for the next `get` instead of being
+    returned torn (the position makes a stale record from an earlier lap fail the
+    check too). The consumer only advances its position once the check passed.
+    A producer that finds the ring full is told so, and the event is counted;
+    retrying is up to it.
+    """
+
+    WRITE_OFFSET = 0
+    FULL_OFFSET = 8
+    READ_OFFSET = 64
+    DATA_OFFSET = 128
+    HEADER = struct.Struct("<II")
+    POSITION = struct.Struct("<Q")
+
+    def __init__(self, memory: shared_memory.SharedMemory, owner: bool) -> None:
+        self.memory = memory
+        self.owner = owner
+        self.buffer = memory.buf
+        self.capacity = memory.size - self.DATA_OFFSET
+
+    @classmethod
+    def create(cls, capacity: int) -> "RingBuffer":
+        """Allocate a new ring; the creator unlinks it on close."""
+        memory = shared_memory.SharedMemory(create=True, size=cls.DATA_OFFSET + capacity)
+        memory.buf[:cls.DATA_OFFSET] = bytes(cls.DATA_OFFSET)
+        return cls(memory, owner=True)
+
+    @classmethod
+    def attach(cls, name: str) -> "RingBuffer":
+        """Open a ring created by another process."""
+        memory = shared_memory.SharedMemory(name=name)
+        # Python < 3.13 registers attached segments too and would unlink the creator's ring on exit.
+        resource_tracker.unregister(memory._name, "shared_memory")
+        return cls(memory, owner=False)
+
+    @property
+    def name(self) -> str:
+        return self.memory.name
+
+    @property
+    def full_count(self) -> int:
+        """Number of times a record did not fit because the ring was full."""
+        return self._get_position(self.FULL_OFFSET)
+
+    def put(self, record: bytes) -> bool:
+        """Append a record (producer side). Returns False if it did not fit yet."""
+        size = self.HEADER.size + len(record)
+        if size > self.capacity:
+            raise ValueError(f"Record of {len(record)} bytes does not fit in the ring")
+        write = self._get_position(self.WRITE_OFFSET)
+        if self.capacity - (write - self._get_position(self.READ_OFFSET)) < size:
+            self._set_position(self.FULL_OFFSET, self.full_count + 1)
+            return False
+
+        self._copy_in(write, self.HEADER.pack(len(record), self._checksum(write, record)))
+        self._copy_in(write + self.HEADER.size, record)
+        self._set_position(self.WRITE_OFFSET, write + size)
+        return True
+
+    def get(self) -> bytes | None:
+        """
+        Remove and return the oldest record (consumer side), or None if the ring is
+        empty or the oldest record is not fully visible yet.
+        """
+        read = self._get_position(self.READ_OFFSET)
+        write = self._get_position(self.WRITE_OFFSET)
+        if read == write:
+            return None
+
+        length, checksum = self.HEADER.unpack(self._copy_out(read, self.HEADER.size))
+        if self.HEADER.size + length > write - read:
+            return None
+        record = self._copy_out(read + self.HEADER.size, length)
+        if self._checksum(read, record) != checksum:
+            return None
+        self._set_position(self.READ_OFFSET, read + self.HEADER.size + length)
+        return record
+
+    def close(self) -> None:
+        self.buffer = None
+        self.memory.close()
+        if self.owner:
+            self.memory.unlink()
+
+    def _checksum(self, position: int, record: bytes) -> int:
+        return zlib.crc32(record, zlib.crc32(self.POSITION.pack(position)))
+
+    def _get_position(self, offset: int) -> int:
+        return self.POSITION.unpack_from(self.buffer, offset)[0]
+
+    def _set_position(self, offset: int, value: int) -> None:
+        self.POSITION.pack_into(self.buffer, offset, value)
+
+    def _copy_in(self, position: int, data: bytes) -> None:
+        start = position % self.capacity
+        first = min(len(data), self.capacity - start)
+        self.buffer[self.DATA_OFFSET + start:self.DATA_OFFSET + start + first] = data[:first]
+        if first < len(data):
+            self.buffer[self.DATA_OFFSET:self.DATA_OFFSET + len(data) - first] = data[first:]
+
+    def _copy_out(self, position: int, length: int) -> bytes:
+        start = position % self.capacity
+        first = min(length, self.capacity - start)
+        data = bytes(self.buffer[self.DATA_OFFSET + start:self.DATA_OFFSET + start + first])
+        if first < length:
+            data += bytes(self.buffer[self.DATA_OFFSET:self.DATA_OFFSET + length - first])
+        return data
@@ -0,0 +1,246 @@
+import os
+import threading
+import time
+from services.logger.logger import Logger
+from services.logger.archive.log_archive import LogArchive
+from services.logger.writer.log_writer import LogWriter
+
+
+class CompactLog:
+    """
+    Binary storage for window events: one `.wlog` file per day.
+
+    The file is a stream of varint-encoded records. A title record defines the next
+    title id; an event record stores the seconds since the previous event (zigzag
+    encoded) and a title id, so a recurring title costs two or three bytes. Marker
+    records (logger start/stop) are encoded like events, with the marker name interned
+    in the same dictionary. App event records add the id of the application name,
+    also interned there, so an app costs one more byte per event.
+    """
+
+    EXTENSION = ".wlog"
+    MAGIC = b"WAIDLOG1"
+    TITLE = 0
+    EVENT = 1
+    MARKER = 2
+    APP_EVENT = 3
+
+    _lock = threading.Lock()
+    _states = {}
+
+    @classmethod
+    def get_filepath(cls, day: str = None) -> str:
+        """Return the compact log path for `day` (YYYY-MM-DD), today by default."""
+        return os.path.join(Logger.LOG_DIR, f"{day or time.strftime('%Y-%m-%d')}{cls.EXTENSION}")
+
+    @classmethod
+    def log(cls, title: str, epoch: int = None, app: str = None) -> None:
+        """Queue a window event, optionally with its application, for today's compact log."""
+        cls.append(cls.get_filepath(), title, int(time.time()) if epoch is None else epoch, app=app)
+
+    @classmethod
+    def log_marker(cls, name: str, epoch: int = None) -> None:
+        """Queue a marker such as "start" or "stop" for today's compact log."""
+        cls.append(cls.get_filepath(), name, int(time.time()) if epoch is None else epoch, marker=True)
+
+    @classmethod
+    def append(cls, path: str, title: str, epoch: int, marker: bool = False, app: str = None) -> None:
+        """Encode one event (or marker) and hand it to the background writer."""
+        with cls._lock:
+            state = cls._states.get(path)
+            if state is None:
+                state = cls._states[path] = cls._load_state(path)
+
+            record = bytearray()
+            if not state["written"]:
+                record += cls.MAGIC
+                state["written"] = True
+
+            title_id = cls._intern(record, state["titles"], title)
+            app_id = cls._intern(record, state["titles"], app) if app and not marker else None
+
+            cls._write_varint(record, cls.MARKER if marker else cls.EVENT if app_id is None else cls.APP_EVENT)
+            cls._write_varint(record, cls._zigzag(epoch - state["epoch"]))
+            cls._write_varint(record, title_id)
+            if app_id is not None:
+                cls._write_varint(record, app_id)
+            state["epoch"] = epoch
+
+            LogWriter.write(path, bytes(record))
+
+    @classmethod
+    def reset_state(cls) -> None:
+        """
+        Forget the cached state of every file, so the next append reloads it from disk.
+        Call this when another process may have appended to the compact logs.
+        """
+        with cls._lock:
+            cls._states.clear()
+
+    @classmethod
+    def iter_file(cls, path: str):
+        """Yield (epoch, title) for every window event in a compact log file."""
+        for epoch, title, marker, _, _ in cls.iter_records(path):
+            if not marker:
+                yield epoch, title
+
+    @classmethod
+    def iter_records(cls, path: str):
+        """Yield (epoch, title or marker name, is_marker, end_offset, app or None) for every record."""
+        with LogArchive.open_log(path) as f:
+            data = f.read()
+        yield from cls._decode(data)
+
+    @classmethod
+    def convert(cls, log_path: str, remove: bool = True) -> str:
+        """
+        Convert a text `.log` file into a compact `.wlog` file.
+        Lines that are not window events stay in the text file; it is deleted if none remain.
+
+        :param log_path: Path of the text log to convert.
+        :param remove: Drop converted lines from the text log.
+        :return: Path of the compact log.
+        """
+        # Imported here because the reader itself decodes compact logs.
+        from services.logger.reader.log_reader import LogReader
+
+        day = os.path.basename(log_path)[:-len(LogReader.LOG_EXTENSION)]
+        compact_path = cls.get_filepath(day)
+        remaining = []
+
+        with LogArchive.open_log(log_path) as f:
+            for line in f:
+                event = LogReader.parse_line(line)
+                if event is not None and event.window_title is not None:
+                    cls.append(compact_path, event.window_title, int(event.timestamp.timestamp()), app=event.data.get("app"))
+                elif event is not None and event.marker is not None:
+                    cls.append(compact_path, event.marker, int(event.timestamp.timestamp()), marker=True)
+                else:
+                    remaining.append(line)
+        LogWriter.flush(sync=True)
+
+        if remove:
+            if remaining:
+                with open(log_path, "wb") as f:
+                    f.writelines(remaining)
+            else:
+                os.remove(log_path)
+        return compact_path
+
+    @classmethod
+    def convert_all(cls, remove: bool = True) -> list:
+        """Convert every closed (not today's) text log. Returns the compact log paths."""
+        from services.logger.reader.log_reader import LogReader
+
+        today = Logger.get_log_filepath()
+        return [
+            cls.convert(path, remove=remove)
+            for path in LogReader.get_log_files()
+            if path.endswith(LogReader.LOG_EXTENSION) and path != today and os.path.exists(path)
+        ]
+
+    @classmethod
+    def _load_state(cls, path: str) -> dict:
+        """Rebuild the title dictionary of an existing file so appends can continue it."""
+        LogWriter.flush()
+        state = {"titles": {}, "epoch": 0, "written": False}
+        if not os.path.exists(path):
+            return state
+
+        with open(path, "rb") as f:
+            data = f.read()
+        end = len(cls.MAGIC) if data.startswith(cls.MAGIC) else 0
+        for _, _, _, end, _ in cls._decode(data):
+            pass
+
+        if end < len(data):
+            # Drop a record cut short by a crash so new records stay aligned.
+            with open(path, "r+b") as f:
+                f.truncate(end)
+            data = data[:end]
+
+        for epoch, _, _, _, _ in cls._decode(data, state["titles"]):
+            state["epoch"] = epoch
+        state["written"] = end > 0
+        return state
+
+    @classmethod
+    def _decode(cls, data: bytes, title_ids: dict = None):
+        """Yield (epoch, title, is_marker, end_offset, app) per record, stopping at a truncated one."""
+        if not data.startswith(cls.MAGIC):
+            return
+        titles = []
+        epoch = 0
+        position = len(cls.MAGIC)
+        size = len(data)
+
+        read_varint = cls._read_varint
+        try:
+            while position < size:
+                # Single-byte varints are by far the most common, so they are decoded inline.
+                tag = data[position]
+                position += 1
+                if tag == cls.EVENT or tag == cls.MARKER or tag == cls.APP_EVENT:
+                    delta = data[position]
+                    if delta < 0x80:
+                        position += 1
+                    else:
+                        delta, position = read_varint(data, position)
+                    title_id = data[position]
+                    if title_id < 0x80:
+                        position += 1
+                    else:
+                        title_id, position = read_varint(data, position)
+                    app = None
+                    if tag == cls.APP_EVENT:
+                        app_id, position = read_varint(data, position)
+                        app = titles[app_id]
+                    epoch += delta >> 1 if not delta & 1 else -((delta + 1) >> 1)
+                    yield epoch, titles[title_id], tag == cls.MARKER, position, app
+                elif tag == cls.TITLE:
+                    length, position = read_varint(data, position)
+                    if position + length > size:
+                        return
+                    title = data[position:position + length].decode("utf-8", errors="replace")
+                    position += length
+                    if title_ids is not None:
+                        title_ids[title] = len(titles)
+                    titles.append(title)
+                else:
+                    return
+        except IndexError:
+            return
+
+    @classmethod
+    def _intern(cls, record: bytearray, strings: dict, value: str) -> int:
+        """Id of a string in the file's dictionary, writing a definition record on first use."""
+        string_id = strings.get(value)
+        if string_id is None:
+            string_id = strings[value] = len(strings)
+            encoded = value.encode("utf-8")
+            cls._write_varint(record, cls.TITLE)
+            cls._write_varint(record, len(encoded))
+            record += encoded
+        return string_id
+
+    @staticmethod
+    def _write_varint(buffer: bytearray, value: int) -> None:
+        while value > 0x7F:
+            buffer.append((value & 0x7F) | 0x80)
+            value >>= 7
+        buffer.append(value)
+
+    @staticmethod
+    def _read_varint(data: bytes, position: int) -> tuple:
+        result = shift = 0
+        while True:
+            byte = data[position]
+            position += 1
+            result |= (byte & 0x7F) << shift
+            if byte < 0x80:
+                return result, position
+            shift += 7
+
+    @staticmethod
+    def _zigzag(value: int) -> int:
+        return value << 1 if value >= 0 else ((-value) << 1) - 1
@@ -1,20 +1,53 @@
 import os
+import re
+import threading
+from datetime import datetime
 from enum import Enum
 from services.config.config_manager import ConfigManager
-from services.logger.window.window_logger import WindowLogger  
+from services.config.config_watcher import ConfigWatcher
 from services.logger.logger import Logger
+from services.logger.writer.log_writer import LogWriter
+from services.logger.reader.log_reader import LogReader
+from services.logger.collector.collector import Collector
 
 class LogManagerConfig(Enum):
     ACTIVE_LOGGERS = "active_loggers"
+    MODE = "log_manager_mode"
+
+class LogManagerMode(Enum):
+    IN_PROCESS = "in_process"
+    COLLECTOR = "collector"
+
+def _window_logger() -> Logger:
+    from services.logger.window.window_logger import WindowLogger
+    return WindowLogger()
 
 class LogManager:
     """Manages multiple loggers and provides a centralized logging mechanism."""
 
+    # Logger factories, so that a logger's dependencies are only imported when it is started.
     _available_loggers = {
-        "window_logger": WindowLogger(),
-        # Add more loggers here, e.g., "keyboard_logger": KeyboardLogger()
+        "window_logger": _window_logger,
+        # Add more loggers here, e.g., "keyboard_logger": _keyboard_logger
     }
 
+    _loggers = {}
+    _running = set()
+    _started = False
+    _subscribed = False
+    _lock = threading.RLock()
+
+    @classmethod
+    def get_logger(cls, logger_name: str) -> Logger | None:
+        """
+        Get a logger by name, creating it on first use.
+        :return: The logger, or None if no such logger is available.
+        """
+        logger = cls._loggers.get(logger_name)
+        if logger is None and logger_name in cls._available_loggers:
+            logger = cls._loggers[logger_name] = cls._available_loggers[logger_name]()
+        return logger
+
     @classmethod
     def get_loggers(cls) -> dict:
         """
@@ -27,11 +60,12 @@ class LogManager:
     @classmethod
     def set_active_loggers(cls, logger_names: list) -> None:
         """
-        Set which loggers should be active and restart logging.
+        Set which loggers should be active; only loggers whose state changes are started or stopped.
+        The change reaches running loggers through the config watcher subscription, as
+        changes made by other processes do, so it is applied exactly once.
         :param logger_names: List of logger names to activate.
         """
         ConfigManager.set(LogManagerConfig.ACTIVE_LOGGERS.value, logger_names)
-        cls.restart()
 
     @classmethod
     def get_active_loggers(cls) -> list:
@@ -45,27 +79,86 @@ class LogManager:
             ConfigManager.set(LogManagerConfig.ACTIVE_LOGGERS.value, active_loggers)  
         return active_loggers
 
+    @classmethod
+    def get_mode(cls) -> LogManagerMode:
+        """Whether loggers run in this process or in a dedicated collector process."""
+        if ConfigManager.get(LogManagerConfig.MODE.value) == LogManagerMode.COLLECTOR.value:
+            return LogManagerMode.COLLECTOR
+        return LogManagerMode.IN_PROCESS
+
     @classmethod
     def start(cls) -> None:
-        """Start only the loggers selected by the user (all by default)."""
-        for logger_name in cls.get_active_loggers():
-            logger = cls._available_loggers.get(logger_name)
-            if logger:
-                logger.start()
+        """
+        Start only the loggers selected by the user (all by default), and follow
+        later changes to the selection, including ones made by other processes.
+        """
+        with cls._lock:
+            if not cls._subscribed:
+                ConfigWatcher.subscribe([LogManagerConfig.ACTIVE_LOGGERS.value], cls.on_active_loggers_changed)
+                ConfigWatcher.subscribe([LogManagerConfig.MODE.value], cls.on_mode_changed)
+                cls._subscribed = True
+            cls._started = True
+            cls.apply_active_loggers()
 
     @classmethod
     def stop(cls) -> None:
-        """Stop only the loggers that were started."""
-        for logger_name in cls.get_active_loggers():
-            logger = cls._available_loggers.get(logger_name)
-            if logger:
-                logger.stop()
+        """Stop the loggers that were started and persist what they logged."""
+        with cls._lock:
+            cls._started = False
+            Collector.stop()
+            for logger_name in cls._running:
+                cls._loggers[logger_name].stop()
+            cls._running.clear()
+            LogWriter.flush(sync=True)
 
     @classmethod
     def restart(cls) -> None:
         """Restart all active loggers (stop and start again)."""
-        cls.stop()
-        cls.start()
+        with cls._lock:
+            cls.stop()
+            cls.start()
+
+    @classmethod
+    def apply_active_loggers(cls) -> None:
+        """
+        Bring running loggers in line with the configured selection, starting and
+        stopping only those that differ. In collector mode the collector process
+        runs a fixed set, so it is restarted when the set changes.
+        """
+        with cls._lock:
+            if not cls._started:
+                return
+            wanted = [name for name in cls.get_active_loggers() if name in cls._available_loggers]
+
+            if cls.get_mode() == LogManagerMode.COLLECTOR:
+                if Collector.is_running() and Collector.get_logger_names() == wanted:
+                    return
+                Collector.stop()
+                Collector.start(wanted)
+                return
+
+            for logger_name in [name for name in cls._running if name not in wanted]:
+                cls._loggers[logger_name].stop()
+                cls._running.discard(logger_name)
+            for logger_name in wanted:
+                if logger_name not in cls._running:
+                    cls.get_logger(logger_name).start()
+                    cls._running.add(logger_name)
+
+    @classmethod
+    def on_active_loggers_changed(cls, changes: dict) -> None:
+        cls.apply_active_loggers()
+
+    @classmethod
+    def on_mode_changed(cls, changes: dict) -> None:
+        """
+        Switching between in-process and collector mode needs a full restart.
+        Both processes append to the same compact logs; Collector.start and
+        Collector.stop flush and reset their cached state, so the switch is safe live.
+        """
+        with cls._lock:
+            if cls._started:
+                cls.restart()
 
     @classmethod
     def get_all_logs(cls) -> list:
@@ -74,9 +167,22 @@ class LogManager:
         :return: List of log messages.
         """
         log_file_path = Logger.get_log_filepath()
+        LogWriter.flush()
 
         if not os.path.exists(log_file_path):
             return []
 
         with open(log_file_path, "r") as f:
             return f.readlines()
+
+    @classmethod
+    def iter_logs(cls, start: datetime = None, end: datetime = None, title: str = None, pattern: str | re.Pattern = None):
+        """
+        Stream parsed log events across all log files in a date range.
+        :param start: Only events at or after this time.
+        :param end: Only events before this time.
+        :param title: Only events whose window title contains this substring.
+        :param pattern: Only events whose window title matches this regex.
+        :return: Iterator of LogEvent.
+        """
+        return LogReader.iter_events(start, end, title=title, pattern=pattern)
@@ -1,6 +1,8 @@
 import os
 import time
 from abc import ABC, abstractmethod
+from services.logger.writer.log_writer import LogWriter
+from services.metrics.metrics import Metrics
 
 
 class Logger(ABC):
@@ -20,12 +22,14 @@ class Logger(ABC):
         return os.path.join(Logger.LOG_DIR, Logger.get_log_filename())
 
     @staticmethod
-    def log(message: str) -> None:
-        """Write logs to a dated file inside the waid_logs folder."""
-        log_file_path = Logger.get_log_filepath()
-
-        with open(log_file_path, "a") as f:
-            f.write(f"{time.strftime('%Y-%m-%d %H:%M:%S')} - {message}\n")
+    @Metrics.timed("logger.log")
+    def log(message: str, epoch: float = None) -> None:
+        """
+        Write logs to a dated file inside the waid_logs folder.
+        The line is queued for the background writer, so this never blocks on disk I/O.
+        :param epoch: Time to stamp the line with, if not now.
+        """
+        LogWriter.write(Logger.get_log_filepath(), f"{time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(epoch))} - {message}\n")
 
     @abstractmethod
     def start(self) -> None:
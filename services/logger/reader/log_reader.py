@@ -0,0 +1,201 @@
+import heapq
+import itertools
+import json
+import os
+import re
+from datetime import datetime
+from typing import NamedTuple
+from services.logger.logger import Logger
+from services.logger.archive.log_archive import LogArchive
+from services.logger.compact.compact_log import CompactLog
+from services.logger.writer.log_writer import LogWriter
+
+
+class LogEvent(NamedTuple):
+    """A single parsed log line, or a decoded compact record (whose message is the window title)."""
+
+    timestamp: datetime
+    message: str
+    data: dict | None
+
+    @property
+    def window_title(self) -> str | None:
+        return self.data.get("window_title") if self.data else None
+
+    @property
+    def marker(self) -> str | None:
+        """Name of a logger state marker such as "start" or "stop"."""
+        return self.data.get("event") if self.data else None
+
+
+class LogReader:
+    """Streams parsed events out of the dated log files in Logger.LOG_DIR."""
+
+    LOG_EXTENSION = ".log"
+    EXTENSIONS = (LOG_EXTENSION, CompactLog.EXTENSION)
+    TIMESTAMP_LENGTH = len("YYYY-MM-DD HH:MM:SS")
+    SEPARATOR = " - "
+
+    @classmethod
+    def iter_events(cls, start: datetime = None, end: datetime = None, title: str = None, pattern: str | re.Pattern = None):
+        """
+        Lazily yield events in chronological order across every day in the range.
+        Memory use does not grow with the number of days scanned.
+
+        :param start: Only events at or after this time.
+        :param end: Only events strictly before this time.
+        :param title: Only events whose window title contains this substring.
+        :param pattern: Only events whose window title matches this regex.
+        """
+        LogWriter.flush()
+        for _, paths in itertools.groupby(cls.get_log_files(start, end), key=cls.get_day):
+            streams = [cls.iter_file_events(path, start, end, title, pattern) for path in paths]
+            if len(streams) == 1:
+                yield from streams[0]
+            else:
+                # Text and compact logs of the same day are interleaved by time.
+                yield from heapq.merge(*streams, key=lambda event: event.timestamp)
+
+    @classmethod
+    def get_log_files(cls, start: datetime = None, end: datetime = None) -> list:
+        """
+        Return the text and compact log files covering [start, end], oldest first.
+        Files are selected by their date name, without opening them. Archived days are
+        listed under their original path; open them with LogArchive.open_log.
+        """
+        first = start.strftime("%Y-%m-%d") if start else ""
+        last = end.strftime("%Y-%m-%d") if end else "9999-99-99"
+        if not os.path.isdir(Logger.LOG_DIR):
+            return []
+
+        names = set(LogArchive.list_files())
+        names.update(os.listdir(Logger.LOG_DIR))
+        return sorted(
+            os.path.join(Logger.LOG_DIR, name)
+            for name in names
+            if name.endswith(cls.EXTENSIONS) and first <= cls.get_day(name) <= last
+        )
+
+    @classmethod
+    def iter_file_events(cls, path: str, start: datetime = None, end: datetime = None, title: str = None, pattern: str | re.Pattern = None):
+        """Yield the matching events of a single text or compact log file."""
+        if isinstance(pattern, str):
+            pattern = re.compile(pattern)
+
+        for event in cls._iter_raw_events(path, start):
+            if start is not None and event.timestamp < start:
+                continue
+            if end is not None and event.timestamp >= end:
+                return
+            if title is not None or pattern is not None:
+                window_title = event.window_title
+                if window_title is None:
+                    continue
+                if title is not None and title not in window_title:
+                    continue
+                if pattern is not None and not pattern.search(window_title):
+                    continue
+            yield event
+
+    @classmethod
+    def iter_file_positions(cls, path: str, position: int = 0):
+        """
+        Yield (event, position after the event) for a text or compact log file.
+        A stored position can be passed back later to continue reading a growing file.
+        """
+        if path.endswith(CompactLog.EXTENSION):
+            fromtimestamp = datetime.fromtimestamp
+            payloads = {}
+            for epoch, value, marker, end, app in CompactLog.iter_records(path):
+                if end <= position:
+                    continue
+                data = payloads.get((value, marker, app))
+                if data is None:
+                    if marker:
+                        data = {"event": value}
+                    else:
+                        data = {"window_title": value, "app": app} if app else {"window_title": value}
+                    payloads[(value, marker, app)] = data
+                yield LogEvent(fromtimestamp(epoch), value, data), end
+            return
+
+        with LogArchive.open_log(path) as f:
+            f.seek(position)
+            for line in f:
+                if not line.endswith(b"\n"):
+                    # The writer has not finished this line yet.
+                    return
+                position += len(line)
+                event = cls.parse_line(line)
+                if event is not None:
+                    yield event, position
+
+    @classmethod
+    def _iter_raw_events(cls, path: str, start: datetime = None):
+        """Decode a file, seeking straight to `start` in text logs."""
+        if path.endswith(CompactLog.EXTENSION):
+            for event, _ in cls.iter_file_positions(path):
+                yield event
+            return
+
+        with LogArchive.open_log(path) as f:
+            if start is not None:
+                cls._seek(f, start)
+            for line in f:
+                event = cls.parse_line(line)
+                if event is not None:
+                    yield event
+
+    @classmethod
+    def parse_line(cls, line: bytes) -> LogEvent | None:
+        """Parse a "YYYY-MM-DD HH:MM:SS - message" line; returns None for anything else."""
+        timestamp = cls._parse_timestamp(line)
+        if timestamp is None:
+            return None
+
+        message = line[cls.TIMESTAMP_LENGTH + len(cls.SEPARATOR):].decode("utf-8", errors="replace").rstrip("\n")
+        data = None
+        if message.startswith("{"):
+            try:
+                data = json.loads(message)
+            except ValueError:
+                pass
+        return LogEvent(timestamp, message, data)
+
+    @staticmethod
+    def get_day(path: str) -> str:
+        """The YYYY-MM-DD part of a log file name."""
+        return os.path.basename(path)[:10]
+
+    @classmethod
+    def _parse_timestamp(cls, line: bytes) -> datetime | None:
+        try:
+            return datetime.fromisoformat(line[:cls.TIMESTAMP_LENGTH].decode("ascii"))
+        except ValueError:
+            return None
+
+    @classmethod
+    def _seek(cls, f, start: datetime) -> None:
+        """
+        Binary search the file for the first line at or after `start`.
+        Relies on lines being appended in timestamp order.
+        """
+        def line_start(offset: int) -> int:
+            # First line boundary at or after `offset`.
+            if offset == 0:
+                return 0
+            f.seek(offset - 1)
+            f.readline()
+            return f.tell()
+
+        low, high = 0, f.seek(0, os.SEEK_END)
+        while low < high:
+            middle = (low + high) // 2
+            f.seek(line_start(middle))
+            line = f.readline()
+            timestamp = cls._parse_timestamp(line) if line else None
+            if not line or (timestamp is not None and timestamp >= start):
+                high = middle
+            else:
+                low = middle + 1
+        f.seek(line_start(low))
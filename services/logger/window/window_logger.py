@@ -1,25 +1,114 @@
 from pynput import mouse
 import Xlib
+import Xlib.X
+import Xlib.Xatom
 import Xlib.display
+import Xlib.error
 import subprocess
+import threading
+import select
 import json
 import time
+from enum import Enum
+from services.config.config_manager import ConfigManager
 from services.logger.logger import Logger
+from services.logger.compact.compact_log import CompactLog
+from services.logger.window.window_metadata import WindowMetadataCache
+from services.idle.idle_detector import IdleDetector
+from services.metrics.metrics import Metrics
+
+
+class WindowLoggerConfig(Enum):
+    MODE = "window_logger_mode"
+    FORMAT = "window_logger_format"
+
+
+class WindowLoggerMode(Enum):
+    NATIVE = "native"
+    XDOTOOL = "xdotool"
+
+
+class WindowLoggerFormat(Enum):
+    TEXT = "text"
+    COMPACT = "compact"
+
 
 class WindowLogger(Logger):
     """Logs active window changes and user interactions with windows."""
 
+    EVENT_POLL_TIMEOUT = 0.5
+
     def __init__(self) -> None:
         self.display = Xlib.display.Display()
         self.root = self.display.screen().root
         self.active_window_title = None
-        self.listener = None 
+        self.listener = None
+        self.event_thread = None
+        self.stop_event = threading.Event()
+        self.active_window_id = None
+        self.last_event_time = 0.0
+        self.state_lock = threading.Lock()
+        self.idle_detector = IdleDetector(self.on_idle, self.on_active)
+        self.metadata = WindowMetadataCache(self.display)
+
+        self.NET_ACTIVE_WINDOW = self.display.intern_atom("_NET_ACTIVE_WINDOW")
+        self.NET_WM_NAME = self.display.intern_atom("_NET_WM_NAME")
+        self.NET_SUPPORTED = self.display.intern_atom("_NET_SUPPORTED")
+
+    def get_mode(self) -> WindowLoggerMode:
+        """
+        Get the configured window tracking mode.
+        Falls back to xdotool when the window manager does not support EWMH.
+        """
+        mode = ConfigManager.get(WindowLoggerConfig.MODE.value)
+        if mode == WindowLoggerMode.XDOTOOL.value or not self.is_native_supported():
+            return WindowLoggerMode.XDOTOOL
+        return WindowLoggerMode.NATIVE
+
+    def is_native_supported(self) -> bool:
+        """Check whether the window manager publishes _NET_ACTIVE_WINDOW."""
+        try:
+            supported = self.root.get_full_property(self.NET_SUPPORTED, Xlib.X.AnyPropertyType)
+        except Xlib.error.XError:
+            return False
+        return bool(supported) and self.NET_ACTIVE_WINDOW in supported.value
 
+    def get_active_window_id(self) -> int | None:
+        """Retrieve the X window id of the currently focused window."""
+        try:
+            prop = self.root.get_full_property(self.NET_ACTIVE_WINDOW, Xlib.X.AnyPropertyType)
+        except Xlib.error.XError:
+            return None
+        if prop and len(prop.value) and prop.value[0]:
+            return int(prop.value[0])
+        return None
+
+    def get_window_name(self, window_id: int) -> str | None:
+        """Read the title of a window, preferring _NET_WM_NAME over WM_NAME."""
+        window = self.display.create_resource_object("window", window_id)
+        try:
+            prop = window.get_full_property(self.NET_WM_NAME, Xlib.X.AnyPropertyType)
+            if not prop or not prop.value:
+                prop = window.get_full_property(Xlib.Xatom.WM_NAME, Xlib.X.AnyPropertyType)
+        except Xlib.error.XError:
+            return None
+        if not prop or not prop.value:
+            return None
+        value = prop.value
+        if isinstance(value, bytes):
+            value = value.decode("utf-8", errors="replace")
+        return value.strip()
+
+    @Metrics.timed("window.get_active_window_title")
     def get_active_window_title(self) -> str:
         """Retrieve the title of the currently focused window."""
+        if self.event_thread is not None:
+            window_id = self.get_active_window_id()
+            return self.get_window_name(window_id) if window_id else None
+
         try:
             output = subprocess.run(
-                ["xdotool", "getwindowfocus", "getwindowname"], 
+                ["xdotool", "getwindowfocus", "getwindowname"],
                 capture_output=True, text=True
             )
             if output.returncode == 0:
@@ -28,32 +117,170 @@ class WindowLogger(Logger):
             Logger.log(f"Error getting window title: {e}")
         return None
 
+    def get_active_window_metadata(self):
+        """
+        WM_CLASS, PID and executable of the focused window (native mode only).
+        Served from the cache after the first focus of a window.
+        """
+        if self.event_thread is None or not self.active_window_id:
+            return None
+        return self.metadata.get(self.active_window_id)
+
     def log_window_change(self) -> None:
         """Log when a new window becomes active."""
         window_title = self.get_active_window_title()
 
         if window_title and window_title != self.active_window_title:
+            self.last_event_time = time.time()
+            metadata = self.get_active_window_metadata()
+            if ConfigManager.get(WindowLoggerConfig.FORMAT.value) == WindowLoggerFormat.COMPACT.value:
+                CompactLog.log(window_title, app=metadata.app if metadata else None)
+                self.active_window_title = window_title
+                return
+
             log_entry = {
                 "timestamp": time.strftime('%Y-%m-%d %H:%M:%S'),
                 "window_title": window_title
             }
+            if metadata:
+                log_entry.update(metadata.to_dict())
             Logger.log(json.dumps(log_entry))
             self.active_window_title = window_title
 
+    def log_marker(self, name: str, epoch: float = None) -> None:
+        """
+        Record a logger state change (e.g. "start", "stop", "idle") so intervals can be cut there.
+        :param epoch: When the change happened, if earlier than now. It is never put before
+            the last logged event, so that log files stay in time order.
+        """
+        epoch = time.time() if epoch is None else max(epoch, self.last_event_time)
+        self.last_event_time = epoch
+        if ConfigManager.get(WindowLoggerConfig.FORMAT.value) == WindowLoggerFormat.COMPACT.value:
+            CompactLog.log_marker(name, int(epoch))
+        else:
+            stamp = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(epoch))
+            Logger.log(json.dumps({"timestamp": stamp, "event": name}), epoch)
+
+    def on_idle(self, since: float) -> None:
+        """The user went away: cut the interval where input stopped and pause the listeners."""
+        with self.state_lock:
+            # Never backdate into yesterday's file.
+            midnight = time.mktime(time.localtime()[:3] + (0, 0, 0, 0, 0, -1))
+            self.log_marker("idle", max(since, midnight))
+            self.stop_listening()
+            self.active_window_title = None
+
+    def on_active(self) -> None:
+        """The user is back: resume the listeners and log the focused window again."""
+        with self.state_lock:
+            self.log_marker("active")
+            self.start_listening()
+
     def on_click(self, x, y, button, pressed) -> None:
         """Detect user interaction and log window changes."""
-        print(x, y, button, pressed)
         if pressed:
             self.log_window_change()
 
-    def start(self) -> None:
-        """Start the window logging process."""
+    def watch_active_window(self) -> None:
+        """Move the _NET_WM_NAME subscription to the currently focused window."""
+        window_id = self.get_active_window_id()
+        if window_id == self.active_window_id:
+            return
+
+        if self.active_window_id:
+            previous = self.display.create_resource_object("window", self.active_window_id)
+            # Keep StructureNotify only while the metadata cache needs to hear that the window is destroyed.
+            mask = Xlib.X.StructureNotifyMask if self.active_window_id in self.metadata else Xlib.X.NoEventMask
+            try:
+                previous.change_attributes(event_mask=mask)
+            except Xlib.error.XError:
+                pass
+
+        self.active_window_id = window_id
+        if window_id:
+            window = self.display.create_resource_object("window", window_id)
+            try:
+                window.change_attributes(event_mask=Xlib.X.PropertyChangeMask | Xlib.X.StructureNotifyMask)
+            except Xlib.error.XError:
+                self.active_window_id = None
+
+    def handle_event(self, event) -> None:
+        """React to a PropertyNotify on the root or the focused window, or a DestroyNotify."""
+        if event.type == Xlib.X.DestroyNotify:
+            self.metadata.invalidate(event.window.id)
+            return
+        if event.type != Xlib.X.PropertyNotify:
+            return
+        if event.atom == self.NET_ACTIVE_WINDOW:
+            self.watch_active_window()
+            self.log_window_change()
+        elif event.atom in (self.NET_WM_NAME, Xlib.Xatom.WM_NAME):
+            if event.window.id == self.active_window_id:
+                self.log_window_change()
+
+    def run_event_loop(self) -> None:
+        """Wait for X events and log focus and title changes as they happen."""
+        self.root.change_attributes(event_mask=Xlib.X.PropertyChangeMask)
+        self.watch_active_window()
+        self.log_window_change()
+        self.display.flush()
+
+        while not self.stop_event.is_set():
+            while self.display.pending_events():
+                self.handle_event(self.display.next_event())
+            select.select([self.display], [], [], self.EVENT_POLL_TIMEOUT)
+
+        self.root.change_attributes(event_mask=Xlib.X.NoEventMask)
+        if self.active_window_id:
+            self.metadata.release(self.active_window_id)
+        # DestroyNotify is not processed while stopped, so ids may be reused unseen.
+        self.metadata.clear()
+        self.display.flush()
+
+    def start_listening(self) -> None:
+        """Start the X event loop or the click listener, depending on the mode."""
+        if self.get_mode() == WindowLoggerMode.NATIVE:
+            if self.event_thread is None or not self.event_thread.is_alive():
+                self.stop_event.clear()
+                self.event_thread = threading.Thread(target=self.run_event_loop, daemon=True)
+                self.event_thread.start()
+            return
+
         if self.listener is None or not self.listener.is_alive():
             self.listener = mouse.Listener(on_click=self.on_click)
             self.listener.start()
+            self.log_window_change()
+
+    def stop_listening(self) -> None:
+        """Stop the X event loop and the click listener."""
+        if self.event_thread is not None:
+            self.stop_event.set()
+            self.event_thread.join()
+            self.event_thread = None
+            self.active_window_id = None
 
-    def stop(self) -> None:
-        """Stop the window logging process."""
         if self.listener is not None:
             self.listener.stop()
-            self.listener = None  
+            self.listener = None
+
+    def start(self) -> None:
+        """Start the window logging process."""
+        if self.idle_detector.thread is not None:
+            return
+
+        with self.state_lock:
+            self.log_marker("start")
+            self.start_listening()
+        self.idle_detector.start()
+
+    def stop(self) -> None:
+        """Stop the window logging process."""
+        if self.idle_detector.thread is None:
+            return
+
+        self.idle_detector.stop()
+        with self.state_lock:
+            self.stop_listening()
+            self.log_marker("stop")
+            # The window focused after a restart must be logged again to open a new interval.
+            self.active_window_title = None
@@ -0,0 +1,111 @@
+import os
+import threading
+from collections import OrderedDict
+from typing import NamedTuple
+import Xlib
+import Xlib.X
+import Xlib.error
+
+
+class WindowMetadata(NamedTuple):
+    """Identity of the application owning a window."""
+
+    window_id: int
+    wm_class: str | None
+    pid: int | None
+    exe: str | None
+
+    @property
+    def app(self) -> str | None:
+        """Application name: the WM_CLASS class, else the executable's name."""
+        if self.wm_class:
+            return self.wm_class
+        return os.path.basename(self.exe) if self.exe else None
+
+    def to_dict(self) -> dict:
+        """Fields added to text log events."""
+        return {"app": self.app, "wm_class": self.wm_class, "pid": self.pid, "exe": self.exe, "window_id": self.window_id}
+
+
+class WindowMetadataCache:
+    """
+    Metadata of X windows keyed by window id.
+    A window's WM_CLASS, PID and executable never change, so they are looked up
+    once (two X round trips and one /proc read) and kept until the window is
+    destroyed. Cached windows stay subscribed to StructureNotify (the window
+    logger selects it while they are focused) so that the DestroyNotify reaches
+    the event loop, which passes it to `invalidate`. Windows dropped from the
+    cache any other way are unsubscribed.
+    """
+
+    MAX_ENTRIES = 512
+
+    def __init__(self, display) -> None:
+        self.display = display
+        self.NET_WM_PID = display.intern_atom("_NET_WM_PID")
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+        # Released windows may already be gone; their BadWindow errors are expected.
+        self.ignore_errors = Xlib.error.CatchError(Xlib.error.BadWindow)
+
+    def __contains__(self, window_id: int) -> bool:
+        with self.lock:
+            return window_id in self.entries
+
+    def get(self, window_id: int) -> WindowMetadata:
+        """Metadata of a window, from the cache when possible."""
+        with self.lock:
+            metadata = self.entries.get(window_id)
+            if metadata is not None:
+                self.entries.move_to_end(window_id)
+                return metadata
+
+        metadata = self._lookup(window_id)
+        evicted = []
+        with self.lock:
+            self.entries[window_id] = metadata
+            # Bounded in case a DestroyNotify is missed, e.g. for windows seen before the event loop ran.
+            # The focused window was just looked up, so it is the newest entry and never evicted.
+            while len(self.entries) > self.MAX_ENTRIES:
+                evicted.append(self.entries.popitem(last=False)[0])
+        for evicted_id in evicted:
+            self.release(evicted_id)
+        return metadata
+
+    def invalidate(self, window_id: int) -> None:
+        """Forget a window, e.g. on DestroyNotify (window ids are reused)."""
+        with self.lock:
+            self.entries.pop(window_id, None)
+
+    def clear(self) -> None:
+        """Forget and unsubscribe every window, e.g. when the event loop stops."""
+        with self.lock:
+            window_ids = list(self.entries)
+            self.entries.clear()
+        for window_id in window_ids:
+            self.release(window_id)
+
+    def release(self, window_id: int) -> None:
+        """Stop receiving events for a window. The request is sent on the next display flush."""
+        window = self.display.create_resource_object("window", window_id)
+        window.change_attributes(event_mask=Xlib.X.NoEventMask, onerror=self.ignore_errors)
+
+    def _lookup(self, window_id: int) -> WindowMetadata:
+        window = self.display.create_resource_object("window", window_id)
+        wm_class = pid = exe = None
+        try:
+            names = window.get_wm_class()
+            if names:
+                wm_class = names[1] or names[0]
+            prop = window.get_full_property(self.NET_WM_PID, Xlib.X.AnyPropertyType)
+            if prop and len(prop.value):
+                pid = int(prop.value[0])
+        except Xlib.error.XError:
+            pass
+
+        if pid:
+            try:
+                exe = os.readlink(f"/proc/{pid}/exe")
+            except OSError:
+                pass
+        return WindowMetadata(window_id, wm_class, pid, exe)
@@ -0,0 +1,124 @@
+import atexit
+import os
+import threading
+from collections import deque
+
+
+class LogWriter:
+    """Buffers log records in memory and writes them to disk from a background thread."""
+
+    BATCH_SIZE = 256
+    FLUSH_INTERVAL = 1.0
+    MAX_OPEN_FILES = 4
+
+    _queue = deque()
+    _wakeup = threading.Event()
+    _io_lock = threading.Lock()
+    _start_lock = threading.Lock()
+    _thread = None
+    _files = {}
+    _sink = None
+
+    @classmethod
+    def write(cls, path: str, data: str | bytes) -> None:
+        """
+        Queue data to be appended to `path`. Never touches the disk.
+
+        :param path: File the data belongs to.
+        :param data: Text (encoded as UTF-8) or raw bytes.
+        """
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+        if cls._sink is not None:
+            cls._sink(path, data)
+            return
+        if cls._thread is None:
+            cls._start()
+        cls._queue.append((path, data))
+        if len(cls._queue) >= cls.BATCH_SIZE:
+            cls._wakeup.set()
+
+    @classmethod
+    def set_sink(cls, sink) -> None:
+        """
+        Hand records to `sink(path, data)` instead of writing them, e.g. to pass them
+        to another process. None restores writing to disk.
+        """
+        cls._sink = sink
+
+    @classmethod
+    def flush(cls, sync: bool = False) -> None:
+        """
+        Write every queued record now.
+
+        :param sync: Also fsync the open files so the data survives a crash.
+        """
+        with cls._io_lock:
+            cls._drain()
+            for f in cls._files.values():
+                f.flush()
+                if sync:
+                    os.fsync(f.fileno())
+
+    @classmethod
+    def close(cls) -> None:
+        """Flush, fsync and close all open files."""
+        cls.flush(sync=True)
+        with cls._io_lock:
+            for f in cls._files.values():
+                f.close()
+            cls._files.clear()
+
+    @classmethod
+    def _start(cls) -> None:
+        """Start the flush thread on first use."""
+        with cls._start_lock:
+            if cls._thread is not None:
+                return
+            cls._thread = threading.Thread(target=cls._run, name="waid-log-writer", daemon=True)
+            cls._thread.start()
+            atexit.register(cls.close)
+
+    @classmethod
+    def _run(cls) -> None:
+        """Flush when the batch is full or the flush interval has passed."""
+        while True:
+            cls._wakeup.wait(cls.FLUSH_INTERVAL)
+            cls._wakeup.clear()
+            try:
+                cls.flush()
+            except OSError as e:
+                print(f"Error writing logs: {e}")
+
+    @classmethod
+    def _drain(cls) -> None:
+        """
+        Write queued records, grouped per file. Caller must hold `_io_lock`.
+        If a file cannot be written, its records and those of the files not reached
+        yet go back to the front of the queue, in order, to be retried on the next flush.
+        """
+        batches = {}
+        while cls._queue:
+            path, data = cls._queue.popleft()
+            batches.setdefault(path, []).append(data)
+
+        pending = list(batches.items())
+        try:
+            while pending:
+                path, chunks = pending[0]
+                f = cls._files.get(path)
+                if f is None:
+                    if len(cls._files) >= cls.MAX_OPEN_FILES:
+                        # Only the current day is appended to, so older handles can go.
+                        for old in cls._files.values():
+                            old.close()
+                        cls._files.clear()
+                    f = cls._files[path] = open(path, "ab")
+                f.write(b"".join(chunks))
+                pending.pop(0)
+        except BaseException:
+            # Also on SystemExit from the shutdown handler, so that the atexit close writes them.
+            for path, chunks in reversed(pending):
+                for data in reversed(chunks):
+                    cls._queue.appendleft((path, data))
+            raise
@@ -0,0 +1,165 @@
+import hashlib
+import math
+import re
+from typing import NamedTuple
+from services.jira.jira_manager import JiraManager
+
+
+class IssueMatch(NamedTuple):
+    """The best issue for a window title and how confident the match is (0-1)."""
+
+    key: str
+    score: float
+
+
+class IssueMatcher:
+    """
+    Matches window titles to Jira issues through an inverted TF-IDF index over each
+    issue's key, summary, parent and labels.
+
+    Explicit issue keys in a title (e.g. "QWDI-20") win outright. Otherwise only
+    issues sharing at least one token with the title are scored, so cost depends on
+    posting-list sizes rather than on titles × issues. The index is updated in place
+    as issues are added, changed or removed.
+    """
+
+    KEY_PATTERN = re.compile(r"\b([A-Z][A-Z0-9]+-\d+)\b")
+    TOKEN_PATTERN = re.compile(r"[a-z0-9]+(?:-\d+)?")
+    FIELD_WEIGHTS = {"key": 2.0, "summary": 1.0, "labels": 0.8, "parent": 0.5}
+    STOP_WORDS = {
+        "a", "an", "and", "are", "as", "at", "be", "by", "for", "from", "in", "is", "it",
+        "of", "on", "or", "the", "to", "with", "new", "tab", "google", "chrome", "mozilla",
+        "firefox", "visual", "studio", "code", "slack", "jira",
+    }
+    MIN_SCORE = 0.2
+
+    def __init__(self, issues: list = None) -> None:
+        self.postings = {}
+        self.issue_terms = {}
+        self.norms = {}
+        self._norms_dirty = False
+        if issues:
+            self.update(issues)
+
+    @classmethod
+    def from_cached_issues(cls) -> "IssueMatcher":
+        """Build a matcher over the issues in the local store, without network access."""
+        return cls(JiraManager.get_cached_issues())
+
+    def __len__(self) -> int:
+        return len(self.issue_terms)
+
+    def update(self, issues: list) -> None:
+        """Add issues to the index, replacing earlier versions of the same keys."""
+        for issue in issues:
+            key = issue["key"]
+            self.remove(key)
+            terms = self._issue_terms(issue)
+            self.issue_terms[key] = terms
+            for token, weight in terms.items():
+                self.postings.setdefault(token, {})[key] = weight
+        self._norms_dirty = True
+
+    def remove(self, key: str) -> None:
+        """Drop an issue from the index."""
+        terms = self.issue_terms.pop(key, None)
+        if terms is None:
+            return
+        for token in terms:
+            posting = self.postings[token]
+            del posting[key]
+            if not posting:
+                del self.postings[token]
+        self.norms.pop(key, None)
+        self._norms_dirty = True
+
+    def get_signature(self) -> str:
+        """Digest of the indexed issues, which changes whenever match results could."""
+        digest = hashlib.sha1()
+        for key in sorted(self.issue_terms):
+            digest.update(f"{key}|{sorted(self.issue_terms[key].items())}\n".encode("utf-8"))
+        return digest.hexdigest()
+
+    def set_issues(self, issues: list) -> None:
+        """Make the index hold exactly `issues`: update changed ones and remove the rest."""
+        keys = {issue["key"] for issue in issues}
+        for key in [key for key in self.issue_terms if key not in keys]:
+            self.remove(key)
+        self.update(issues)
+
+    def match(self, title: str) -> IssueMatch | None:
+        """Return the best issue for a window title, or None below MIN_SCORE."""
+        return self.match_batch([title])[0]
+
+    def match_batch(self, titles: list) -> list:
+        """
+        Match many titles at once. Repeated titles are scored once and the IDF
+        weights are computed once per batch.
+        """
+        if self._norms_dirty:
+            self._compute_norms()
+        idf = {}
+        results = {}
+        for title in set(titles):
+            results[title] = self._score(title, idf)
+        return [results[title] for title in titles]
+
+    def _score(self, title: str, idf: dict) -> IssueMatch | None:
+        for key in self.KEY_PATTERN.findall(title):
+            if key in self.issue_terms:
+                return IssueMatch(key, 1.0)
+
+        query = {}
+        for token in self.TOKEN_PATTERN.findall(title.lower()):
+            if token not in self.STOP_WORDS and token in self.postings:
+                query[token] = query.get(token, 0) + 1
+        if not query:
+            return None
+
+        scores = {}
+        query_norm = 0.0
+        for token, count in query.items():
+            weight = idf.get(token)
+            if weight is None:
+                weight = idf[token] = self._idf(token)
+            query_weight = count * weight
+            query_norm += query_weight * query_weight
+            for key, term_weight in self.postings[token].items():
+                scores[key] = scores.get(key, 0.0) + query_weight * term_weight * weight
+
+        # Cosine similarity: every candidate is normalized before picking the best, or long issues would win.
+        query_norm = math.sqrt(query_norm)
+        key, score = max(
+            ((key, score / (query_norm * self.norms[key])) for key, score in scores.items()),
+            key=lambda item: item[1],
+        )
+        return IssueMatch(key, score) if score >= self.MIN_SCORE else None
+
+    def _idf(self, token: str) -> float:
+        return math.log((len(self.issue_terms) + 1) / (len(self.postings[token]) + 1)) + 1
+
+    def _compute_norms(self) -> None:
+        """IDF changes whenever the issue set does, so document norms are refreshed lazily."""
+        idf = {token: self._idf(token) for token in self.postings}
+        self.norms = {
+            key: math.sqrt(sum((weight * idf[token]) ** 2 for token, weight in terms.items())) or 1.0
+            for key, terms in self.issue_terms.items()
+        }
+        self._norms_dirty = False
+
+    def _issue_terms(self, issue: dict) -> dict:
+        """Weighted term frequencies of the indexed fields of an issue."""
+        fields = issue.get("fields", {})
+        parent = fields.get("parent") or {}
+        texts = {
+            "key": issue["key"],
+            "summary": fields.get("summary") or "",
+            "labels": " ".join(fields.get("labels") or []),
+            "parent": f"{parent.get('key', '')} {(parent.get('fields') or {}).get('summary', '')}",
+        }
+        terms = {}
+        for field, text in texts.items():
+            for token in self.TOKEN_PATTERN.findall(text.lower()):
+                if token not in self.STOP_WORDS:
+                    terms[token] = terms.get(token, 0.0) + self.FIELD_WEIGHTS[field]
+        return terms
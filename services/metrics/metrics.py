@@ -0,0 +1,217 @@
+import functools
+import json
+import os
+import socket
+import tempfile
+import threading
+import time
+from enum import Enum
+
+
+class MetricsConfig(Enum):
+    ENABLED = "metrics_enabled"
+    OUTPUT = "metrics_output"
+
+
+class MetricsOutput(Enum):
+    FILE = "file"
+    SOCKET = "socket"
+
+
+class Histogram:
+    """Latency histogram with power-of-two microsecond buckets."""
+
+    BUCKETS = 40
+
+    def __init__(self) -> None:
+        self.buckets = [0] * self.BUCKETS
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, seconds: float) -> None:
+        index = min(int(seconds * 1e6).bit_length(), self.BUCKETS - 1)
+        self.buckets[index] += 1
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def percentile(self, fraction: float) -> float:
+        """Upper bound, in seconds, of the bucket holding the given fraction of samples."""
+        rank = fraction * self.count
+        seen = 0
+        for index, count in enumerate(self.buckets):
+            seen += count
+            if count and seen >= rank:
+                return min((1 << index) / 1e6, self.max)
+        return self.max
+
+    def snapshot(self) -> dict:
+        return {
+            "count": self.count,
+            "total_ms": self.total * 1000,
+            "mean_ms": self.total / self.count * 1000 if self.count else 0.0,
+            "p50_ms": self.percentile(0.5) * 1000,
+            "p95_ms": self.percentile(0.95) * 1000,
+            "p99_ms": self.percentile(0.99) * 1000,
+            "max_ms": self.max * 1000,
+        }
+
+
+class Metrics:
+    """
+    In-process counters and latency histograms for WAID's hot paths.
+    Instrumented call sites check `Metrics.enabled` first, so while metrics are
+    off (the default) they cost one attribute lookup; functions decorated with
+    `timed` also pay for one extra call frame. When on, a snapshot is
+    written to a stats file every FLUSH_INTERVAL seconds or served as JSON to
+    whoever connects to a Unix socket.
+    """
+
+    STATS_PATH = os.path.expanduser("~/waid/metrics.json")
+    SOCKET_PATH = os.path.expanduser("~/waid/metrics.sock")
+    FLUSH_INTERVAL = 10.0
+    ACCEPT_TIMEOUT = 1.0
+
+    enabled = False
+    _histograms = {}
+    _counters = {}
+    _lock = threading.Lock()
+    _stop_event = threading.Event()
+    _thread = None
+
+    @classmethod
+    def timed(cls, name: str):
+        """
+        Decorator recording the duration of every call under `name`.
+        Metrics can be switched on after decoration, so the wrapper is always installed:
+        while they are off, a call costs an extra frame and a check of `enabled`.
+        Hot loops should check `enabled` inline instead.
+        """
+        def decorator(fn):
+            @functools.wraps(fn)
+            def wrapper(*args, **kwargs):
+                if not cls.enabled:
+                    return fn(*args, **kwargs)
+                start = time.perf_counter()
+                try:
+                    return fn(*args, **kwargs)
+                finally:
+                    cls.record(name, time.perf_counter() - start)
+            return wrapper
+        return decorator
+
+    @classmethod
+    def record(cls, name: str, seconds: float) -> None:
+        """Add one latency sample."""
+        with cls._lock:
+            histogram = cls._histograms.get(name)
+            if histogram is None:
+                histogram = cls._histograms[name] = Histogram()
+            histogram.record(seconds)
+
+    @classmethod
+    def increment(cls, name: str, value: int = 1) -> None:
+        """Add to a counter."""
+        with cls._lock:
+            cls._counters[name] = cls._counters.get(name, 0) + value
+
+    @classmethod
+    def snapshot(cls) -> dict:
+        """Current counters and histogram summaries."""
+        with cls._lock:
+            return {
+                "timestamp": time.strftime("%Y-%m-%d %H:%M:%S"),
+                "counters": dict(cls._counters),
+                "latency": {name: histogram.snapshot() for name, histogram in sorted(cls._histograms.items())},
+            }
+
+    @classmethod
+    def get_summary(cls, limit: int = 6) -> list:
+        """One line per instrumented path, busiest first, e.g. for the tray menu."""
+        latency = cls.snapshot()["latency"]
+        busiest = sorted(latency.items(), key=lambda item: item[1]["total_ms"], reverse=True)[:limit]
+        return [
+            f"{name}: {stats['count']}× p50 {stats['p50_ms']:.2f} ms, p95 {stats['p95_ms']:.2f} ms"
+            for name, stats in busiest
+        ]
+
+    @classmethod
+    def reset(cls) -> None:
+        """Drop all collected samples."""
+        with cls._lock:
+            cls._histograms.clear()
+            cls._counters.clear()
+
+    @classmethod
+    def start(cls) -> None:
+        """Enable collection and publishing if `metrics_enabled` is set in the config."""
+        from services.config.config_manager import ConfigManager
+
+        if not ConfigManager.get(MetricsConfig.ENABLED.value) or cls._thread is not None:
+            return
+        output = ConfigManager.get(MetricsConfig.OUTPUT.value) or MetricsOutput.FILE.value
+
+        cls.enabled = True
+        cls._stop_event.clear()
+        target = cls._serve if output == MetricsOutput.SOCKET.value else cls._write_periodically
+        cls._thread = threading.Thread(target=target, name="waid-metrics", daemon=True)
+        cls._thread.start()
+
+    @classmethod
+    def stop(cls) -> None:
+        """Disable collection and stop publishing."""
+        cls.enabled = False
+        if cls._thread is None:
+            return
+        cls._stop_event.set()
+        cls._thread.join()
+        cls._thread = None
+
+    @classmethod
+    def _write_periodically(cls) -> None:
+        while not cls._stop_event.wait(cls.FLUSH_INTERVAL):
+            cls._write_stats()
+        cls._write_stats()
+
+    @classmethod
+    def _write_stats(cls) -> None:
+        directory = os.path.dirname(cls.STATS_PATH)
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(cls.snapshot(), f, indent=2)
+        os.replace(tmp_path, cls.STATS_PATH)
+
+    @classmethod
+    def _serve(cls) -> None:
+        """Answer every connection to SOCKET_PATH with a JSON snapshot, e.g. `nc -U ~/waid/metrics.sock`."""
+        os.makedirs(os.path.dirname(cls.SOCKET_PATH), exist_ok=True)
+        if os.path.exists(cls.SOCKET_PATH):
+            os.remove(cls.SOCKET_PATH)
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        server.bind(cls.SOCKET_PATH)
+        os.chmod(cls.SOCKET_PATH, 0o600)
+        server.listen()
+        # accept() is not woken by close() from another thread, so poll for stop().
+        server.settimeout(cls.ACCEPT_TIMEOUT)
+        try:
+            while not cls._stop_event.is_set():
+                try:
+                    connection, _ = server.accept()
+                except socket.timeout:
+                    continue
+                except OSError:
+                    break
+                # A client that disconnects or stops reading must not end the server.
+                with connection:
+                    try:
+                        connection.settimeout(cls.ACCEPT_TIMEOUT)
+                        connection.sendall(json.dumps(cls.snapshot()).encode("utf-8") + b"\n")
+                    except OSError:
+                        pass
+        finally:
+            server.close()
+            if os.path.exists(cls.SOCKET_PATH):
+                os.remove(cls.SOCKET_PATH)
@@ -0,0 +1,209 @@
+import itertools
+import json
+import os
+import tempfile
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import NamedTuple
+from services.logger.archive.log_archive import LogArchive
+from services.logger.logger import Logger
+from services.logger.reader.log_reader import LogReader
+from services.logger.writer.log_writer import LogWriter
+from services.sessionizer.sessionizer import Sessionizer
+
+
+class ActivityTotals(NamedTuple):
+    """Seconds spent per app, per window title and per matched issue, largest first."""
+
+    total: float
+    apps: dict
+    titles: dict
+    issues: dict
+
+
+class Rollup:
+    """
+    Materialized per-day duration totals under LOG_DIR/rollups/YYYY-MM-DD.json,
+    so that weekly and monthly reports merge a few small files instead of
+    re-parsing raw logs. Each rollup records the sizes of the log files it was
+    built from and the matcher it used. It is rebuilt as soon as the logs differ;
+    for another matcher only its stored titles are attributed again, and a query
+    without a matcher uses it as is, ignoring its issues.
+    """
+
+    # 2: app names are normalized by the Sessionizer.
+    VERSION = 2
+    _lock = threading.Lock()
+
+    @classmethod
+    def get_rollup_dir(cls) -> str:
+        return os.path.join(Logger.LOG_DIR, "rollups")
+
+    @classmethod
+    def get_totals(cls, start: datetime = None, end: datetime = None, matcher=None) -> ActivityTotals:
+        """
+        Merge the rollups of every day with logs in [start, end). Rollups are per day,
+        so partial days at either end are counted whole.
+
+        :param matcher: IssueMatcher used to attribute titles to issues; without it
+            `issues` is empty.
+        """
+        apps, titles, issues = {}, {}, {}
+        total = 0.0
+        for rollup in cls.iter_days(start, end, matcher):
+            total += rollup["total"]
+            for merged, values in ((apps, rollup["apps"]), (titles, rollup["titles"]), (issues, rollup["issues"])):
+                for name, seconds in values.items():
+                    merged[name] = merged.get(name, 0.0) + seconds
+        return ActivityTotals(total, cls._sorted(apps), cls._sorted(titles), cls._sorted(issues))
+
+    @classmethod
+    def get_week(cls, day: datetime, matcher=None) -> ActivityTotals:
+        """Totals of the Monday-to-Sunday week containing `day`."""
+        monday = datetime(day.year, day.month, day.day) - timedelta(days=day.weekday())
+        return cls.get_totals(monday, monday + timedelta(days=7), matcher)
+
+    @classmethod
+    def get_month(cls, year: int, month: int, matcher=None) -> ActivityTotals:
+        """Totals of a calendar month."""
+        first = datetime(year, month, 1)
+        return cls.get_totals(first, (first + timedelta(days=32)).replace(day=1), matcher)
+
+    @classmethod
+    def iter_days(cls, start: datetime = None, end: datetime = None, matcher=None):
+        """
+        Yield an up-to-date rollup dict for every day in the range, in date order.
+        Days whose logs were removed by retention are still served from their rollup.
+        """
+        LogWriter.flush()
+        log_days = {
+            day: list(paths)
+            for day, paths in itertools.groupby(LogReader.get_log_files(start, end), key=LogReader.get_day)
+        }
+        first = f"{start:%Y-%m-%d}" if start else ""
+        last = f"{end - timedelta(microseconds=1):%Y-%m-%d}" if end else "9999-99-99"
+        for day in sorted(set(log_days) | set(cls._list_days())):
+            if not first <= day <= last:
+                continue
+            paths = log_days.get(day)
+            if paths:
+                yield cls.get_day(day, paths, matcher)
+                continue
+            with cls._lock:
+                rollup = cls._load(day)
+                if rollup:
+                    rollup = cls._for_matcher(day, rollup, matcher)
+            if rollup:
+                yield rollup
+
+    @classmethod
+    def get_day(cls, day: str, paths: list, matcher=None) -> dict:
+        """
+        Return a day's rollup, rebuilding it if its logs changed since it was written,
+        and attributing its titles again if it was written with another matcher.
+        """
+        source = {os.path.basename(path): LogArchive.get_log_size(path) for path in paths}
+        day_end = datetime.strptime(day, "%Y-%m-%d") + timedelta(days=1)
+        with cls._lock:
+            rollup = cls._load(day)
+            fresh = rollup and rollup["source"] == source
+            # The open interval of the current day keeps growing without new log lines.
+            if fresh and day_end.timestamp() <= time.time():
+                return cls._for_matcher(day, rollup, matcher)
+
+            rollup = cls._build(day, paths, matcher)
+            rollup["source"] = source
+            if not fresh:
+                cls._save(day, rollup)
+            return rollup
+
+    @classmethod
+    def build_all(cls, matcher=None) -> int:
+        """
+        Bring the rollups of all finished days up to date, e.g. at startup after a day closed.
+        :return: Number of days checked.
+        """
+        today = time.strftime("%Y-%m-%d")
+        count = 0
+        for rollup in cls.iter_days(end=datetime.strptime(today, "%Y-%m-%d"), matcher=matcher):
+            count += 1
+        return count
+
+    @classmethod
+    def _build(cls, day: str, paths: list, matcher) -> dict:
+        cached = Sessionizer.is_cached(day)
+        day_sessions = Sessionizer.get_day(day, paths)
+        apps, titles = {}, {}
+        total = 0.0
+        for interval in Sessionizer.iter_day_intervals(day_sessions):
+            seconds = interval.duration
+            total += seconds
+            apps[interval.app] = apps.get(interval.app, 0.0) + seconds
+            titles[interval.title] = titles.get(interval.title, 0.0) + seconds
+        if not cached and day_sessions.day_end <= time.time():
+            # Past days are served from the rollup from now on; don't keep their intervals in memory.
+            Sessionizer.clear(day)
+
+        return {
+            "version": cls.VERSION, "day": day, "total": total, "apps": apps, "titles": titles,
+            "issues": cls._match_issues(titles, matcher),
+            "matcher": matcher.get_signature() if matcher is not None else None,
+        }
+
+    @classmethod
+    def _for_matcher(cls, day: str, rollup: dict, matcher) -> dict:
+        """
+        Adapt a stored rollup to `matcher`. Caller must hold `_lock`.
+        Without a matcher, issues are left out; a different matcher re-attributes the
+        stored titles, and the result is saved for the next query with it.
+        """
+        if matcher is None:
+            return {**rollup, "issues": {}}
+        signature = matcher.get_signature()
+        if rollup["matcher"] != signature:
+            rollup["issues"] = cls._match_issues(rollup["titles"], matcher)
+            rollup["matcher"] = signature
+            cls._save(day, rollup)
+        return rollup
+
+    @staticmethod
+    def _match_issues(titles: dict, matcher) -> dict:
+        """Seconds per issue key, summed over the titles `matcher` attributes."""
+        issues = {}
+        if matcher is not None:
+            title_list = list(titles)
+            for title, match in zip(title_list, matcher.match_batch(title_list)):
+                if match is not None:
+                    issues[match.key] = issues.get(match.key, 0.0) + titles[title]
+        return issues
+
+    @classmethod
+    def _list_days(cls) -> list:
+        try:
+            names = os.listdir(cls.get_rollup_dir())
+        except FileNotFoundError:
+            return []
+        return [name[:-5] for name in names if name.endswith(".json")]
+
+    @classmethod
+    def _load(cls, day: str) -> dict | None:
+        try:
+            with open(os.path.join(cls.get_rollup_dir(), day + ".json"), "r", encoding="utf-8") as f:
+                rollup = json.load(f)
+        except (FileNotFoundError, ValueError):
+            return None
+        return rollup if rollup.get("version") == cls.VERSION else None
+
+    @classmethod
+    def _save(cls, day: str, rollup: dict) -> None:
+        directory = cls.get_rollup_dir()
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(rollup, f, separators=(",", ":"))
+        os.replace(tmp_path, os.path.join(directory, day + ".json"))
+
+    @staticmethod
+    def _sorted(values: dict) -> dict:
+        return dict(sorted(values.items(), key=lambda item: item[1], reverse=True))
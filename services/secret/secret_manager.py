@@ -1,10 +1,21 @@
+import threading
+import time
 import keyring
 import keyring.errors
+from services.metrics.metrics import Metrics
 
 class SecretManager:
-    """A secure secret manager using the system keyring for WAID."""
+    """
+    A secure secret manager using the system keyring for WAID.
+    Every keyring access is an IPC round trip, so values (including absent ones)
+    are cached in process until they are changed through this class or CACHE_TTL
+    seconds pass.
+    """
 
     SERVICE_NAME = "waid"
+    CACHE_TTL = 900.0  # None keeps secrets cached until invalidated
+    _cache = {}
+    _lock = threading.Lock()
 
     @classmethod
     def set_secret(cls, key: str, value: str) -> bool:
@@ -16,9 +27,11 @@ class SecretManager:
         :return: True if successful, False otherwise.
         """
         try:
-            keyring.set_password(cls.SERVICE_NAME, key, value)
+            cls._call_keyring(keyring.set_password, key, value)
+            cls._remember(key, value)
             return True
         except keyring.errors.KeyringError as e:
+            cls.invalidate(key)
             print(f"Error storing secret: {e}")
             return False
 
@@ -30,11 +43,30 @@ class SecretManager:
         :param key: The key (identifier) for the secret.
         :return: The stored secret, or None if not found.
         """
+        with cls._lock:
+            entry = cls._cache.get(key)
+        if entry is not None and (cls.CACHE_TTL is None or time.monotonic() - entry[1] < cls.CACHE_TTL):
+            if Metrics.enabled:
+                Metrics.increment("secret.cache_hits")
+            return entry[0]
+
         try:
-            return keyring.get_password(cls.SERVICE_NAME, key)
+            value = cls._call_keyring(keyring.get_password, key)
         except keyring.errors.KeyringError as e:
             print(f"Error retrieving secret: {e}")
             return None
+        cls._remember(key, value)
+        return value
+
+    @classmethod
+    def get_secrets(cls, keys: list) -> dict:
+        """
+        Retrieve several secrets at once.
+
+        :param keys: The keys (identifiers) of the secrets.
+        :return: Dictionary of key to stored secret, or None if not found.
+        """
+        return {key: cls.get_secret(key) for key in keys}
 
     @classmethod
     def delete_secret(cls, key: str) -> bool:
@@ -45,12 +77,15 @@ class SecretManager:
         :return: True if successful, False otherwise.
         """
         try:
-            keyring.delete_password(cls.SERVICE_NAME, key)
+            cls._call_keyring(keyring.delete_password, key)
+            cls._remember(key, None)
             return True
         except keyring.errors.PasswordDeleteError:
+            cls._remember(key, None)
             print(f"Secret '{key}' not found.")
             return False
         except keyring.errors.KeyringError as e:
+            cls.invalidate(key)
             print(f"Error deleting secret: {e}")
             return False
 
@@ -62,4 +97,34 @@ class SecretManager:
         :param key: The key (identifier) for the secret.
         :return: True if the secret exists, False otherwise.
         """
-        return cls.get_secret(key) is not None
\ No newline at end of file
+        return cls.get_secret(key) is not None
+
+    @classmethod
+    def invalidate(cls, key: str = None) -> None:
+        """
+        Drop cached secrets so the next access reads the keyring again,
+        e.g. after another process changed them.
+
+        :param key: The key to drop, or None to drop all cached secrets.
+        """
+        with cls._lock:
+            if key is None:
+                cls._cache.clear()
+            else:
+                cls._cache.pop(key, None)
+
+    @classmethod
+    def _call_keyring(cls, fn, *args):
+        """Call a keyring function for WAID's service, timing the IPC when metrics are on."""
+        if not Metrics.enabled:
+            return fn(cls.SERVICE_NAME, *args)
+        start = time.perf_counter()
+        try:
+            return fn(cls.SERVICE_NAME, *args)
+        finally:
+            Metrics.record(f"secret.keyring.{fn.__name__}", time.perf_counter() - start)
+
+    @classmethod
+    def _remember(cls, key: str, value: str | None) -> None:
+        with cls._lock:
+            cls._cache[key] = (value, time.monotonic())
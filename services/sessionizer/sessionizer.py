@@ -0,0 +1,298 @@
+import heapq
+import itertools
+import math
+import re
+import string
+import threading
+import time
+from array import array
+from datetime import datetime, timedelta
+from typing import NamedTuple
+from services.logger.archive.log_archive import LogArchive
+from services.logger.reader.log_reader import LogEvent, LogReader
+from services.logger.writer.log_writer import LogWriter
+
+
+class ActivityInterval(NamedTuple):
+    """A span of time spent in one window."""
+
+    start: datetime
+    end: datetime
+    title: str
+    app: str
+
+    @property
+    def duration(self) -> float:
+        """Length of the interval in seconds."""
+        return (self.end - self.start).total_seconds()
+
+
+class IntervalTable:
+    """Column-oriented intervals: epoch arrays plus interned title and app ids."""
+
+    def __init__(self) -> None:
+        self.starts = array("d")
+        self.ends = array("d")
+        self.title_ids = array("I")
+        self.app_ids = array("I")
+        self.titles = []
+        self.apps = []
+        self._title_index = {}
+        self._app_index = {}
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def __iter__(self):
+        for start, end, title_id, app_id in zip(self.starts, self.ends, self.title_ids, self.app_ids):
+            yield ActivityInterval(
+                datetime.fromtimestamp(start), datetime.fromtimestamp(end),
+                self.titles[title_id], self.apps[app_id]
+            )
+
+    def intern_title(self, title: str) -> int:
+        title_id = self._title_index.get(title)
+        if title_id is None:
+            title_id = self._title_index[title] = len(self.titles)
+            self.titles.append(title)
+        return title_id
+
+    def intern_app(self, app: str) -> int:
+        app_id = self._app_index.get(app)
+        if app_id is None:
+            app_id = self._app_index[app] = len(self.apps)
+            self.apps.append(app)
+        return app_id
+
+    def append(self, start: float, end: float, title_id: int, app_id: int) -> None:
+        self.starts.append(start)
+        self.ends.append(end)
+        self.title_ids.append(title_id)
+        self.app_ids.append(app_id)
+
+    def pop(self) -> tuple:
+        return self.starts.pop(), self.ends.pop(), self.title_ids.pop(), self.app_ids.pop()
+
+
+class DaySessions:
+    """Sessionization state of one day: finished intervals, the open one and how far each file was read."""
+
+    def __init__(self, day: str) -> None:
+        self.day = day
+        self.day_end = (datetime.strptime(day, "%Y-%m-%d") + timedelta(days=1)).timestamp()
+        self.table = IntervalTable()
+        self.open = None
+        self.positions = {}
+        self.sizes = {}
+        self.title_apps = {}
+        self.has_markers = False
+
+
+class Sessionizer:
+    """
+    Turns the window event stream into timed activity intervals, one day at a time.
+    Intervals end at the next window event or at a marker (idle, stop, start), so time
+    away from the computer is cut where the logger noticed it.
+
+    Application names are normalized here, so that the WM_CLASS recorded in native
+    mode ("Google-chrome") and the title suffix used otherwise ("Google Chrome") name
+    the same app everywhere intervals are used.
+    """
+
+    FLAP_THRESHOLD = 10.0
+    # Logs written before the logger recorded markers cannot tell time away from work;
+    # only for those days is an interval cut after this long.
+    MAX_INTERVAL = 30 * 60.0
+    # Keyed by the lowercase name with separators turned into single spaces.
+    APP_ALIASES = {
+        "google chrome": "Chrome",
+        "chrome": "Chrome",
+        "chromium": "Chrome",
+        "chromium browser": "Chrome",
+        "mozilla firefox": "Firefox",
+        "firefox": "Firefox",
+        "firefox esr": "Firefox",
+        "visual studio code": "Code",
+        "code": "Code",
+        "gnome terminal": "Terminal",
+        "gnome terminal server": "Terminal",
+        "terminal": "Terminal",
+    }
+    APP_SEPARATORS = re.compile(r"[\s_.-]+")
+    # "Title - App", also with the en and em dashes some applications use.
+    APP_SUFFIX = re.compile(r"^(.*?\S)\s+[-\u2013\u2014]\s+([^-\u2013\u2014]+?)\s*$")
+
+    _lock = threading.Lock()
+    _days = {}
+    _app_names = {}
+
+    @classmethod
+    def get_intervals(cls, start: datetime = None, end: datetime = None) -> list:
+        """Return the activity intervals overlapping [start, end), clipped to it."""
+        return list(cls.iter_intervals(start, end))
+
+    @classmethod
+    def iter_intervals(cls, start: datetime = None, end: datetime = None):
+        """
+        Yield activity intervals overlapping [start, end), clipped to it.
+        Days already processed are served from memory; a growing day only reads its new events.
+        """
+        for day_sessions in cls.iter_days(start, end):
+            for interval in cls.iter_day_intervals(day_sessions):
+                if start is not None and interval.end <= start:
+                    continue
+                if end is not None and interval.start >= end:
+                    break
+                yield interval._replace(
+                    start=max(interval.start, start) if start else interval.start,
+                    end=min(interval.end, end) if end else interval.end,
+                )
+
+    @classmethod
+    def iter_day_intervals(cls, day_sessions: DaySessions):
+        """Yield a day's finished intervals followed by the still-open one, if any."""
+        return itertools.chain(day_sessions.table, cls._open_interval(day_sessions))
+
+    @classmethod
+    def iter_days(cls, start: datetime = None, end: datetime = None):
+        """Yield an up-to-date DaySessions for every day with logs in the range."""
+        LogWriter.flush()
+        for day, paths in itertools.groupby(LogReader.get_log_files(start, end), key=LogReader.get_day):
+            yield cls.get_day(day, list(paths))
+
+    @classmethod
+    def get_day(cls, day: str, paths: list) -> DaySessions:
+        """Bring a day's sessions up to date with its log files, reading only what was appended."""
+        sizes = {path: LogArchive.get_log_size(path) for path in paths}
+        with cls._lock:
+            day_sessions = cls._days.get(day)
+            if day_sessions is None or any(
+                sizes.get(path, -1) < size for path, size in day_sessions.sizes.items()
+            ):
+                # New day, or a file shrank or vanished: start over.
+                day_sessions = cls._days[day] = DaySessions(day)
+
+            if sizes != day_sessions.sizes:
+                streams = [cls._iter_new_events(day_sessions, path) for path in paths]
+                for event in heapq.merge(*streams, key=lambda event: event.timestamp):
+                    cls._feed(day_sessions, event)
+                day_sessions.sizes = sizes
+            return day_sessions
+
+    @classmethod
+    def is_cached(cls, day: str) -> bool:
+        """Whether a day's sessions are held in memory."""
+        return day in cls._days
+
+    @classmethod
+    def clear(cls, day: str = None) -> None:
+        """Forget one processed day, or all of them."""
+        with cls._lock:
+            if day is None:
+                cls._days.clear()
+            else:
+                cls._days.pop(day, None)
+
+    @classmethod
+    def get_app(cls, event: LogEvent) -> str:
+        """Normalized application of a window event: recorded app if any, else the title's suffix."""
+        app = event.data.get("app")
+        if not app:
+            app = cls.split_app_suffix(event.window_title)[1] or event.window_title.strip()
+        return cls.normalize_app(app)
+
+    @classmethod
+    def normalize_app(cls, name: str) -> str:
+        """
+        Canonical display name of an application: an alias for well-known apps, else the
+        name with separators as spaces and words capitalized ("gnome-calculator" -> "Gnome Calculator").
+        """
+        app = cls._app_names.get(name)
+        if app is None:
+            key = cls.APP_SEPARATORS.sub(" ", name).strip().lower()
+            app = cls._app_names[name] = cls.APP_ALIASES.get(key) or string.capwords(key)
+        return app
+
+    @classmethod
+    def split_app_suffix(cls, title: str) -> tuple:
+        """Split "Title - App" into ("Title", "App"); the app is None without a suffix."""
+        match = cls.APP_SUFFIX.match(title)
+        return match.groups() if match else (title, None)
+
+    @classmethod
+    def _iter_new_events(cls, day_sessions: DaySessions, path: str):
+        for event, position in LogReader.iter_file_positions(path, day_sessions.positions.get(path, 0)):
+            day_sessions.positions[path] = position
+            yield event
+
+    @classmethod
+    def _feed(cls, day_sessions: DaySessions, event: LogEvent) -> None:
+        """Apply one event: it closes the open interval and, for window events, opens the next."""
+        title = event.window_title
+        if title is None and event.marker is None:
+            return
+
+        epoch = event.timestamp.timestamp()
+        if event.marker is not None:
+            day_sessions.has_markers = True
+        if day_sessions.open is not None:
+            cls._close(day_sessions, epoch)
+        if title is not None:
+            app = event.data.get("app")
+            if app:
+                app = cls.normalize_app(app)
+            else:
+                app = day_sessions.title_apps.get(title)
+                if app is None:
+                    app = day_sessions.title_apps[title] = cls.get_app(event)
+            cls._open(day_sessions, epoch, title, app)
+
+    @classmethod
+    def _close(cls, day_sessions: DaySessions, epoch: float) -> None:
+        start, title_id, app_id = day_sessions.open
+        day_sessions.open = None
+        # A backdated "idle" marker can land at or before the start of the open interval.
+        if epoch > start:
+            day_sessions.table.append(start, min(epoch, cls._max_end(day_sessions, start)), title_id, app_id)
+
+    @classmethod
+    def _open(cls, day_sessions: DaySessions, epoch: float, title: str, app: str) -> None:
+        """Open an interval, folding A→B→A flapping and same-title repeats into the previous one."""
+        table = day_sessions.table
+        title_id, app_id = table.intern_title(title), table.intern_app(app)
+        start = epoch
+        count = len(table)
+
+        if count and table.title_ids[-1] == title_id and table.ends[-1] == epoch:
+            start = table.pop()[0]
+        elif (
+            count >= 2
+            and table.title_ids[-2] == title_id
+            and table.ends[-1] == epoch
+            and table.ends[-2] == table.starts[-1]
+            and table.ends[-1] - table.starts[-1] < cls.FLAP_THRESHOLD
+        ):
+            table.pop()
+            start = table.pop()[0]
+
+        day_sessions.open = (start, title_id, app_id)
+
+    @classmethod
+    def _max_end(cls, day_sessions: DaySessions, start: float) -> float:
+        """Latest end of an interval opened at `start`: MAX_INTERVAL later only for days without markers."""
+        return math.inf if day_sessions.has_markers else start + cls.MAX_INTERVAL
+
+    @classmethod
+    def _open_interval(cls, day_sessions: DaySessions) -> list:
+        """The still-open interval, ending now (today) or at the day's end."""
+        if day_sessions.open is None:
+            return []
+        start, title_id, app_id = day_sessions.open
+        end = min(time.time(), day_sessions.day_end, cls._max_end(day_sessions, start))
+        if end <= start:
+            return []
+        table = day_sessions.table
+        return [ActivityInterval(
+            datetime.fromtimestamp(start), datetime.fromtimestamp(end),
+            table.titles[title_id], table.apps[app_id]
+        )]
@@ -5,5 +5,11 @@ class ShutdownHandler:
 
     @staticmethod
     def handle_shutdown(signum, frame) -> None:
-        """Perform necessary cleanup actions before shutting down."""
+        """
+        Shut down by raising SystemExit in the main thread.
+        No I/O happens here: the handler can interrupt the main thread while it holds
+        LogWriter's or ConfigManager's lock, so cleanup is left to the atexit handlers
+        (Collector.stop, LogWriter.close, ConfigManager.flush), which run once the
+        main thread has unwound and released them.
+        """
         sys.exit(0)
\ No newline at end of file
@@ -0,0 +1,101 @@
+import re
+from services.sessionizer.sessionizer import ActivityInterval, Sessionizer
+
+
+class PromptCompactor:
+    """
+    Shrinks activity intervals into a token-efficient prompt block.
+
+    Titles are stripped of their application suffix and grouped under the app name
+    normalized by the Sessionizer, repeats of a title collapse into one line with the total time and count,
+    blips shorter than MIN_SECONDS are dropped, and times are written as HH:MM.
+    When the block would exceed the token budget, the shortest activities are
+    folded into a single "other" line.
+    """
+
+    MIN_SECONDS = 1.0
+    TITLE_NOISE = re.compile(r"^(?:\(\d+\)\s*|[●•*]\s*)+")
+    TOKEN_PATTERN = re.compile(r"\w+|[^\w\s]")
+
+    @classmethod
+    def compact(cls, intervals: list, token_budget: int = None) -> str:
+        """
+        Render intervals as compact text, e.g. "@Chrome: ChatGPT 09:05 25m×3; Jira 09:40 4m".
+
+        :param intervals: ActivityInterval list, oldest first.
+        :param token_budget: Hard cap on the estimated tokens of the result.
+        """
+        totals = {}
+        for interval in intervals:
+            if interval.duration < cls.MIN_SECONDS:
+                continue
+            app, title = cls.split_title(interval)
+            entry = totals.get((app, title))
+            if entry is None:
+                totals[(app, title)] = [interval.start, interval.duration, 1]
+            else:
+                entry[1] += interval.duration
+                entry[2] += 1
+
+        entries = sorted(totals.items(), key=lambda item: item[1][0])
+        text = cls._render(entries, 0, 0)
+        if token_budget is None or cls.estimate_tokens(text) <= token_budget:
+            return text
+
+        # Keep the longest activities that fit; everything else becomes one summary line.
+        by_duration = sorted(entries, key=lambda item: -item[1][1])
+        low, high = 0, len(by_duration)
+        while low < high:
+            middle = (low + high + 1) // 2
+            kept = sorted(by_duration[:middle], key=lambda item: item[1][0])
+            dropped = by_duration[middle:]
+            candidate = cls._render(kept, len(dropped), sum(entry[1] for _, entry in dropped))
+            if cls.estimate_tokens(candidate) <= token_budget:
+                low = middle
+            else:
+                high = middle - 1
+        kept = sorted(by_duration[:low], key=lambda item: item[1][0])
+        dropped = by_duration[low:]
+        return cls._render(kept, len(dropped), sum(entry[1] for _, entry in dropped))
+
+    @classmethod
+    def split_title(cls, interval: ActivityInterval) -> tuple:
+        """
+        Return (short app name, title without the app suffix or noise).
+        The suffix is taken from the title itself and dropped when it names the same app,
+        e.g. " - Google Chrome" for the WM_CLASS "Google-chrome".
+        """
+        title = interval.title
+        app = Sessionizer.normalize_app(interval.app) if interval.app else ""
+        head, suffix = Sessionizer.split_app_suffix(title)
+        if suffix and Sessionizer.normalize_app(suffix) == app:
+            title = head
+        title = cls.TITLE_NOISE.sub("", title).strip() or title
+        return app, title
+
+    @classmethod
+    def estimate_tokens(cls, text: str) -> int:
+        """
+        Estimate BPE tokens: one per word or punctuation mark, plus one per
+        extra four characters of long words.
+        """
+        return sum(1 + max(0, len(token) - 4) // 4 for token in cls.TOKEN_PATTERN.findall(text))
+
+    @staticmethod
+    def format_duration(seconds: float) -> str:
+        if seconds < 60:
+            return f"{int(seconds)}s"
+        minutes = round(seconds / 60)
+        return f"{minutes // 60}h{minutes % 60:02d}" if minutes >= 60 else f"{minutes}m"
+
+    @classmethod
+    def _render(cls, entries: list, dropped: int, dropped_seconds: float) -> str:
+        apps = {}
+        for (app, title), (start, seconds, count) in entries:
+            repeat = f"×{count}" if count > 1 else ""
+            apps.setdefault(app, []).append(f"{title} {start:%H:%M} {cls.format_duration(seconds)}{repeat}")
+
+        lines = [f"@{app}: " + "; ".join(items) for app, items in apps.items()]
+        if dropped:
+            lines.append(f"+{dropped} other {cls.format_duration(dropped_seconds)}")
+        return "\n".join(lines)
@@ -1 +1,170 @@
-#summarizer
\ No newline at end of file
+from datetime import date, datetime, timedelta
+from enum import Enum
+from services.ai.ai_manager import AIManager
+from services.config.config_manager import ConfigManager
+from services.sessionizer.sessionizer import Sessionizer
+from services.summarizer.prompt_compactor import PromptCompactor
+
+
+class SummarizerConfig(Enum):
+    CHUNK_MINUTES = "summary_chunk_minutes"
+    TOKEN_BUDGET = "summary_token_budget"
+
+
+class Summarizer:
+    """
+    Summarizes activity history map-reduce style: intervals are split into clock-aligned
+    chunks, each chunk is summarized in parallel, and the chunk summaries are reduced.
+
+    Chunk prompts of finished time windows never change, so re-running a summary only
+    sends the chunks that gained events; the rest are answered by AIManager's response
+    cache. That reuse depends on the cache, which the `ai_response_cache` setting can disable.
+
+    Prompts the provider answers with an error are retried once; if they fail again, the
+    summary fails rather than summarizing error messages.
+    """
+
+    RETRIES = 1
+
+    DEFAULT_CHUNK_MINUTES = 60
+    DEFAULT_TOKEN_BUDGET = 2000
+
+    CHUNK_PROMPT = (
+        "Below is the time I spent in each window between {start} and {end}, grouped by "
+        "application (@app), as: title first-seen-time total-time [×times revisited].\n"
+        "Summarize what I worked on in 2-4 short bullet points. Mention ticket keys if present.\n\n"
+        "{activity}"
+    )
+    REDUCE_PROMPT = (
+        "Below are summaries of consecutive parts of my {period}.\n"
+        "Merge them into one concise summary of what I worked on, grouped by task, "
+        "with rough time spent per task.\n\n"
+        "{summaries}"
+    )
+
+    @classmethod
+    def summarize_day(cls, day: date = None) -> str:
+        """Summarize one day of activity (today by default)."""
+        day = day or date.today()
+        start = datetime.combine(day, datetime.min.time())
+        return cls.summarize_range(start, start + timedelta(days=1), period="day")
+
+    @classmethod
+    def summarize_week(cls, week_start: date = None) -> str:
+        """Summarize seven days starting at `week_start` (the current week's Monday by default)."""
+        week_start = week_start or date.today() - timedelta(days=date.today().weekday())
+        summaries = [
+            f"{day:%A %Y-%m-%d}:\n{summary}"
+            for day in (week_start + timedelta(days=i) for i in range(7))
+            if (summary := cls.summarize_day(day))
+        ]
+        return cls.reduce(summaries, period="week")
+
+    @classmethod
+    def summarize_range(cls, start: datetime, end: datetime, period: str = "day") -> str:
+        """
+        Summarize the activity in [start, end).
+        :return: The summary, or an empty string if there was no activity.
+        """
+        chunks = cls.build_chunks(Sessionizer.get_intervals(start, end))
+        if not chunks:
+            return ""
+
+        prompts = [
+            cls.CHUNK_PROMPT.format(
+                start=f"{chunk[0].start:%Y-%m-%d %H:%M}",
+                end=f"{chunk[-1].end:%H:%M}",
+                activity=PromptCompactor.compact(chunk, cls.get_token_budget()),
+            )
+            for chunk in chunks
+        ]
+        return cls.reduce(cls._send(prompts), period=period)
+
+    @classmethod
+    def reduce(cls, summaries: list, period: str = "day") -> str:
+        """
+        Merge summaries into one. Groups that would exceed the token budget are
+        reduced separately first, so any number of summaries fits the context.
+        """
+        summaries = [summary for summary in summaries if summary]
+        budget = cls.get_token_budget()
+        while len(summaries) > 1:
+            groups, group, tokens = [], [], 0
+            for summary in summaries:
+                summary_tokens = cls.estimate_tokens(summary)
+                if group and tokens + summary_tokens > budget:
+                    groups.append(group)
+                    group, tokens = [], 0
+                group.append(summary)
+                tokens += summary_tokens
+            groups.append(group)
+
+            if len(groups) == len(summaries):
+                # Every summary is over budget on its own; reduce them pairwise.
+                groups = [summaries[i:i + 2] for i in range(0, len(summaries), 2)]
+            summaries = cls._send([
+                cls.REDUCE_PROMPT.format(period=period, summaries="\n\n".join(group))
+                for group in groups
+            ])
+        return summaries[0] if summaries else ""
+
+    @classmethod
+    def build_chunks(cls, intervals: list) -> list:
+        """
+        Split intervals into chunks aligned to CHUNK_MINUTES windows of the clock,
+        further split when a window's text would exceed the token budget.
+        """
+        chunk_seconds = (ConfigManager.get(SummarizerConfig.CHUNK_MINUTES.value) or cls.DEFAULT_CHUNK_MINUTES) * 60
+        budget = cls.get_token_budget()
+
+        chunks, chunk, window, tokens = [], [], None, 0
+        for interval in cls._split_at_windows(intervals, chunk_seconds):
+            interval_window = int(interval.start.timestamp() // chunk_seconds)
+            interval_tokens = cls.estimate_tokens(interval.title) + 4
+            if chunk and (interval_window != window or tokens + interval_tokens > budget):
+                chunks.append(chunk)
+                chunk, tokens = [], 0
+            chunk.append(interval)
+            window = interval_window
+            tokens += interval_tokens
+        if chunk:
+            chunks.append(chunk)
+        return chunks
+
+    @staticmethod
+    def estimate_tokens(text: str) -> int:
+        return PromptCompactor.estimate_tokens(text)
+
+    @classmethod
+    def get_token_budget(cls) -> int:
+        return ConfigManager.get(SummarizerConfig.TOKEN_BUDGET.value) or cls.DEFAULT_TOKEN_BUDGET
+
+    @classmethod
+    def _send(cls, prompts: list) -> list:
+        """
+        Send prompts as a batch, retrying the ones answered with an error.
+        :raises RuntimeError: If a prompt still fails after RETRIES retries.
+        """
+        responses = AIManager.send_batch(prompts)
+        for _ in range(cls.RETRIES):
+            failed = [i for i, response in enumerate(responses) if AIManager.is_error_response(response)]
+            if not failed:
+                break
+            for i, response in zip(failed, AIManager.send_batch([prompts[i] for i in failed])):
+                responses[i] = response
+
+        errors = [response for response in responses if AIManager.is_error_response(response)]
+        if errors:
+            raise RuntimeError(f"Summarizing failed for {len(errors)} of {len(prompts)} prompts: {errors[0]}")
+        return responses
+
+    @staticmethod
+    def _split_at_windows(intervals: list, chunk_seconds: int):
+        """Cut intervals that cross a window boundary so every chunk is self-contained."""
+        for interval in intervals:
+            start, end = interval.start.timestamp(), interval.end.timestamp()
+            boundary = (start // chunk_seconds + 1) * chunk_seconds
+            while end > boundary:
+                yield interval._replace(start=datetime.fromtimestamp(start), end=datetime.fromtimestamp(boundary))
+                start, boundary = boundary, boundary + chunk_seconds
+            yield interval._replace(start=datetime.fromtimestamp(start))
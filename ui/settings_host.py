@@ -0,0 +1,86 @@
+import os
+import socket
+import subprocess
+import sys
+import threading
+from multiprocessing.connection import Connection
+from services.ai.ai_manager import AIManager
+from services.secret.secret_manager import SecretManager
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+class SettingsHost:
+    """
+    Keeps the Qt settings UI in one long-lived process that the tray talks to.
+    pystray owns the main thread, and Qt must own the main thread of its process,
+    so the UI runs in a child process; the first "Settings" click starts it and
+    later clicks only ask it to show the existing window. The child runs this
+    module (`python -m ui.settings_host`), so it loads only the settings UI and
+    not the tray, the loggers or main.py.
+    """
+
+    _process = None
+    _connection = None
+    _listener = None
+    _lock = threading.Lock()
+
+    @classmethod
+    def show(cls) -> None:
+        """Show the settings window, starting the settings process if needed."""
+        with cls._lock:
+            if cls._process is None or cls._process.poll() is not None:
+                cls._start()
+            cls._connection.send("show")
+
+    @classmethod
+    def stop(cls) -> None:
+        """Close the settings process."""
+        with cls._lock:
+            if cls._process is None:
+                return
+            try:
+                cls._connection.send("quit")
+            except OSError:
+                pass
+            try:
+                cls._process.wait(timeout=2)
+            except subprocess.TimeoutExpired:
+                cls._process.terminate()
+                cls._process.wait()
+            cls._connection.close()
+            cls._process = cls._connection = cls._listener = None
+
+    @classmethod
+    def _start(cls) -> None:
+        parent_socket, child_socket = socket.socketpair()
+        cls._connection = Connection(parent_socket.detach())
+        with child_socket:
+            cls._process = subprocess.Popen(
+                [sys.executable, "-m", "ui.settings_host", str(child_socket.fileno())],
+                pass_fds=(child_socket.fileno(),), cwd=ROOT_DIR,
+            )
+
+        cls._listener = threading.Thread(target=cls._listen, args=(cls._connection,), daemon=True)
+        cls._listener.start()
+
+    @classmethod
+    def _listen(cls, connection) -> None:
+        """Apply changes reported by the settings process to this process's caches."""
+        while True:
+            try:
+                message = connection.recv()
+            except (EOFError, OSError):
+                return
+            if message == "secrets_changed":
+                SecretManager.invalidate()
+                AIManager.reload_configuration()
+
+
+def run(fd: int) -> None:
+    """Settings process entry point: serve the UI over the connection inherited as `fd`."""
+    from ui.views.settings import run_settings_host
+    run_settings_host(Connection(fd))
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]))
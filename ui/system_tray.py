@@ -2,7 +2,8 @@ import os
 from pystray import Icon, Menu, MenuItem
 from PIL import Image
 from services.logger.log_manager import LogManager
-from ui.views.settings import open_settings_window
+from services.metrics.metrics import Metrics
+from ui.settings_host import SettingsHost
 
 class SystemTray:
     """System tray icon for WAID service with minimal options."""
@@ -28,13 +29,20 @@ class SystemTray:
     @classmethod
     def open_settings(cls, icon, item) -> None:
         """Open the settings window."""
-        open_settings_window()
+        SettingsHost.show()
+
+    @classmethod
+    def build_metrics_menu(cls):
+        """Read-only lines summarizing the busiest instrumented paths, rebuilt on each open."""
+        lines = Metrics.get_summary() or ["No samples yet"]
+        return (MenuItem(line, None, enabled=False) for line in lines)
 
     @classmethod
     def build_menu(cls) -> Menu:
         """Construct the system tray menu."""
         return Menu(
             MenuItem("Service Active", cls.toggle_service, checked=lambda item: cls.service_active),
+            MenuItem("Metrics", Menu(cls.build_metrics_menu), visible=lambda item: Metrics.enabled),
             Menu.SEPARATOR,
             MenuItem("Settings", cls.open_settings)
         )
@@ -10,6 +10,7 @@ from PyQt6.QtWidgets import (
     QMessageBox,
 )
 from services.ai.ai_manager import AIManager
+from ui.views.settings import notify_host
 
 
 class AIPage(QWidget):
@@ -54,12 +55,12 @@ class AIPage(QWidget):
         if not selected_button:
             return
 
+        # Only saving selects the provider; browsing the page must not write the config.
         provider = selected_button.text()
-        AIManager.set_provider(provider)
 
         try:
-            config_keys = AIManager.get_required_configuration()
-            config_values = AIManager.get_configuration()
+            config_keys = AIManager.get_required_configuration(provider)
+            config_values = AIManager.get_configuration(provider)
         except ValueError as e:
             QMessageBox.critical(self, "Error", str(e))
             return
@@ -71,7 +72,7 @@ class AIPage(QWidget):
         for key in config_keys:
             label = QLabel(key)
             input_field = QLineEdit()
-            input_field.setText(config_values.get(key, ""))
+            input_field.setText(config_values.get(key) or "")
             self.config_inputs[key] = input_field
             self.config_layout.addRow(label, input_field)
 
@@ -88,9 +89,11 @@ class AIPage(QWidget):
         }
 
         try:
-            AIManager.set_configuration(config_data)
+            AIManager.set_configuration(config_data, provider)
+            AIManager.set_provider(provider)
+            notify_host("secrets_changed")
             QMessageBox.information(
                 self, "Success", "Configuration saved successfully!"
             )
-        except ValueError as e:
+        except (ValueError, OSError) as e:
             QMessageBox.critical(self, "Error", str(e))
@@ -7,11 +7,16 @@ from PyQt6.QtWidgets import (
     QHBoxLayout,
     QFrame,
 )
+from PyQt6.QtCore import QSocketNotifier
+import importlib
 import sys
-from ui.views.pages.ai import AIPage
-from ui.views.pages.jira import JiraPage
-from ui.views.pages.tickets import TicketsPage
-from ui.views.pages.others import OthersPage
+
+_host_connection = None
+
+
+def lazy_page(module: str, class_name: str):
+    """Factory that imports a page's module only when the page is first shown."""
+    return lambda: getattr(importlib.import_module(module), class_name)()
 
 
 class SettingsWindow(QWidget):
@@ -37,11 +42,13 @@ class SettingsWindow(QWidget):
         sidebar_layout.setContentsMargins(0, 0, 0, 0)
 
         self.pages = QStackedWidget()
+        self.page_factories = {}
+        self.page_widgets = {}
 
-        self.add_sidebar_button("AI", AIPage, sidebar_layout)
-        self.add_sidebar_button("Jira", JiraPage, sidebar_layout)
-        self.add_sidebar_button("Tickets", TicketsPage, sidebar_layout)
-        self.add_sidebar_button("Others", OthersPage, sidebar_layout)
+        self.add_sidebar_button("AI", lazy_page("ui.views.pages.ai", "AIPage"), sidebar_layout)
+        self.add_sidebar_button("Jira", lazy_page("ui.views.pages.jira", "JiraPage"), sidebar_layout)
+        self.add_sidebar_button("Tickets", lazy_page("ui.views.pages.tickets", "TicketsPage"), sidebar_layout)
+        self.add_sidebar_button("Others", lazy_page("ui.views.pages.others", "OthersPage"), sidebar_layout)
 
         sidebar_layout.addStretch()
 
@@ -61,25 +68,63 @@ class SettingsWindow(QWidget):
         main_layout.addWidget(top_separator)
         main_layout.addLayout(content_layout)
 
-        self.pages.setCurrentIndex(0)
+        self.show_page("AI")
 
-    def add_sidebar_button(self, name, page_class, layout):
-        """Creates a button for the sidebar and links it to a page."""
+    def add_sidebar_button(self, name, page_factory, layout):
+        """Creates a button for the sidebar and links it to a page, which is built on first click."""
         button = QPushButton(name)
         button.setFixedHeight(50)
         button.setStyleSheet("text-align: center; padding-left: 10px; font-size: 14px;")
-        button.clicked.connect(
-            lambda: self.pages.setCurrentWidget(self.pages.findChild(page_class))
-        )
+        button.clicked.connect(lambda: self.show_page(name))
         layout.addWidget(button)
 
-        page = page_class()
-        self.pages.addWidget(page)
+        self.page_factories[name] = page_factory
+
+    def show_page(self, name):
+        """Switch to a page, creating it the first time it is shown."""
+        page = self.page_widgets.get(name)
+        if page is None:
+            page = self.page_widgets[name] = self.page_factories[name]()
+            self.pages.addWidget(page)
+        self.pages.setCurrentWidget(page)
+
+
+def notify_host(message: str) -> None:
+    """Tell the main WAID process about a change made in settings (no-op outside the settings host)."""
+    if _host_connection is not None:
+        _host_connection.send(message)
+
 
+def run_settings_host(connection) -> None:
+    """
+    Run the settings UI for the lifetime of WAID.
+    One QApplication is kept alive and the window is created on the first "show"
+    and reused afterwards; closing it only hides it.
+    """
+    global _host_connection
+    _host_connection = connection
 
-def open_settings_window():
-    """Open the settings window."""
     app = QApplication(sys.argv)
-    window = SettingsWindow()
-    window.show()
+    app.setQuitOnLastWindowClosed(False)
+    window = None
+
+    def on_message():
+        nonlocal window
+        try:
+            while connection.poll():
+                message = connection.recv()
+                if message == "show":
+                    if window is None:
+                        window = SettingsWindow()
+                    window.show()
+                    window.raise_()
+                    window.activateWindow()
+                elif message == "quit":
+                    app.quit()
+        except (EOFError, OSError):
+            # The main process is gone.
+            app.quit()
+
+    notifier = QSocketNotifier(connection.fileno(), QSocketNotifier.Type.Read)
+    notifier.activated.connect(on_message)
     app.exec()